@@ -5,17 +5,19 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import timedelta
+from functools import lru_cache
 
+import aiohttp
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_ENTITY_ID, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import ATTR_ENTITY_ID, EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant, ServiceCall
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.util.ssl import client_context
 
 from .api import HovalApiError, HovalConnectApi
 from .const import (
@@ -40,6 +42,12 @@ PLATFORMS = [
 
 SERVICE_RESET_TEMPORARY_CHANGE = "reset_temporary_change"
 
+# How long an idle connection to the cloud stays pooled (seconds). The shared
+# Home Assistant session keeps aiohttp's 15 s default, shorter than any scan
+# interval, so every poll used to open a fresh TCP + TLS connection. 75 s
+# spans the default 60 s interval; longer intervals simply reconnect.
+_KEEPALIVE_TIMEOUT_S = 75
+
 _RESET_TEMPORARY_CHANGE_SCHEMA = vol.Schema(
     {vol.Required(ATTR_ENTITY_ID): cv.entity_ids},
 )
@@ -57,12 +65,7 @@ class HovalRuntimeData:
 
 def plant_device_info(plant_data: HovalPlantData) -> DeviceInfo:
     """Build DeviceInfo for a plant device."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, plant_data.plant_id)},
-        name=f"Hoval {plant_data.name}",
-        manufacturer="Hoval",
-        model="Plant",
-    )
+    return _plant_device_info(plant_data.plant_id, plant_data.name)
 
 
 def circuit_device_info(
@@ -70,16 +73,46 @@ def circuit_device_info(
     circuit_data: HovalCircuitData,
 ) -> DeviceInfo:
     """Build DeviceInfo for a circuit device."""
-    model = CIRCUIT_TYPE_NAMES.get(circuit_data.circuit_type, circuit_data.circuit_type)
+    return _circuit_device_info(
+        plant_id, circuit_data.path, circuit_data.name, circuit_data.circuit_type
+    )
+
+
+# Every entity of a device asks for the same DeviceInfo (a circuit carries up
+# to ~20 sensors), and _add_new() runs again on each SIGNAL_NEW_CIRCUITS.
+# Memoize on the primitive fields so one dict is shared per device. Callers
+# must treat the result as read-only.
+@lru_cache(maxsize=256)
+def _plant_device_info(plant_id: str, name: str) -> DeviceInfo:
+    return DeviceInfo(
+        identifiers={(DOMAIN, plant_id)},
+        name=f"Hoval {name}",
+        manufacturer="Hoval",
+        model="Plant",
+    )
+
+
+@lru_cache(maxsize=256)
+def _circuit_device_info(plant_id: str, path: str, name: str, circuit_type: str) -> DeviceInfo:
     return DeviceInfo(
-        identifiers={(DOMAIN, f"{plant_id}_{circuit_data.path}")},
-        name=f"Hoval {circuit_data.name}",
+        identifiers={(DOMAIN, f"{plant_id}_{path}")},
+        name=f"Hoval {name}",
         manufacturer="Hoval",
-        model=model,
+        model=CIRCUIT_TYPE_NAMES.get(circuit_type, circuit_type),
         via_device=(DOMAIN, plant_id),
     )
 
 
+def _create_session() -> aiohttp.ClientSession:
+    """Create the entry's own client session, keeping connections alive across polls."""
+    connector = aiohttp.TCPConnector(
+        ssl=client_context(),
+        keepalive_timeout=_KEEPALIVE_TIMEOUT_S,
+        ttl_dns_cache=300,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
 def _get_scan_interval(entry: HovalConnectConfigEntry) -> timedelta:
     """Get the scan interval from options or use default."""
     seconds = entry.options.get(CONF_SCAN_INTERVAL, int(DEFAULT_SCAN_INTERVAL.total_seconds()))
@@ -170,25 +203,35 @@ def _async_register_services(hass: HomeAssistant) -> None:
 
 async def async_setup_entry(hass: HomeAssistant, entry: HovalConnectConfigEntry) -> bool:
     """Set up Hoval Connect from a config entry."""
-    session = async_get_clientsession(hass)
+    session = _create_session()
+    # Runs on unload and after a failed setup alike. Config entries are not
+    # unloaded at shutdown, so also close the session when Home Assistant does.
+    entry.async_on_unload(session.close)
+
+    async def _async_close_session(_event: Event) -> None:
+        await session.close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
+
     api = HovalConnectApi(session, entry.data["email"], entry.data["password"])
 
-    coordinator = HovalDataCoordinator(hass, api)
-    coordinator.update_interval = _get_scan_interval(entry)
+    coordinator = HovalDataCoordinator(hass, api, _get_scan_interval(entry))
 
+    # Deliberately the raising first refresh, not async_refresh(): there is no
+    # prior data to fall back on, the platforms below need coordinator.data,
+    # and a rejected login must surface as ConfigEntryAuthFailed to start
+    # reauth. Transient 401s are already absorbed by the API's token refresh.
     await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = HovalRuntimeData(coordinator=coordinator, api=api)
 
     # Register a parent device for each plant so circuit devices can use via_device
     device_reg = dr.async_get(hass)
-    for plant_id, plant_data in coordinator.data.plants.items():
+    for plant_data in coordinator.data.plants.values():
         device_reg.async_get_or_create(
-            config_entry_id=entry.entry_id,
-            identifiers={(DOMAIN, plant_id)},
-            name=f"Hoval {plant_data.name}",
-            manufacturer="Hoval",
-            model="Plant",
+            config_entry_id=entry.entry_id, **plant_device_info(plant_data)
         )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -207,13 +250,15 @@ async def _async_options_updated(
 ) -> None:
     """Handle options update — adjust polling interval without reload."""
     coordinator = entry.runtime_data.coordinator
-    coordinator.update_interval = _get_scan_interval(entry)
+    coordinator.set_base_interval(_get_scan_interval(entry))
     _LOGGER.debug("Polling interval updated to %s", coordinator.update_interval)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: HovalConnectConfigEntry) -> bool:
     """Unload a config entry."""
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unloaded:
+        await entry.runtime_data.coordinator.async_shutdown()
     # Remove the integration-level service once the last config entry goes away
     remaining = [
         e for e in hass.config_entries.async_entries(DOMAIN) if e.entry_id != entry.entry_id
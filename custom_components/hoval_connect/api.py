@@ -4,11 +4,22 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 import aiohttp
+from yarl import URL
+
+try:
+    # orjson ships with Home Assistant core; the stdlib fallback keeps the
+    # client importable outside HA (tests, examples).
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on the environment
+    from json import loads as _json_loads
 
 from .const import (
     BASE_URL,
@@ -27,7 +38,19 @@ _LOGGER = logging.getLogger(__name__)
 # Retry configuration for transient errors
 _MAX_RETRIES = 3
 _RETRY_BASE_DELAY = 1.0  # seconds, doubled on each retry
-_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Ceiling for a single back-off sleep, including a server-sent Retry-After:
+# the whole poll must still fit comfortably inside one scan interval.
+_RETRY_MAX_DELAY = 8.0
+# Random spread on computed back-offs, as a fraction of the delay, so the
+# per-circuit tasks of one poll — and many installs reconnecting after an
+# outage — do not retry in lockstep against a recovering server.
+_RETRY_JITTER = 0.5
+
+# Cap on requests in flight per client. The coordinator fans out one task per
+# circuit (live values + programs each) plus plant-level fetches; on larger
+# accounts an uncapped burst trips the cloud's rate limiter (HTTP 429).
+_MAX_CONCURRENT_REQUESTS = 8
 
 # Hard upper bound on my-plants pagination. 50 pages x 12 plants/page = 600
 # plants — far beyond any real account. Without a cap, a server that keeps
@@ -36,6 +59,58 @@ _RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 # belongs in the client.
 _MAX_PLANT_PAGES = 50
 
+# Headers shared by every authenticated request. An explicit Accept spares
+# the cloud a content negotiation; Accept-Encoding is left to aiohttp, which
+# already advertises the codecs it can decode.
+_BASE_HEADERS: dict[str, str] = {"Accept": "application/json"}
+
+# Upper bound on how long a validator-cached response is reused, counted from
+# the 200 that stored it; a 304 does not extend it. Past it the next GET is
+# sent unconditionally so a server that mishandles ETags cannot pin stale data.
+_ETAG_MAX_AGE_S = 30 * 60
+
+
+def _backoff_delay(attempt: int, retry_after: str | None = None) -> float:
+    """Return the sleep before retry number `attempt` + 1.
+
+    A Retry-After given in seconds wins (clamped to _RETRY_MAX_DELAY); the
+    HTTP-date form and garbage fall back to jittered exponential back-off.
+    """
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), _RETRY_MAX_DELAY)
+        except ValueError:
+            pass
+    delay = _RETRY_BASE_DELAY * (2**attempt) * (1.0 + random.random() * _RETRY_JITTER)
+    return min(delay, _RETRY_MAX_DELAY)
+
+
+@lru_cache(maxsize=256)
+def _api_url(path: str) -> URL:
+    """Return the parsed absolute URL for an API path.
+
+    aiohttp parses every str URL into a yarl.URL; the paths a poll requests
+    repeat every cycle, so the parse is done once per path instead.
+    """
+    return URL(f"{BASE_URL}{path}")
+
+
+@dataclass(slots=True)
+class _PlantToken:
+    """Cached plant access token with its monotonic expiry deadline."""
+
+    token: str
+    expires_at: float
+
+
+@dataclass(slots=True)
+class _ConditionalEntry:
+    """Last validated response body for a conditional GET."""
+
+    etag: str
+    data: Any
+    stored_at: float
+
 
 class HovalAuthError(Exception):
     """Authentication error."""
@@ -101,19 +176,35 @@ class HovalConnectApi:
         email: str,
         password: str,
     ) -> None:
-        """Initialize the API client."""
+        """Initialize the API client.
+
+        `session` is the config entry's own client session, whose connector
+        keeps connections alive long enough for successive polls to reuse the
+        TLS connection instead of re-handshaking.
+        """
         self._session = session
         self._email = email
         self._password = password
         self._id_token: str | None = None
+        # Token expiries are time.monotonic() deadlines: a wall-clock jump
+        # (NTP step, manual clock change) must neither keep a dead token
+        # alive nor force a needless re-login.
         self._id_token_exp: float = 0
-        self._pat_cache: dict[str, tuple[str, float]] = {}
+        self._pat_cache: dict[str, _PlantToken] = {}
+        # ETag-validated bodies of slow-changing GETs, keyed by request path.
+        self._etag_cache: dict[str, _ConditionalEntry] = {}
+        # Assembled auth headers per plant (None = account-level), stored with
+        # the token pair they were built from.
+        self._headers_cache: dict[str | None, tuple[dict[str, str], str, str | None]] = {}
         # Single-flight locks: the coordinator fans out one task per circuit,
         # so a burst of concurrent 401s must trigger at most ONE token refresh
         # instead of a thundering herd against the rate-limited IDP. Separate
-        # locks because _get_plant_access_token() calls _get_id_token().
+        # locks because _get_plant_access_token() calls _get_id_token(). PAT
+        # locks are per plant: a slow settings fetch for one plant must not
+        # stall the token refresh of every other plant on the account.
         self._id_token_lock = asyncio.Lock()
-        self._pat_lock = asyncio.Lock()
+        self._pat_locks: dict[str, asyncio.Lock] = {}
+        self._request_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
 
     async def _get_id_token(self) -> str:
         """Get or refresh the ID token via OAuth2 password grant.
@@ -121,11 +212,11 @@ class HovalConnectApi:
         Double-checked locking: the fast path returns the cached token without
         the lock; only a refresh serialises through _id_token_lock.
         """
-        if self._id_token and time.time() < self._id_token_exp:
+        if self._id_token and time.monotonic() < self._id_token_exp:
             return self._id_token
 
         async with self._id_token_lock:
-            if self._id_token and time.time() < self._id_token_exp:
+            if self._id_token and time.monotonic() < self._id_token_exp:
                 return self._id_token
 
             try:
@@ -155,24 +246,31 @@ class HovalConnectApi:
                 raise HovalApiError("IDP response missing id_token")
 
             self._id_token = data["id_token"]
-            self._id_token_exp = time.time() + ID_TOKEN_TTL.total_seconds()
+            self._id_token_exp = time.monotonic() + ID_TOKEN_TTL.total_seconds()
             return self._id_token
 
     async def _get_plant_access_token(self, plant_id: str) -> str:
         """Get or refresh the plant access token.
 
         Double-checked locking mirrors _get_id_token: the cached fast path
-        stays lock-free; only a refresh serialises through _pat_lock, with the
-        cache re-checked inside the lock.
+        stays lock-free; only a refresh serialises through the plant's entry
+        in _pat_locks, with the cache re-checked inside the lock.
         """
         cached = self._pat_cache.get(plant_id)
-        if cached and time.time() < cached[1]:
-            return cached[0]
+        if cached is not None and time.monotonic() < cached.expires_at:
+            return cached.token
 
-        async with self._pat_lock:
+        async with self._pat_locks.setdefault(plant_id, asyncio.Lock()):
+            now = time.monotonic()
             cached = self._pat_cache.get(plant_id)
-            if cached and time.time() < cached[1]:
-                return cached[0]
+            if cached is not None:
+                if now < cached.expires_at:
+                    return cached.token
+                del self._pat_cache[plant_id]
+            # Lazy sweep: tokens of plants that are no longer polled (revoked,
+            # removed from the account) would otherwise stay cached forever.
+            for stale in [pid for pid, pat in self._pat_cache.items() if now >= pat.expires_at]:
+                del self._pat_cache[stale]
 
             id_token = await self._get_id_token()
             try:
@@ -191,16 +289,29 @@ class HovalConnectApi:
                 raise HovalApiError(f"Connection error fetching plant token: {err}") from err
 
             token = data["token"]
-            self._pat_cache[plant_id] = (token, time.time() + PLANT_TOKEN_TTL.total_seconds())
+            self._pat_cache[plant_id] = _PlantToken(
+                token, time.monotonic() + PLANT_TOKEN_TTL.total_seconds()
+            )
             return token
 
     async def _headers(self, plant_id: str | None = None) -> dict[str, str]:
-        """Build request headers with auth tokens."""
+        """Build request headers with auth tokens.
+
+        The assembled dict is reused while both tokens are unchanged, so it
+        is shared between requests and must be treated as read-only.
+        """
+        # Sequential on purpose: a PAT fetch needs the ID token, so gathering
+        # the two would only queue the PAT behind the same _id_token_lock
+        # while adding task overhead to the warm (fully cached) path.
         id_token = await self._get_id_token()
-        headers = {"Authorization": f"Bearer {id_token}"}
-        if plant_id:
-            pat = await self._get_plant_access_token(plant_id)
+        pat = await self._get_plant_access_token(plant_id) if plant_id else None
+        cached = self._headers_cache.get(plant_id)
+        if cached is not None and cached[1] == id_token and cached[2] == pat:
+            return cached[0]
+        headers = {**_BASE_HEADERS, "Authorization": f"Bearer {id_token}"}
+        if pat is not None:
             headers["X-Plant-Access-Token"] = pat
+        self._headers_cache[plant_id] = (headers, id_token, pat)
         return headers
 
     async def _request(
@@ -210,6 +321,7 @@ class HovalConnectApi:
         plant_id: str | None = None,
         params: dict[str, str] | None = None,
         json_data: Any = None,
+        conditional: bool = False,
     ) -> Any:
         """Make an authenticated API request with token retry and transient error backoff.
 
@@ -218,8 +330,19 @@ class HovalConnectApi:
         previous implementation recursed on 401 with its own full retry
         budget, so combined 401 + 429/5xx flows could fire up to
         ``2 * _MAX_RETRIES`` requests.
+
+        At most _MAX_CONCURRENT_REQUESTS requests are in flight at once;
+        retry back-off sleeps happen outside that limit.
+
+        `conditional=True` (param-less GETs only) sends If-None-Match with the
+        last ETag seen for `path` and answers a 304 from the cached body, so
+        an unchanged resource costs neither the download nor the JSON parse.
         """
-        url = f"{BASE_URL}{path}"
+        url = _api_url(path)
+        etag_entry = self._etag_cache.get(path) if conditional else None
+        if etag_entry is not None and time.monotonic() - etag_entry.stored_at > _ETAG_MAX_AGE_S:
+            self._etag_cache.pop(path, None)
+            etag_entry = None
         timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
         token_refreshed = False
         attempt = 0
@@ -229,19 +352,32 @@ class HovalConnectApi:
             # cached tokens, and a stale header dict would re-send the
             # expired token.
             headers = await self._headers(plant_id)
+            # The tokens this attempt sends. A 401 invalidates them only if
+            # they are still current: a concurrent request may already have
+            # replaced them, and clearing its fresh token would force a
+            # second login.
+            sent_id_token = self._id_token
+            sent_pat = self._pat_cache.get(plant_id) if plant_id else None
+            if etag_entry is not None:
+                headers = {**headers, "If-None-Match": etag_entry.etag}
+            retry_delay = 0.0
             try:
-                async with self._session.request(
-                    method,
-                    url,
-                    headers=headers,
-                    params=params,
-                    json=json_data,
-                    timeout=timeout,
-                ) as resp:
+                async with (
+                    self._request_semaphore,
+                    self._session.request(
+                        method,
+                        url,
+                        headers=headers,
+                        params=params,
+                        json=json_data,
+                        timeout=timeout,
+                    ) as resp,
+                ):
                     _LOGGER.debug("API %s %s → HTTP %s", method, path, resp.status)
                     if resp.status == 401:
-                        self._id_token = None
-                        if plant_id:
+                        if self._id_token == sent_id_token:
+                            self._id_token = None
+                        if plant_id and self._pat_cache.get(plant_id) is sent_pat:
                             self._pat_cache.pop(plant_id, None)
                         if token_refreshed:
                             raise HovalAuthError("Authentication failed")
@@ -250,32 +386,43 @@ class HovalConnectApi:
                         # Do not increment `attempt` — token refresh is a
                         # one-shot extra request, not a transient retry.
                         continue
+                    if resp.status == 304 and etag_entry is not None:
+                        return etag_entry.data
                     if resp.status in _RETRYABLE_STATUS_CODES and attempt < _MAX_RETRIES - 1:
-                        delay = _RETRY_BASE_DELAY * (2**attempt)
+                        retry_delay = _backoff_delay(attempt, resp.headers.get("Retry-After"))
                         _LOGGER.warning(
                             "Transient error HTTP %s on %s %s, retrying in %.1fs (%d/%d)",
                             resp.status,
                             method,
                             path,
-                            delay,
+                            retry_delay,
                             attempt + 1,
                             _MAX_RETRIES,
                         )
-                        await asyncio.sleep(delay)
-                        attempt += 1
-                        continue
-                    if resp.status >= 400:
+                    elif resp.status >= 400:
                         body = await resp.text()
                         _LOGGER.debug("API error body: %s", body[:500])
                         raise HovalApiError(f"API request failed: HTTP {resp.status}")
-                    if resp.status == 204 or resp.content_length == 0:
+                    elif resp.status == 204 or resp.content_length == 0:
                         return None
-                    return await resp.json()
+                    elif (
+                        resp.content_type != "application/json" and not (await resp.read()).strip()
+                    ):
+                        # Empty chunked body without a JSON content type (no
+                        # Content-Length to test above): resp.json() would
+                        # raise ContentTypeError, a ClientError subclass that
+                        # the handler below mistakes for a connection error.
+                        return None
+                    else:
+                        data = await resp.json(loads=_json_loads)
+                        if conditional and (etag := resp.headers.get("ETag")):
+                            self._etag_cache[path] = _ConditionalEntry(etag, data, time.monotonic())
+                        return data
             except (HovalAuthError, HovalApiError):
                 raise
             except TimeoutError as err:
                 if attempt < _MAX_RETRIES - 1:
-                    delay = _RETRY_BASE_DELAY * (2**attempt)
+                    delay = _backoff_delay(attempt)
                     _LOGGER.warning(
                         "Request timeout on %s %s, retrying in %.1fs (%d/%d)",
                         method,
@@ -290,7 +437,7 @@ class HovalConnectApi:
                 raise HovalApiError(f"Request timeout: {err}") from err
             except aiohttp.ClientError as err:
                 if attempt < _MAX_RETRIES - 1:
-                    delay = _RETRY_BASE_DELAY * (2**attempt)
+                    delay = _backoff_delay(attempt)
                     _LOGGER.warning(
                         "Connection error on %s %s, retrying in %.1fs (%d/%d)",
                         method,
@@ -304,6 +451,12 @@ class HovalConnectApi:
                     continue
                 raise HovalApiError(f"Connection error: {err}") from err
 
+            # Only a retryable HTTP status gets here. Back off after leaving
+            # the response context and the semaphore, so a sleeping retry
+            # neither pins a pooled connection nor holds a concurrency slot.
+            await asyncio.sleep(retry_delay)
+            attempt += 1
+
         raise HovalApiError(f"Request failed after {_MAX_RETRIES} retries")
 
     async def get_plants(self) -> list[dict[str, Any]]:
@@ -352,7 +505,11 @@ class HovalConnectApi:
         return all_plants
 
     async def get_plant_settings(self, plant_id: str) -> dict[str, Any]:
-        """Get plant settings (also refreshes PAT as side effect)."""
+        """Get plant settings.
+
+        Never ETag-validated: the body carries a plant access token, which a
+        304 would replay from the cache after it expired.
+        """
         return await self._request("GET", f"/v1/plants/{plant_id}/settings", plant_id=plant_id)
 
     async def get_circuits(self, plant_id: str) -> list[dict[str, Any]]:
@@ -363,7 +520,9 @@ class HovalConnectApi:
         A Spring-Page wrapper {"content": [...], ...} is normalised to its
         content list; any other non-list shape degrades to [].
         """
-        result = await self._request("GET", f"/v3/plants/{plant_id}/circuits", plant_id=plant_id)
+        result = await self._request(
+            "GET", f"/v3/plants/{plant_id}/circuits", plant_id=plant_id, conditional=True
+        )
         if isinstance(result, dict):
             _LOGGER.debug(
                 "get_circuits returned paginated wrapper for plant %s; extracting 'content'",
@@ -378,6 +537,7 @@ class HovalConnectApi:
             "GET",
             f"/v3/plants/{plant_id}/circuits/{circuit_path}/programs",
             plant_id=plant_id,
+            conditional=True,
         )
 
     async def get_live_values(
@@ -548,3 +708,5 @@ class HovalConnectApi:
         self._id_token = None
         self._id_token_exp = 0
         self._pat_cache.clear()
+        self._etag_cache.clear()
+        self._headers_cache.clear()
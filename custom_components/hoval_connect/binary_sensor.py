@@ -22,19 +22,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up Hoval binary sensor entities."""
     coordinator = entry.runtime_data.coordinator
-    known: set[str] = set()
+    known: set[str] = set()  # plant ids whose entities exist
 
     def _add_new() -> None:
         entities: list[BinarySensorEntity] = []
         for plant_id, plant_data in coordinator.data.plants.items():
-            uid_online = f"{plant_id}_online"
-            uid_error = f"{plant_id}_error"
-            if uid_online not in known:
-                known.add(uid_online)
-                entities.append(HovalPlantOnline(coordinator, plant_id, plant_data))
-            if uid_error not in known:
-                known.add(uid_error)
-                entities.append(HovalPlantError(coordinator, plant_id, plant_data))
+            if plant_id in known:
+                continue
+            known.add(plant_id)
+            entities.append(HovalPlantOnline(coordinator, plant_id, plant_data))
+            entities.append(HovalPlantError(coordinator, plant_id, plant_data))
         if entities:
             async_add_entities(entities)
 
@@ -94,6 +91,11 @@ class HovalPlantError(CoordinatorEntity[HovalDataCoordinator], BinarySensorEntit
         self._attr_unique_id = f"{plant_id}_error"
         self._attr_device_info = plant_device_info(plant_data)
 
+    async def async_added_to_hass(self) -> None:
+        """Register as an event consumer; problem events feed the error flag."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_event_consumer())
+
     @property
     def is_on(self) -> bool | None:
         """Return true if the plant has an active error."""
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import time
+from datetime import datetime
 
 from homeassistant.components.climate import (
     ClimateEntity,
@@ -11,10 +13,11 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import HovalConnectConfigEntry, circuit_device_info
@@ -26,10 +29,32 @@ from .const import (
     OPERATION_MODE_REGULAR,
     OPERATION_MODE_STANDBY,
 )
-from .coordinator import SIGNAL_NEW_CIRCUITS, HovalCircuitData, HovalDataCoordinator
+from .coordinator import (
+    SIGNAL_NEW_CIRCUITS,
+    HovalCircuitData,
+    HovalDataCoordinator,
+    parse_float,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on how long a pending setpoint masks the reported one. Normally
+# the post-control refresh reflects the new value within seconds; if the cloud
+# stores something else (e.g. whole degrees only), a timer releases it after
+# this window — the coordinator skips listener updates for unchanged data, so
+# waiting for the next update could hold the stale value indefinitely.
+_PENDING_HOLD_S = 15.0
+
+# Active programs that run on a schedule and are shown as HVACMode.AUTO.
+_AUTO_PROGRAMS = frozenset({"week1", "week2", "ecoMode"})
+
+# Normalised circuit status → HVAC action; anything else is IDLE.
+_STATUS_TO_HVAC_ACTION: dict[str | None, HVACAction] = {
+    "HEATING": HVACAction.HEATING,
+    "COOLING": HVACAction.COOLING,
+}
+_hvac_action_for_status = _STATUS_TO_HVAC_ACTION.get
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -38,16 +63,15 @@ async def async_setup_entry(
 ) -> None:
     """Set up Hoval climate entities for heating circuits."""
     coordinator = entry.runtime_data.coordinator
-    known: set[str] = set()
+    known: set[tuple[str, str]] = set()
 
     def _add_new() -> None:
         entities: list[HovalClimate] = []
         for plant_id, plant_data in coordinator.data.plants.items():
             for path, circuit in plant_data.circuits.items():
-                uid = f"{plant_id}_{path}_climate"
-                if circuit.circuit_type != CIRCUIT_TYPE_HK or uid in known:
+                if circuit.circuit_type != CIRCUIT_TYPE_HK or (plant_id, path) in known:
                     continue
-                known.add(uid)
+                known.add((plant_id, path))
                 entities.append(HovalClimate(coordinator, entry, plant_id, path, circuit))
         if entities:
             async_add_entities(entities)
@@ -90,15 +114,40 @@ class HovalClimate(CoordinatorEntity[HovalDataCoordinator], ClimateEntity):
         self._attr_unique_id = f"{plant_id}_{circuit_path}_climate"
         self._attr_device_info = circuit_device_info(plant_id, circuit_data)
         self._pending_temperature: float | None = None
+        self._pending_since = 0.0
+        self._pending_hold_unsub: CALLBACK_TYPE | None = None
+        # Resolved once per coordinator update instead of on every property
+        # read; a state write touches _circuit from half a dozen properties.
+        self._circuit: HovalCircuitData | None = circuit_data
 
-    @property
-    def _circuit(self) -> HovalCircuitData | None:
-        """Get current circuit data from coordinator."""
+    def _lookup_circuit(self) -> HovalCircuitData | None:
+        """Resolve this entity's circuit in the current coordinator data."""
         plant = self.coordinator.data.plants.get(self._plant_id)
         if plant is None:
             return None
         return plant.circuits.get(self._circuit_path)
 
+    async def async_added_to_hass(self) -> None:
+        """Re-resolve the circuit in case a poll landed before registration."""
+        await super().async_added_to_hass()
+        self._circuit = self._lookup_circuit()
+        self.async_on_remove(self._cancel_pending_hold)
+
+    @callback
+    def _cancel_pending_hold(self) -> None:
+        """Cancel the pending-setpoint release timer, if armed."""
+        if self._pending_hold_unsub is not None:
+            self._pending_hold_unsub()
+            self._pending_hold_unsub = None
+
+    @callback
+    def _async_pending_hold_expired(self, _now: datetime) -> None:
+        """Show the reported setpoint again once the hold window has passed."""
+        self._pending_hold_unsub = None
+        if self._pending_temperature is not None:
+            self._pending_temperature = None
+            self.async_write_ha_state()
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
@@ -115,12 +164,9 @@ class HovalClimate(CoordinatorEntity[HovalDataCoordinator], ClimateEntity):
         if circuit is None:
             return None
         for key in ("roomTempActual", "actualTemperature", "roomTemperature"):
-            val = circuit.live_values.get(key)
+            val = parse_float(circuit.live_values.get(key))
             if val is not None:
-                try:
-                    return float(val)
-                except (ValueError, TypeError):
-                    continue
+                return val
         return None
 
     @property
@@ -130,6 +176,10 @@ class HovalClimate(CoordinatorEntity[HovalDataCoordinator], ClimateEntity):
         # stale data during the in-flight API call + refresh window.
         if self._pending_temperature is not None:
             return self._pending_temperature
+        return self._reported_target_temperature()
+
+    def _reported_target_temperature(self) -> float | None:
+        """Return the setpoint as last reported by the cloud."""
         circuit = self._circuit
         if circuit is None:
             return None
@@ -139,12 +189,27 @@ class HovalClimate(CoordinatorEntity[HovalDataCoordinator], ClimateEntity):
         if val is None:
             # Circuit-list `target_value` (also a setpoint, in degrees for HK).
             val = circuit.target_value
-        if val is None:
-            return None
-        try:
-            return float(val)
-        except (ValueError, TypeError):
-            return None
+        return parse_float(val)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached circuit and drop a pending setpoint it reflects.
+
+        The post-control refresh runs in the background, so clearing the
+        pending value when the API call returns would snap the card back to
+        the stale setpoint until that refresh lands. Instead it is released
+        by the first update that reports the new value (or after
+        _PENDING_HOLD_S, should the cloud store something else).
+        """
+        self._circuit = self._lookup_circuit()
+        pending = self._pending_temperature
+        if pending is not None:
+            reported = self._reported_target_temperature()
+            if (reported is not None and abs(reported - pending) < 0.05) or (
+                time.monotonic() - self._pending_since > _PENDING_HOLD_S
+            ):
+                self._pending_temperature = None
+        super()._handle_coordinator_update()
 
     @property
     def hvac_mode(self) -> HVACMode | None:
@@ -157,8 +222,7 @@ class HovalClimate(CoordinatorEntity[HovalDataCoordinator], ClimateEntity):
         if mode == OPERATION_MODE_STANDBY:
             return HVACMode.OFF
         # If a time program is active, show as AUTO
-        prog = circuit.active_program
-        if prog in ("week1", "week2", "ecoMode"):
+        if circuit.active_program in _AUTO_PROGRAMS:
             return HVACMode.AUTO
         return HVACMode.HEAT
 
@@ -172,16 +236,9 @@ class HovalClimate(CoordinatorEntity[HovalDataCoordinator], ClimateEntity):
         mode = override if override is not None else circuit.operation_mode
         if mode == OPERATION_MODE_STANDBY:
             return HVACAction.OFF
-        # Live values report the operating state under 'status' (our status
-        # sensor reads the same key); 'circuitStatus' kept as legacy fallback.
-        status = (
-            circuit.live_values.get("status") or circuit.live_values.get("circuitStatus") or ""
-        ).upper()
-        if status == "HEATING":
-            return HVACAction.HEATING
-        if status == "COOLING":
-            return HVACAction.COOLING
-        return HVACAction.IDLE
+        # circuit_status is the live 'status' value, upper-cased once per
+        # poll by the coordinator.
+        return _hvac_action_for_status(circuit.circuit_status, HVACAction.IDLE)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode."""
@@ -219,8 +276,14 @@ class HovalClimate(CoordinatorEntity[HovalDataCoordinator], ClimateEntity):
             DEFAULT_OVERRIDE_DURATION,
         )
         # Hold the new setpoint across the API call + refresh so the card
-        # does not flicker back to the old value during the ~3-5s window.
+        # does not flicker back to the old value during the ~3-5s window;
+        # _handle_coordinator_update releases it once the refresh confirms.
         self._pending_temperature = temperature
+        self._pending_since = time.monotonic()
+        self._cancel_pending_hold()
+        self._pending_hold_unsub = async_call_later(
+            self.hass, _PENDING_HOLD_S, self._async_pending_hold_expired
+        )
         self.async_write_ha_state()
         try:
             await self.coordinator.async_control_and_refresh(
@@ -238,6 +301,3 @@ class HovalClimate(CoordinatorEntity[HovalDataCoordinator], ClimateEntity):
                 self._pending_temperature = None
                 self.async_write_ha_state()
             raise HomeAssistantError(f"Failed to set temperature: {err}") from err
-        if self._pending_temperature == temperature:
-            self._pending_temperature = None
-            self.async_write_ha_state()
@@ -8,6 +8,7 @@ from typing import Any
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult, OptionsFlow
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import HovalApiError, HovalAuthError, HovalConnectApi
@@ -16,6 +17,7 @@ from .const import (
     CONF_SCAN_INTERVAL,
     CONF_TURN_ON_MODE,
     DEFAULT_OVERRIDE_DURATION,
+    DEFAULT_SCAN_INTERVAL,
     DEFAULT_TURN_ON_MODE,
     DOMAIN,
     DURATION_END_OF_PHASE,
@@ -43,6 +45,47 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
+# Built once at import; the options step only injects the current values as
+# suggestions instead of compiling a fresh schema on every open.
+_OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TURN_ON_MODE): vol.In(
+            {
+                TURN_ON_RESUME: "Resume time program",
+                TURN_ON_WEEK1: "Activate week 1",
+                TURN_ON_WEEK2: "Activate week 2",
+            }
+        ),
+        vol.Required(CONF_OVERRIDE_DURATION): vol.In(
+            {
+                DURATION_END_OF_PHASE: "Until end of current phase",
+                DURATION_FOUR_HOURS: "4 hours",
+                DURATION_MIDNIGHT: "Until midnight",
+            }
+        ),
+        vol.Required(CONF_SCAN_INTERVAL): vol.All(vol.Coerce(int), vol.In(SCAN_INTERVAL_OPTIONS)),
+    }
+)
+
+
+async def _async_validate_credentials(hass: HomeAssistant, email: str, password: str) -> str | None:
+    """Probe the account; return a config-flow error key, or None if valid."""
+    api = HovalConnectApi(async_get_clientsession(hass), email, password)
+    try:
+        async with asyncio.timeout(_VALIDATION_TIMEOUT_S):
+            await api.get_plants()
+    except TimeoutError:
+        _LOGGER.warning("Hoval validation timed out after %d s", _VALIDATION_TIMEOUT_S)
+        return "cannot_connect"
+    except HovalAuthError as err:
+        _LOGGER.warning("Hoval auth failed: %s", err)
+        return "invalid_auth"
+    except HovalApiError as err:
+        _LOGGER.error("Hoval API error during validation: %s", err)
+        return "cannot_connect"
+    return None
+
+
 class HovalConnectConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Hoval Connect."""
 
@@ -58,21 +101,11 @@ class HovalConnectConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            session = async_get_clientsession(self.hass)
-            api = HovalConnectApi(session, user_input["email"], user_input["password"])
-
-            try:
-                async with asyncio.timeout(_VALIDATION_TIMEOUT_S):
-                    await api.get_plants()
-            except TimeoutError:
-                _LOGGER.warning("Hoval validation timed out after %d s", _VALIDATION_TIMEOUT_S)
-                errors["base"] = "cannot_connect"
-            except HovalAuthError as err:
-                _LOGGER.warning("Hoval auth failed: %s", err)
-                errors["base"] = "invalid_auth"
-            except HovalApiError as err:
-                _LOGGER.error("Hoval API error during setup: %s", err)
-                errors["base"] = "cannot_connect"
+            error = await _async_validate_credentials(
+                self.hass, user_input["email"], user_input["password"]
+            )
+            if error:
+                errors["base"] = error
             else:
                 await self.async_set_unique_id(user_input["email"].lower())
                 self._abort_if_unique_id_configured()
@@ -108,30 +141,18 @@ class HovalConnectConfigFlow(ConfigFlow, domain=DOMAIN):
             # lowercased account email since the first release).
             if user_input["email"].lower() != (reauth_entry.unique_id or "").lower():
                 errors["base"] = "wrong_account"
+            elif error := await _async_validate_credentials(
+                self.hass, user_input["email"], user_input["password"]
+            ):
+                errors["base"] = error
             else:
-                session = async_get_clientsession(self.hass)
-                api = HovalConnectApi(session, user_input["email"], user_input["password"])
-
-                try:
-                    async with asyncio.timeout(_VALIDATION_TIMEOUT_S):
-                        await api.get_plants()
-                except TimeoutError:
-                    _LOGGER.warning(
-                        "Hoval reauth validation timed out after %d s", _VALIDATION_TIMEOUT_S
-                    )
-                    errors["base"] = "cannot_connect"
-                except HovalAuthError:
-                    errors["base"] = "invalid_auth"
-                except HovalApiError:
-                    errors["base"] = "cannot_connect"
-                else:
-                    return self.async_update_reload_and_abort(
-                        reauth_entry,
-                        data={
-                            "email": user_input["email"],
-                            "password": user_input["password"],
-                        },
-                    )
+                return self.async_update_reload_and_abort(
+                    reauth_entry,
+                    data={
+                        "email": user_input["email"],
+                        "password": user_input["password"],
+                    },
+                )
 
         return self.async_show_form(
             step_id="reauth_confirm",
@@ -148,39 +169,19 @@ class HovalConnectOptionsFlow(OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        current_duration = self.config_entry.options.get(
-            CONF_OVERRIDE_DURATION, DEFAULT_OVERRIDE_DURATION
-        )
-        current_turn_on = self.config_entry.options.get(CONF_TURN_ON_MODE, DEFAULT_TURN_ON_MODE)
-        current_interval = int(self.config_entry.options.get(CONF_SCAN_INTERVAL, 60))
+        options = self.config_entry.options
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
+            data_schema=self.add_suggested_values_to_schema(
+                _OPTIONS_SCHEMA,
                 {
-                    vol.Required(
-                        CONF_TURN_ON_MODE,
-                        default=current_turn_on,
-                    ): vol.In(
-                        {
-                            TURN_ON_RESUME: "Resume time program",
-                            TURN_ON_WEEK1: "Activate week 1",
-                            TURN_ON_WEEK2: "Activate week 2",
-                        }
+                    CONF_TURN_ON_MODE: options.get(CONF_TURN_ON_MODE, DEFAULT_TURN_ON_MODE),
+                    CONF_OVERRIDE_DURATION: options.get(
+                        CONF_OVERRIDE_DURATION, DEFAULT_OVERRIDE_DURATION
                     ),
-                    vol.Required(
-                        CONF_OVERRIDE_DURATION,
-                        default=current_duration,
-                    ): vol.In(
-                        {
-                            DURATION_END_OF_PHASE: "Until end of current phase",
-                            DURATION_FOUR_HOURS: "4 hours",
-                            DURATION_MIDNIGHT: "Until midnight",
-                        }
+                    CONF_SCAN_INTERVAL: int(
+                        options.get(CONF_SCAN_INTERVAL, int(DEFAULT_SCAN_INTERVAL.total_seconds()))
                     ),
-                    vol.Required(
-                        CONF_SCAN_INTERVAL,
-                        default=current_interval,
-                    ): vol.All(vol.Coerce(int), vol.In(SCAN_INTERVAL_OPTIONS)),
-                }
+                },
             ),
         )
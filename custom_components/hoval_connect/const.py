@@ -44,13 +44,15 @@ CIRCUIT_TYPE_PS = "PS"
 CIRCUIT_TYPE_GW = "GW"
 
 # Supported circuit types for this integration
-SUPPORTED_CIRCUIT_TYPES = {
-    CIRCUIT_TYPE_HV,
-    CIRCUIT_TYPE_HK,
-    CIRCUIT_TYPE_BL,
-    CIRCUIT_TYPE_WW,
-    CIRCUIT_TYPE_PS,
-}
+SUPPORTED_CIRCUIT_TYPES = frozenset(
+    {
+        CIRCUIT_TYPE_HV,
+        CIRCUIT_TYPE_HK,
+        CIRCUIT_TYPE_BL,
+        CIRCUIT_TYPE_WW,
+        CIRCUIT_TYPE_PS,
+    }
+)
 
 # Human-readable names for circuit types
 CIRCUIT_TYPE_NAMES = {
@@ -4,13 +4,18 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 import time
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
@@ -36,8 +41,37 @@ SIGNAL_NEW_CIRCUITS = f"{DOMAIN}_new_circuits"
 # failing an override must not mask the device's real state indefinitely.
 _MODE_OVERRIDE_TTL_S = 120.0
 
+# Cap on re-fetching a schedule we already hold (seconds). Past it the poll
+# carries on with the cached schedule instead of waiting out the request's
+# full timeout and retries; the refresh is attempted again next poll.
+_PROGRAM_REFRESH_TIMEOUT_S = 10.0
+
+# Settle delay before the refresh that confirms a control action (seconds).
+# The cloud needs a moment before a change shows up in its circuit data;
+# the optimistic mode override covers the UI in the meantime.
+_CONTROL_REFRESH_DELAY_S = 2.0
+
+# Idle back-off: after this many consecutive polls returning unchanged data
+# the poll interval doubles on each further unchanged poll, up to
+# _MAX_IDLE_INTERVAL (never below the configured interval). Any change, or a
+# control action, snaps it back to the configured interval.
+_IDLE_POLLS_BEFORE_BACKOFF = 3
+_MAX_IDLE_INTERVAL = timedelta(minutes=5)
+
 _LOGGER = logging.getLogger(__name__)
 
+# BL/WW/PS circuits have selectable=False but still provide live values.
+_NON_SELECTABLE_TYPES = frozenset({CIRCUIT_TYPE_BL, CIRCUIT_TYPE_WW, CIRCUIT_TYPE_PS})
+
+# Most recent plant events kept per plant (the events endpoint returns more).
+_MAX_EVENTS = 10
+
+# Stands in for the event list when _fetch_events proved it unchanged.
+_EVENTS_UNCHANGED = object()
+
+# Event types that raise the plant's error flag while active.
+_PROBLEM_EVENT_TYPES = frozenset({"blocking", "locking", "warning"})
+
 # v1 API returns different activeProgram values than v3.
 # Normalize so entities always see v3 enum keys.
 _V1_PROGRAM_MAP: dict[str, str] = {
@@ -48,10 +82,90 @@ _V1_PROGRAM_MAP: dict[str, str] = {
 }
 
 
+# Sorted phases of one day program: (start minutes, [(start, end, value), ...]).
+type _DayPhases = tuple[list[int], list[tuple[int, int, Any]]]
+
+
+def _compile_phases(phases: Any) -> _DayPhases:
+    """Sort a day program's well-formed phases by start minute for bisect lookup.
+
+    Malformed phases (non-dict, missing/non-dict start or end, non-numeric
+    times) are dropped, not fatal.
+    """
+    compiled: list[tuple[int, int, Any]] = []
+    if isinstance(phases, list):
+        for phase in phases:
+            if not isinstance(phase, dict):
+                continue
+            start = phase.get("start")
+            end = phase.get("end")
+            if not isinstance(start, dict) or not isinstance(end, dict):
+                continue
+            try:
+                start_min = int(start["hours"]) * 60 + int(start["minutes"])
+                end_min = int(end["hours"]) * 60 + int(end["minutes"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            compiled.append((start_min, end_min, phase.get("value")))
+    compiled.sort(key=lambda p: p[0])
+    return [p[0] for p in compiled], compiled
+
+
+def _phase_value_at(day_phases: _DayPhases, minutes: int) -> Any:
+    """Return the value of the phase running at `minutes`, or None.
+
+    Phases of one day do not overlap, so the candidate is the last phase
+    starting at or before `minutes`.
+    """
+    starts, phases = day_phases
+    idx = bisect_right(starts, minutes) - 1
+    if idx >= 0:
+        _, end_min, value = phases[idx]
+        if minutes < end_min:
+            return value
+    return None
+
+
+def _next_idle_interval(current: timedelta, base: timedelta, idle_polls: int) -> timedelta:
+    """Return the poll interval after `idle_polls` consecutive unchanged polls."""
+    if idle_polls < _IDLE_POLLS_BEFORE_BACKOFF:
+        return base
+    return max(base, min(current * 2, _MAX_IDLE_INTERVAL))
+
+
+def _index_day_configs(day_configs: list[Any]) -> dict[Any, dict[str, Any]]:
+    """Map day configurations by "id"; non-dict entries or missing ids are skipped."""
+    return {d["id"]: d for d in day_configs if isinstance(d, dict) and "id" in d}
+
+
+@dataclass(slots=True)
+class _ProgramIndex:
+    """Lookups derived from one programs blob, reused while the blob is cached."""
+
+    programs: dict[str, Any]
+    # Day configurations by their "id", built on first use.
+    by_id: dict[Any, dict[str, Any]] | None = None
+    # id(day configuration) → compiled phases. The ids stay valid because
+    # `programs` keeps every day configuration alive.
+    day_phases: dict[int, _DayPhases] = field(default_factory=dict)
+
+    def config_by_id(self, day_configs: list[Any]) -> dict[Any, dict[str, Any]]:
+        if self.by_id is None:
+            self.by_id = _index_day_configs(day_configs)
+        return self.by_id
+
+    def phases_for(self, day_config: dict[str, Any]) -> _DayPhases:
+        compiled = self.day_phases.get(id(day_config))
+        if compiled is None:
+            compiled = self.day_phases[id(day_config)] = _compile_phases(day_config.get("phases"))
+        return compiled
+
+
 def _resolve_active_program_value(
     programs: dict[str, Any] | None,
     now: datetime,
     active_program: str | None = None,
+    index: _ProgramIndex | None = None,
 ) -> tuple[str | None, str | None, float | None]:
     """Resolve the currently active week, day program name, and air volume.
 
@@ -69,6 +183,9 @@ def _resolve_active_program_value(
     to propagate out of _fetch_circuit and silently drop the whole circuit
     (including its already-fetched live values).
 
+    `index`, when built for this same `programs` blob, memoises the day
+    configuration lookup and the parsed phases across polls.
+
     Returns (week_name, day_program_name, current_phase_value).
     """
     if not isinstance(programs, dict):
@@ -80,12 +197,6 @@ def _resolve_active_program_value(
     if not isinstance(day_configs, list) or not day_configs:
         return None, None, None
 
-    # Build lookup: id -> day config. Entries that are not dicts or lack an
-    # "id" are skipped instead of raising.
-    config_by_id: dict[Any, dict] = {
-        d["id"]: d for d in day_configs if isinstance(d, dict) and "id" in d
-    }
-
     # Pick week1 or week2 based on what the controller reports as active.
     week_key = "week2" if active_program == "week2" else "week1"
     week = programs.get(week_key)
@@ -103,37 +214,32 @@ def _resolve_active_program_value(
         return week_name, None, None
 
     day_prog_id = day_program_ids[weekday]
-    day_config = config_by_id.get(day_prog_id)
+    if index is not None:
+        day_config = index.config_by_id(day_configs).get(day_prog_id)
+    else:
+        # One-off call: a scan of the (≤7) configurations beats building a map
+        day_config = next(
+            (
+                d
+                for d in day_configs
+                if isinstance(d, dict) and "id" in d and d["id"] == day_prog_id
+            ),
+            None,
+        )
     if day_config is None:
         return week_name, None, None
 
     day_name = day_config.get("name")
 
-    # Find active phase based on current time. Malformed phases (non-dict,
-    # missing/non-dict start or end, non-numeric times) are skipped, not fatal.
-    current_minutes = now.hour * 60 + now.minute
-    phases = day_config.get("phases")
-    if not isinstance(phases, list):
-        phases = []
-    for phase in phases:
-        if not isinstance(phase, dict):
-            continue
-        start = phase.get("start")
-        end = phase.get("end")
-        if not isinstance(start, dict) or not isinstance(end, dict):
-            continue
-        try:
-            start_min = int(start["hours"]) * 60 + int(start["minutes"])
-            end_min = int(end["hours"]) * 60 + int(end["minutes"])
-        except (KeyError, TypeError, ValueError):
-            continue
-        if start_min <= current_minutes < end_min:
-            return week_name, day_name, phase.get("value")
-
-    return week_name, day_name, None
+    # Find active phase based on current time.
+    if index is not None:
+        day_phases = index.phases_for(day_config)
+    else:
+        day_phases = _compile_phases(day_config.get("phases"))
+    return week_name, day_name, _phase_value_at(day_phases, now.hour * 60 + now.minute)
 
 
-@dataclass
+@dataclass(slots=True)
 class HovalEventData:
     """Parsed data for a plant event."""
 
@@ -150,7 +256,7 @@ class HovalEventData:
         return self.time_resolved is None
 
 
-@dataclass
+@dataclass(slots=True)
 class HovalCircuitData:
     """Parsed data for a single circuit."""
 
@@ -170,9 +276,11 @@ class HovalCircuitData:
     program_air_volume: float | None = None
     # User-defined program names: API key → display name (e.g. "week1" → "Normal")
     program_names: dict[str, str] = field(default_factory=dict)
+    # Upper-cased operating state from live values (see _normalize_circuit_status)
+    circuit_status: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HovalWeatherData:
     """Parsed weather forecast data for a plant."""
 
@@ -181,7 +289,7 @@ class HovalWeatherData:
     outside_temperature_min: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HovalPlantData:
     """Parsed data for a single plant."""
 
@@ -195,7 +303,7 @@ class HovalPlantData:
     weather: HovalWeatherData | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HovalData:
     """Top-level data returned by the coordinator."""
 
@@ -216,16 +324,78 @@ def _parse_event(raw: dict) -> HovalEventData:
 
 def _is_problem_event(event: HovalEventData | None) -> bool:
     """Return True if event is active and represents a fault (blocking/locking/warning)."""
-    return bool(
-        event
-        and event.is_active
-        and event.event_type
-        in (
-            "blocking",
-            "locking",
-            "warning",
-        )
-    )
+    return event is not None and event.is_active and event.event_type in _PROBLEM_EVENT_TYPES
+
+
+_key_and_value = itemgetter("key", "value")
+
+
+def _live_values_dict(entries: list[Any]) -> dict[str, Any]:
+    """Map live-value entries [{"key": k, "value": v}, ...] to {k: v}.
+
+    The well-formed case runs entirely in C (dict over map/itemgetter); only
+    a payload with a malformed entry pays for the filtered rebuild.
+    """
+    try:
+        return dict(map(_key_and_value, entries))
+    except (KeyError, TypeError, ValueError):
+        return {
+            v["key"]: v["value"]
+            for v in entries
+            if isinstance(v, dict) and "key" in v and "value" in v
+        }
+
+
+def _normalize_circuit_status(live_values: dict[str, Any]) -> str | None:
+    """Return the circuit's operating state from live values, upper-cased.
+
+    Live values report it under 'status' (the circuit_status sensor shows that
+    key verbatim, so it is not rewritten in place); 'circuitStatus' is the
+    legacy fallback. Normalised once per poll so entity properties that HA
+    reads on every state write do not re-case the string each time.
+    """
+    status = live_values.get("status") or live_values.get("circuitStatus")
+    return status.upper() if isinstance(status, str) else None
+
+
+def parse_float(value: Any) -> float | None:
+    """Convert a live or circuit value to float; None if missing or malformed.
+
+    Live values arrive as strings ("21.5"), circuit-list fields as JSON
+    numbers. Floats are returned as-is without entering the try block.
+    """
+    if type(value) is float:
+        return value
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def parse_percentage(value: Any) -> int | None:
+    """Convert an air-volume value to whole percent; None if missing or malformed."""
+    if isinstance(value, str):
+        return _percentage_from_str(value)
+    if type(value) is int:
+        # JSON integer setpoints (targetValue): already whole percent
+        return value
+    if isinstance(value, bool):
+        # A bool is no air volume; without this float(True) would read as 1%.
+        return None
+    return _truncate(parse_float(value))
+
+
+@lru_cache(maxsize=128)
+def _percentage_from_str(value: str) -> int | None:
+    # Live air volumes are strings from a small set ("40", "55.0", ...) that
+    # repeat every poll, so the parse is memoised.
+    return _truncate(parse_float(value))
+
+
+def _truncate(num: float | None) -> int | None:
+    return int(num) if num is not None and math.isfinite(num) else None
 
 
 DEFAULT_FAN_SPEED = 40
@@ -240,11 +410,9 @@ def resolve_fan_speed(circuit: HovalCircuitData | None) -> int:
     if circuit is None:
         return DEFAULT_FAN_SPEED
     # Try live sensor value first
-    val = circuit.live_values.get("airVolume")
-    if val is not None:
-        speed = int(float(val))
-        if speed >= 1:
-            return speed
+    speed = parse_percentage(circuit.live_values.get("airVolume"))
+    if speed is not None and speed >= 1:
+        return speed
     # Try target from circuit config
     if circuit.target_value is not None:
         speed = int(circuit.target_value)
@@ -267,33 +435,80 @@ class HovalDataCoordinator(DataUpdateCoordinator[HovalData]):
         self,
         hass: HomeAssistant,
         api: HovalConnectApi,
+        update_interval: timedelta = DEFAULT_SCAN_INTERVAL,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=DEFAULT_SCAN_INTERVAL,
+            update_interval=update_interval,
+            # Skip the listener fan-out (a state write per entity) when a poll
+            # returns data equal to the previous one; the data classes compare
+            # by value.
+            always_update=False,
         )
         self.api = api
         self.control_lock = asyncio.Lock()
+        # The configured poll interval; update_interval stretches beyond it
+        # while the data stays unchanged (see _IDLE_POLLS_BEFORE_BACKOFF).
+        self._base_interval = update_interval
+        self._idle_polls = 0
         # Optimistic mode override per circuit (set by control actions,
         # cleared at the END of the next successful poll or after
         # _MODE_OVERRIDE_TTL_S). Key: circuit_path,
         # value: (operation mode string, monotonic timestamp).
         self._mode_override: dict[str, tuple[str, float]] = {}
-        # Program cache: key=circuit_path, value=(programs_data, timestamp)
-        self._program_cache: dict[str, tuple[Any, float]] = {}
+        # Program cache: key=(plant_id, circuit_path) — paths repeat across
+        # plants — value=(programs_data, monotonic timestamp, lookup index).
+        # Past the TTL the re-fetch is ETag-validated, so an unchanged
+        # schedule costs a 304 and keeps its index.
+        # Control actions do not invalidate it: they switch which program is
+        # active (circuit list, fetched every poll), not the program bodies.
+        self._program_cache: dict[tuple[str, str], tuple[Any, float, _ProgramIndex]] = {}
         self._program_cache_ttl = PROGRAM_CACHE_TTL.total_seconds()
         # Plant-level caches: (parsed value(s), monotonic timestamp)
         self._weather_cache: dict[str, tuple[HovalWeatherData | None, float]] = {}
         self._weather_cache_ttl = WEATHER_CACHE_TTL.total_seconds()
+        # The events cache adds whether its list came from a successful
+        # list fetch; only such a list may stand in for a skipped one.
         self._events_cache: dict[
-            str, tuple[HovalEventData | None, list[HovalEventData], float]
+            str, tuple[HovalEventData | None, list[HovalEventData], float, bool]
         ] = {}
         self._events_cache_ttl = EVENTS_CACHE_TTL.total_seconds()
         # Track known circuits for dynamic entity discovery
-        self._known_circuits: set[str] = set()
+        self._known_circuits: set[tuple[str, str]] = set()  # (plant_id, path)
+        # True while a post-control refresh is still in its settle delay;
+        # further control actions in that window share the same refresh.
+        self._control_refresh_pending = False
+        # Background tasks running those refreshes, cancelled on shutdown.
+        # An action landing while a refresh is already fetching starts a
+        # second one, so more than one can be in flight.
+        self._control_refresh_tasks: set[asyncio.Task[None]] = set()
+        # Entities currently reading plant events (latest event, event list,
+        # the error flag they feed). With none registered, the event
+        # endpoints are not polled after the first refresh.
+        self._event_consumers = 0
+
+    @callback
+    def async_add_event_consumer(self) -> CALLBACK_TYPE:
+        """Register an entity that reads plant events; call the result to unregister."""
+        self._event_consumers += 1
+
+        @callback
+        def _remove() -> None:
+            self._event_consumers -= 1
+
+        return _remove
+
+    def set_base_interval(self, interval: timedelta) -> None:
+        """Apply a newly configured poll interval and restart the idle back-off."""
+        self._base_interval = interval
+        self._reset_idle_backoff()
+
+    def _reset_idle_backoff(self) -> None:
+        self._idle_polls = 0
+        self.update_interval = self._base_interval
 
     def set_mode_override(self, circuit_path: str, mode: str) -> None:
         """Set optimistic mode override after a control action."""
@@ -323,18 +538,33 @@ class HovalDataCoordinator(DataUpdateCoordinator[HovalData]):
         """Execute a control command with lock, optimistic state, and refresh.
 
         The API call and optimistic override are serialised inside
-        control_lock; the refresh runs as a fire-and-forget background task
-        OUTSIDE the lock (with a 2 s settle delay) so the calling entity
-        method returns promptly and a slow refresh cannot starve the lock.
-        A failed background refresh is dropped — the coordinator retries on
-        its normal poll schedule and entities stay on their optimistic state.
+        control_lock; listeners are then pushed the optimistic state from
+        memory, without a fetch. A confirming refresh runs as a
+        fire-and-forget background task OUTSIDE the lock (after
+        _CONTROL_REFRESH_DELAY_S) so the calling entity method returns promptly and a slow
+        refresh cannot starve the lock. Actions landing within that delay
+        share one refresh instead of each firing their own. A failed
+        background refresh is dropped — the coordinator retries on its
+        normal poll schedule and entities stay on their optimistic state.
         """
         async with self.control_lock:
             await coro
             self.set_mode_override(circuit_path, mode_override)
+        self.async_update_listeners()
+        # The device is about to change; watch it at the configured cadence.
+        self._reset_idle_backoff()
+
+        if self._control_refresh_pending:
+            # The scheduled refresh has not started yet, so its poll begins
+            # after this override and confirms this action as well.
+            return
+        self._control_refresh_pending = True
 
         async def _do_refresh() -> None:
-            await asyncio.sleep(2)
+            try:
+                await asyncio.sleep(_CONTROL_REFRESH_DELAY_S)
+            finally:
+                self._control_refresh_pending = False
             try:
                 await self.async_request_refresh()
             except Exception:  # noqa: BLE001 — see docstring
@@ -343,338 +573,471 @@ class HovalDataCoordinator(DataUpdateCoordinator[HovalData]):
                     circuit_path,
                 )
 
-        self.hass.async_create_task(_do_refresh())
-
-    async def _async_update_data(self) -> HovalData:
-        """Fetch data from the API."""
-        # Timestamp BEFORE any fetch: overrides set after this instant belong
-        # to control actions this poll's data snapshot cannot reflect yet, so
-        # the pruning at the end must leave them alone.
-        poll_start = time.monotonic()
-        data = HovalData()
-
-        try:
-            plants = await self.api.get_plants()
-
-            for plant in plants:
-                plant_id = plant.get("plantExternalId")
-                if not plant_id:
-                    _LOGGER.debug("Skipping plant with missing plantExternalId")
-                    continue
+        task = self.hass.async_create_background_task(
+            _do_refresh(), f"{DOMAIN} post-control refresh"
+        )
+        self._control_refresh_tasks.add(task)
+        task.add_done_callback(self._control_refresh_tasks.discard)
 
-                plant_name = plant.get("description", plant_id)
+    async def async_shutdown(self) -> None:
+        """Cancel pending post-control refreshes, then shut down."""
+        tasks = list(self._control_refresh_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await super().async_shutdown()
 
-                plant_data = HovalPlantData(
-                    plant_id=plant_id,
-                    name=plant_name,
-                    is_online=plant.get("isOnline", True),
-                )
+    async def _fetch_plant(self, plant: dict[str, Any], now: datetime) -> HovalPlantData | None:
+        """Fetch circuits, events and weather for one plant of the account.
 
-                # Skip all API calls when plant is offline
-                if not plant_data.is_online:
-                    # Invalidate cached PAT so we get a fresh token when back
-                    self.api.invalidate_plant_token(plant_id)
-                    data.plants[plant_id] = plant_data
-                    continue
-
-                # Fetch circuits. A persistent failure here is the most common
-                # symptom of an upstream API change (the v1 endpoint removal in
-                # April 2026 was masked for days because we used to swallow this
-                # error). Log loudly and let DataUpdateCoordinator surface the
-                # failure to the user as `unavailable` entities.
-                try:
-                    circuits_raw = await self.api.get_circuits(plant_id)
-                except HovalApiError as err:
-                    _LOGGER.error(
-                        "Circuits endpoint failed for plant %s: %s — entities will go "
-                        "unavailable until the cloud API recovers or the integration is "
-                        "updated.",
-                        plant_id,
-                        err,
-                    )
-                    raise
-
-                # BL/WW/PS circuits have selectable=False but still provide live values
-                _non_selectable_types = {CIRCUIT_TYPE_BL, CIRCUIT_TYPE_WW, CIRCUIT_TYPE_PS}
+        `now` is the poll's wall-clock time, shared by every circuit.
+        """
+        plant_id = plant.get("plantExternalId")
+        if not plant_id:
+            _LOGGER.debug("Skipping plant with missing plantExternalId")
+            return None
 
+        plant_name = plant.get("description", plant_id)
+
+        # Skip all API calls when plant is offline
+        if not plant.get("isOnline", True):
+            # Invalidate cached PAT so we get a fresh token when back
+            self.api.invalidate_plant_token(plant_id)
+            # An offline plant carries nothing but its name; a chronically
+            # offline one keeps handing back last poll's object.
+            previous = self.data.plants.get(plant_id) if self.data is not None else None
+            if previous is not None and not previous.is_online and previous.name == plant_name:
+                return previous
+            return HovalPlantData(plant_id=plant_id, name=plant_name, is_online=False)
+
+        plant_data = HovalPlantData(plant_id=plant_id, name=plant_name)
+
+        # Fetch circuits. A persistent failure here is the most common
+        # symptom of an upstream API change (the v1 endpoint removal in
+        # April 2026 was masked for days because we used to swallow this
+        # error). Log loudly and let DataUpdateCoordinator surface the
+        # failure to the user as `unavailable` entities.
+        try:
+            circuits_raw = await self.api.get_circuits(plant_id)
+        except HovalApiError as err:
+            _LOGGER.error(
+                "Circuits endpoint failed for plant %s: %s — entities will go "
+                "unavailable until the cloud API recovers or the integration is "
+                "updated.",
+                plant_id,
+                err,
+            )
+            raise
+
+        # Build list of supported circuits
+        supported_circuits: list[tuple[str, str, dict]] = []
+        # The raw-circuit dump copies every circuit dict; only build it
+        # when someone is actually reading debug output.
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        for circuit in circuits_raw:
+            ctype = circuit.get("type", "")
+            if ctype not in SUPPORTED_CIRCUIT_TYPES:
+                continue
+            if not circuit.get("selectable", False) and ctype not in _NON_SELECTABLE_TYPES:
+                continue
+            path = circuit["path"]
+            if debug:
                 _LOGGER.debug(
-                    "Fetched %d circuits (%d supported)",
-                    len(circuits_raw),
-                    sum(
-                        1
-                        for c in circuits_raw
-                        if c.get("type") in SUPPORTED_CIRCUIT_TYPES
-                        and (c.get("selectable") or c.get("type") in _non_selectable_types)
-                    ),
+                    "Circuit %s raw: %s",
+                    path,
+                    {k: v for k, v in circuit.items() if k != "name"},
                 )
+            supported_circuits.append((path, ctype, circuit))
+        _LOGGER.debug(
+            "Fetched %d circuits (%d supported)", len(circuits_raw), len(supported_circuits)
+        )
 
-                # Build list of supported circuits
-                supported_circuits: list[tuple[str, str, dict]] = []
-                for circuit in circuits_raw:
-                    ctype = circuit.get("type", "")
-                    if ctype not in SUPPORTED_CIRCUIT_TYPES:
-                        continue
-                    if not circuit.get("selectable", False) and ctype not in _non_selectable_types:
-                        continue
-                    path = circuit["path"]
+        # Run circuits in parallel. Plant-level events/weather are only
+        # appended when their cache is stale (they are slow-changing and
+        # plant-scoped, so fetching them every poll wastes round-trips).
+        all_tasks = [
+            self._fetch_circuit(plant_id, path, ctype, circ, now)
+            for path, ctype, circ in supported_circuits
+        ]
+        num_circuits = len(all_tasks)
+        now_mono = time.monotonic()
+
+        events_cached = self._events_cache.get(plant_id)
+        # The first refresh runs before any entity exists, so it always
+        # fetches; afterwards only while some entity reads the events.
+        want_events = self.data is None or self._event_consumers > 0
+        need_events = want_events and (
+            events_cached is None or now_mono - events_cached[2] > self._events_cache_ttl
+        )
+        events_idx = None
+        if need_events:
+            events_idx = len(all_tasks)
+            all_tasks.append(self._fetch_events(plant_id, events_cached))
+
+        weather_cached = self._weather_cache.get(plant_id)
+        need_weather = (
+            weather_cached is None or now_mono - weather_cached[1] > self._weather_cache_ttl
+        )
+        weather_idx = None
+        if need_weather:
+            weather_idx = len(all_tasks)
+            all_tasks.append(self.api.get_weather(plant_id))
+
+        all_results = await asyncio.gather(
+            *all_tasks,
+            return_exceptions=True,
+        )
+
+        # Process circuit results
+        for result in all_results[:num_circuits]:
+            if isinstance(result, BaseException):
+                _LOGGER.debug("Circuit fetch failed: %s", result)
+                continue
+            if result.has_error:
+                plant_data.has_error = True
+            plant_data.circuits[result.path] = result
+
+        # --- Events (latest + list), cached together ---
+        if need_events:
+            events_fetch = all_results[events_idx]
+            if isinstance(events_fetch, BaseException):
+                latest_result = events_result = events_fetch
+            else:
+                latest_result, events_result = events_fetch
+            latest_ok = not isinstance(latest_result, BaseException)
+            events_ok = not isinstance(events_result, BaseException)
+            parsed_latest = None
+            parsed_events: list[HovalEventData] = []
+            # Isolation barrier: this block runs OUTSIDE the per-circuit
+            # gather's exception isolation, so a shape surprise here
+            # (e.g. a pagination wrapper reaching the list slice) would
+            # fail the ENTIRE poll and take every entity unavailable.
+            # The API client now normalises both event endpoints; the
+            # isinstance guards and try/except below are defence in
+            # depth for anything it hasn't seen yet.
+            try:
+                if not latest_ok:
+                    _LOGGER.debug("Events endpoint not available for %s", plant_id)
+                elif isinstance(latest_result, dict) and latest_result:
+                    parsed_latest = _parse_event(latest_result)
                     _LOGGER.debug(
-                        "Circuit %s raw: %s",
-                        path,
-                        {k: v for k, v in circuit.items() if k != "name"},
-                    )
-                    supported_circuits.append((path, ctype, circuit))
-
-                # Fetch live values + programs for all circuits in parallel
-                async def _fetch_circuit(
-                    path: str,
-                    ctype: str,
-                    circuit: dict,
-                    _plant_id: str = plant_id,
-                ) -> HovalCircuitData:
-                    raw_program = circuit.get("activeProgram")
-                    air_quality = circuit.get("airQuality") or {}
-                    circuit_data = HovalCircuitData(
-                        circuit_type=ctype,
-                        path=path,
-                        name=circuit.get("name") or ctype,
-                        operation_mode=circuit.get("operationMode"),
-                        active_program=_V1_PROGRAM_MAP.get(raw_program, raw_program),
-                        target_value=circuit.get("targetValue"),
-                        is_air_quality_guided=bool(air_quality.get("isAirQualityGuided")),
-                        has_error=circuit.get("hasError", False),
+                        "Latest event: type=%s active=%s desc=%s",
+                        parsed_latest.event_type,
+                        parsed_latest.is_active,
+                        parsed_latest.description,
                     )
+                if not events_ok:
+                    _LOGGER.debug("Events list not available for %s", plant_id)
+                elif events_result is _EVENTS_UNCHANGED:
+                    parsed_events = events_cached[1]
+                elif isinstance(events_result, list) and events_result:
+                    parsed_events = [
+                        _parse_event(ev)
+                        for ev in islice(events_result, _MAX_EVENTS)
+                        if isinstance(ev, dict)
+                    ]
+            except Exception:  # noqa: BLE001 — events must never fail the poll
+                _LOGGER.warning(
+                    "Event data for plant %s could not be parsed; "
+                    "reusing cached events for this cycle",
+                    plant_id,
+                    exc_info=True,
+                )
+                latest_ok = events_ok = False
+                parsed_latest = None
+                parsed_events = []
+            # Per-endpoint fallback: a failed half reuses its cached
+            # value instead of wiping it; a successful half is cached
+            # even when EMPTY — otherwise a healthy zero-event plant
+            # would re-fetch both endpoints on every poll and the
+            # cache would never save a single request.
+            if not latest_ok and events_cached is not None:
+                parsed_latest = events_cached[0]
+            list_fetched = events_ok
+            if not events_ok and events_cached is not None:
+                parsed_events = events_cached[1]
+                list_fetched = events_cached[3]
+            if latest_ok or events_ok:
+                self._events_cache[plant_id] = (
+                    parsed_latest,
+                    parsed_events,
+                    now_mono,
+                    list_fetched,
+                )
+            elif events_cached is not None:
+                parsed_latest, parsed_events = events_cached[:2]
+        elif want_events and events_cached is not None:
+            parsed_latest, parsed_events = events_cached[:2]
+        else:
+            # Nobody reads the events, so none are polled; republishing the
+            # last fetched ones would freeze that snapshot (and the error
+            # flag it feeds) indefinitely. The cache is kept: a consumer
+            # registering within its TTL still starts from it.
+            parsed_latest, parsed_events = None, []
+
+        plant_data.latest_event = parsed_latest
+        # Shared with the events cache (no per-poll copy); nothing mutates it.
+        plant_data.events = parsed_events
+        # A circuit may already have flagged the plant; then skip the scan.
+        if not plant_data.has_error and (
+            _is_problem_event(parsed_latest) or any(map(_is_problem_event, parsed_events))
+        ):
+            plant_data.has_error = True
+
+        # --- Weather forecast, cached ---
+        if need_weather:
+            weather_result = all_results[weather_idx]
+            weather_ok = not isinstance(weather_result, BaseException)
+            parsed_weather = None
+            if (
+                weather_ok
+                and isinstance(weather_result, list)
+                and weather_result
+                # First forecast element must be a dict (defence in depth)
+                and isinstance(weather_result[0], dict)
+            ):
+                w = weather_result[0]
+                parsed_weather = HovalWeatherData(
+                    weather_type=w.get("weatherType"),
+                    outside_temperature=w.get("outsideTemperature"),
+                    outside_temperature_min=w.get("outsideTemperatureMin"),
+                )
+            elif not weather_ok:
+                _LOGGER.debug("Weather not available for %s", plant_id)
+            if weather_ok:
+                # Cache even a None result: a plant without forecast
+                # data must not re-fetch weather on every poll.
+                self._weather_cache[plant_id] = (parsed_weather, now_mono)
+            elif weather_cached is not None:
+                parsed_weather = weather_cached[0]
+        else:
+            parsed_weather = weather_cached[0]
+        plant_data.weather = parsed_weather
+
+        return plant_data
+
+    async def _fetch_circuit(
+        self,
+        plant_id: str,
+        path: str,
+        ctype: str,
+        circuit: dict,
+        now: datetime,
+    ) -> HovalCircuitData:
+        """Fetch live values and (when the cache is stale) programs for one circuit."""
+        raw_program = circuit.get("activeProgram")
+        air_quality = circuit.get("airQuality") or {}
+        circuit_data = HovalCircuitData(
+            circuit_type=ctype,
+            path=path,
+            name=circuit.get("name") or ctype,
+            operation_mode=circuit.get("operationMode"),
+            active_program=_V1_PROGRAM_MAP.get(raw_program, raw_program),
+            target_value=circuit.get("targetValue"),
+            is_air_quality_guided=bool(air_quality.get("isAirQualityGuided")),
+            has_error=circuit.get("hasError", False),
+        )
 
-                    # Check program cache
-                    cached_prog = self._program_cache.get(path)
-                    need_programs = (
-                        cached_prog is None
-                        or time.time() - cached_prog[1] > self._program_cache_ttl
-                    )
+        # Check program cache
+        cached_prog = self._program_cache.get((plant_id, path))
+        need_programs = (
+            cached_prog is None or time.monotonic() - cached_prog[1] > self._program_cache_ttl
+        )
 
-                    # Fetch live values (always) + programs (only if cache expired)
-                    live_task = self.api.get_live_values(_plant_id, path, ctype)
-                    if need_programs:
-                        prog_task = self.api.get_programs(_plant_id, path)
-                        results = await asyncio.gather(
-                            live_task,
-                            prog_task,
-                            return_exceptions=True,
-                        )
-                    else:
-                        live_result = await asyncio.gather(
-                            live_task,
-                            return_exceptions=True,
-                        )
-                        results = [live_result[0], cached_prog[0]]
-
-                    if not isinstance(results[0], BaseException):
-                        lv_raw = results[0]
-                        # api.get_live_values() already normalises the wrapper;
-                        # one lightweight guard against future shape regressions.
-                        if not isinstance(lv_raw, list):
-                            _LOGGER.warning(
-                                "Live-values for %s returned unexpected type %s; treating as empty",
-                                path,
-                                type(lv_raw).__name__,
-                            )
-                            lv_raw = []
-                        circuit_data.live_values = {
-                            v["key"]: v["value"]
-                            for v in lv_raw
-                            if isinstance(v, dict) and "key" in v and "value" in v
-                        }
-                        _LOGGER.debug("Circuit %s live_values: %s", path, circuit_data.live_values)
-                    else:
-                        _LOGGER.debug("Live values not available for %s", path)
-
-                    programs = results[1]
-                    if isinstance(programs, dict):
-                        if need_programs:
-                            self._program_cache[path] = (programs, time.time())
-                        # Isolation barrier: any residual exception here must
-                        # degrade the program fields only — never propagate out
-                        # of _fetch_circuit, which would discard the whole
-                        # circuit (incl. its live values) via
-                        # gather(return_exceptions=True).
-                        try:
-                            now = dt_util.now()
-                            week_name, day_name, phase_value = _resolve_active_program_value(
-                                programs, now, circuit_data.active_program
-                            )
-                            circuit_data.active_week_name = week_name
-                            circuit_data.active_day_program_name = day_name
-                            circuit_data.program_air_volume = phase_value
-                            # Extract user-defined program names
-                            w1 = programs.get("week1")
-                            w2 = programs.get("week2")
-                            if isinstance(w1, dict) and w1.get("name"):
-                                circuit_data.program_names["week1"] = w1["name"]
-                            if isinstance(w2, dict) and w2.get("name"):
-                                circuit_data.program_names["week2"] = w2["name"]
-                        except Exception:  # noqa: BLE001 — see isolation note
-                            _LOGGER.warning(
-                                "Program data for circuit %s could not be parsed; "
-                                "program sensors will be unknown this cycle "
-                                "(live values are unaffected)",
-                                path,
-                                exc_info=True,
-                            )
-                    elif isinstance(programs, BaseException):
-                        _LOGGER.debug("Programs not available for %s: %s", path, programs)
-                    else:
-                        _LOGGER.debug(
-                            "Programs endpoint for %s returned %r (type=%s); skipping",
-                            path,
-                            programs,
-                            type(programs).__name__,
-                        )
-
-                    return circuit_data
-
-                # Run circuits in parallel. Plant-level events/weather are only
-                # appended when their cache is stale (they are slow-changing and
-                # plant-scoped, so fetching them every poll wastes round-trips).
-                all_tasks = [
-                    _fetch_circuit(path, ctype, circ) for path, ctype, circ in supported_circuits
-                ]
-                num_circuits = len(all_tasks)
-                now_mono = time.monotonic()
-
-                events_cached = self._events_cache.get(plant_id)
-                need_events = (
-                    events_cached is None or now_mono - events_cached[2] > self._events_cache_ttl
+        # Fetch live values (always) + programs (only if cache expired)
+        live_task = self.api.get_live_values(plant_id, path, ctype)
+        if need_programs:
+            prog_task = self.api.get_programs(plant_id, path)
+            if cached_prog is not None:
+                prog_task = asyncio.wait_for(prog_task, _PROGRAM_REFRESH_TIMEOUT_S)
+            results = await asyncio.gather(
+                live_task,
+                prog_task,
+                return_exceptions=True,
+            )
+            if isinstance(results[1], BaseException) and cached_prog is not None:
+                # Slow or failed refresh: keep the last good schedule and
+                # leave its timestamp alone so the next poll retries.
+                _LOGGER.debug(
+                    "Programs refresh for %s failed (%r); keeping cached schedule",
+                    path,
+                    results[1],
                 )
-                latest_idx = events_idx = None
-                if need_events:
-                    latest_idx = len(all_tasks)
-                    all_tasks.append(self.api.get_latest_event(plant_id))
-                    events_idx = len(all_tasks)
-                    all_tasks.append(self.api.get_events(plant_id))
-
-                weather_cached = self._weather_cache.get(plant_id)
-                need_weather = (
-                    weather_cached is None or now_mono - weather_cached[1] > self._weather_cache_ttl
+                results[1] = cached_prog[0]
+                need_programs = False
+        else:
+            # Only one request: await it directly rather than wrapping it in
+            # a one-element gather; failures land in results like gather's.
+            try:
+                live_result: Any = await live_task
+            except Exception as err:  # noqa: BLE001 — handled below
+                live_result = err
+            results = [live_result, cached_prog[0]]
+
+        previous_plant = self.data.plants.get(plant_id) if self.data is not None else None
+        previous = previous_plant.circuits.get(path) if previous_plant is not None else None
+
+        if not isinstance(results[0], BaseException):
+            lv_raw = results[0]
+            # api.get_live_values() already normalises the wrapper;
+            # one lightweight guard against future shape regressions.
+            if not isinstance(lv_raw, list):
+                _LOGGER.warning(
+                    "Live-values for %s returned unexpected type %s; treating as empty",
+                    path,
+                    type(lv_raw).__name__,
                 )
-                weather_idx = None
-                if need_weather:
-                    weather_idx = len(all_tasks)
-                    all_tasks.append(self.api.get_weather(plant_id))
-
-                all_results = await asyncio.gather(
-                    *all_tasks,
-                    return_exceptions=True,
+                lv_raw = []
+            live_values = _live_values_dict(lv_raw)
+            # Unchanged readings keep last poll's dict, so the circuit
+            # comparison below matches it by identity.
+            if previous is not None and previous.live_values == live_values:
+                live_values = previous.live_values
+            circuit_data.live_values = live_values
+            circuit_data.circuit_status = _normalize_circuit_status(circuit_data.live_values)
+            _LOGGER.debug("Circuit %s live_values: %s", path, circuit_data.live_values)
+        else:
+            _LOGGER.debug("Live values not available for %s", path)
+
+        programs = results[1]
+        if isinstance(programs, dict):
+            if not need_programs:
+                index = cached_prog[2]
+            elif cached_prog is not None and cached_prog[0] is programs:
+                # 304: the API handed back the cached blob, keep its index
+                index = cached_prog[2]
+            else:
+                index = _ProgramIndex(programs)
+            if need_programs:
+                self._program_cache[plant_id, path] = (programs, time.monotonic(), index)
+            # Isolation barrier: any residual exception here must
+            # degrade the program fields only — never propagate out
+            # of _fetch_circuit, which would discard the whole
+            # circuit (incl. its live values) via
+            # gather(return_exceptions=True).
+            try:
+                week_name, day_name, phase_value = _resolve_active_program_value(
+                    programs, now, circuit_data.active_program, index
+                )
+                circuit_data.active_week_name = week_name
+                circuit_data.active_day_program_name = day_name
+                circuit_data.program_air_volume = phase_value
+                # Extract user-defined program names
+                w1 = programs.get("week1")
+                w2 = programs.get("week2")
+                if isinstance(w1, dict) and w1.get("name"):
+                    circuit_data.program_names["week1"] = w1["name"]
+                if isinstance(w2, dict) and w2.get("name"):
+                    circuit_data.program_names["week2"] = w2["name"]
+            except Exception:  # noqa: BLE001 — see isolation note
+                _LOGGER.warning(
+                    "Program data for circuit %s could not be parsed; "
+                    "program sensors will be unknown this cycle "
+                    "(live values are unaffected)",
+                    path,
+                    exc_info=True,
                 )
+        elif isinstance(programs, BaseException):
+            _LOGGER.debug("Programs not available for %s: %s", path, programs)
+        else:
+            _LOGGER.debug(
+                "Programs endpoint for %s returned %r (type=%s); skipping",
+                path,
+                programs,
+                type(programs).__name__,
+            )
+
+        # Hand back last poll's instance when nothing changed: entities
+        # keep the object they cached, and the always_update=False
+        # comparison of the whole snapshot short-circuits on identity.
+        if previous is not None and previous == circuit_data:
+            return previous
+        return circuit_data
+
+    async def _fetch_events(
+        self,
+        plant_id: str,
+        cached: tuple[HovalEventData | None, list[HovalEventData], float, bool] | None,
+    ) -> tuple[Any, Any]:
+        """Fetch the latest event, then the event list unless it cannot have changed.
+
+        With the same, resolved latest event as last time and no active event
+        in a cached list that was actually fetched, nothing was added and
+        nothing is left to resolve, so the list request is skipped and
+        _EVENTS_UNCHANGED stands in for it. A list that never loaded is
+        always retried. Each half is the payload or the exception it raised,
+        as with gather(return_exceptions=True).
+        """
+        try:
+            latest: Any = await self.api.get_latest_event(plant_id)
+        except Exception as err:  # noqa: BLE001 — reported per endpoint
+            latest = err
+        if (
+            cached is not None
+            and cached[3]
+            and isinstance(latest, dict)
+            and (cached[0] is None or not cached[0].is_active)
+            and not any(event.is_active for event in cached[1])
+            and (_parse_event(latest) if latest else None) == cached[0]
+        ):
+            return latest, _EVENTS_UNCHANGED
+        try:
+            events: Any = await self.api.get_events(plant_id)
+        except Exception as err:  # noqa: BLE001 — reported per endpoint
+            events = err
+        return latest, events
 
-                # Process circuit results
-                for result in all_results[:num_circuits]:
-                    if isinstance(result, BaseException):
-                        _LOGGER.debug("Circuit fetch failed: %s", result)
-                        continue
-                    if result.has_error:
-                        plant_data.has_error = True
-                    plant_data.circuits[result.path] = result
-
-                # --- Events (latest + list), cached together ---
-                if need_events:
-                    latest_result = all_results[latest_idx]
-                    events_result = all_results[events_idx]
-                    latest_ok = not isinstance(latest_result, BaseException)
-                    events_ok = not isinstance(events_result, BaseException)
-                    parsed_latest = None
-                    parsed_events: list[HovalEventData] = []
-                    # Isolation barrier: this block runs OUTSIDE the per-circuit
-                    # gather's exception isolation, so a shape surprise here
-                    # (e.g. a pagination wrapper reaching the list slice) would
-                    # fail the ENTIRE poll and take every entity unavailable.
-                    # The API client now normalises both event endpoints; the
-                    # isinstance guards and try/except below are defence in
-                    # depth for anything it hasn't seen yet.
-                    try:
-                        if not latest_ok:
-                            _LOGGER.debug("Events endpoint not available for %s", plant_id)
-                        elif isinstance(latest_result, dict) and latest_result:
-                            parsed_latest = _parse_event(latest_result)
-                            _LOGGER.debug(
-                                "Latest event: type=%s active=%s desc=%s",
-                                parsed_latest.event_type,
-                                parsed_latest.is_active,
-                                parsed_latest.description,
-                            )
-                        if not events_ok:
-                            _LOGGER.debug("Events list not available for %s", plant_id)
-                        elif isinstance(events_result, list) and events_result:
-                            parsed_events = [
-                                _parse_event(ev)
-                                for ev in events_result[:10]
-                                if isinstance(ev, dict)
-                            ]
-                    except Exception:  # noqa: BLE001 — events must never fail the poll
-                        _LOGGER.warning(
-                            "Event data for plant %s could not be parsed; "
-                            "reusing cached events for this cycle",
-                            plant_id,
-                            exc_info=True,
-                        )
-                        latest_ok = events_ok = False
-                        parsed_latest = None
-                        parsed_events = []
-                    # Per-endpoint fallback: a failed half reuses its cached
-                    # value instead of wiping it; a successful half is cached
-                    # even when EMPTY — otherwise a healthy zero-event plant
-                    # would re-fetch both endpoints on every poll and the
-                    # cache would never save a single request.
-                    if not latest_ok and events_cached is not None:
-                        parsed_latest = events_cached[0]
-                    if not events_ok and events_cached is not None:
-                        parsed_events = events_cached[1]
-                    if latest_ok or events_ok:
-                        self._events_cache[plant_id] = (parsed_latest, parsed_events, now_mono)
-                    elif events_cached is not None:
-                        parsed_latest, parsed_events, _ = events_cached
-                else:
-                    parsed_latest, parsed_events, _ = events_cached
-
-                plant_data.latest_event = parsed_latest
-                plant_data.events = list(parsed_events)
-                if parsed_latest is not None and _is_problem_event(parsed_latest):
-                    plant_data.has_error = True
-                else:
-                    for ev in parsed_events:
-                        if _is_problem_event(ev):
-                            plant_data.has_error = True
-                            break
-
-                # --- Weather forecast, cached ---
-                if need_weather:
-                    weather_result = all_results[weather_idx]
-                    weather_ok = not isinstance(weather_result, BaseException)
-                    parsed_weather = None
-                    if (
-                        weather_ok
-                        and isinstance(weather_result, list)
-                        and weather_result
-                        # First forecast element must be a dict (defence in depth)
-                        and isinstance(weather_result[0], dict)
-                    ):
-                        w = weather_result[0]
-                        parsed_weather = HovalWeatherData(
-                            weather_type=w.get("weatherType"),
-                            outside_temperature=w.get("outsideTemperature"),
-                            outside_temperature_min=w.get("outsideTemperatureMin"),
-                        )
-                    elif not weather_ok:
-                        _LOGGER.debug("Weather not available for %s", plant_id)
-                    if weather_ok:
-                        # Cache even a None result: a plant without forecast
-                        # data must not re-fetch weather on every poll.
-                        self._weather_cache[plant_id] = (parsed_weather, now_mono)
-                    elif weather_cached is not None:
-                        parsed_weather = weather_cached[0]
-                else:
-                    parsed_weather = weather_cached[0]
-                plant_data.weather = parsed_weather
-
-                data.plants[plant_id] = plant_data
+    def _prune_caches(self, data: HovalData) -> None:
+        """Drop cache entries for circuits and plants the account no longer has.
+
+        Keys are otherwise never removed, so circuit-path churn on a
+        long-running instance would grow the caches without bound. An offline
+        plant lists no circuits; its schedules are kept for when it returns.
+        """
+        stale = [
+            key
+            for key in self._program_cache
+            if (plant := data.plants.get(key[0])) is None
+            or (plant.is_online and key[1] not in plant.circuits)
+        ]
+        for key in stale:
+            del self._program_cache[key]
+        for cache in (self._events_cache, self._weather_cache):
+            for plant_id in [pid for pid in cache if pid not in data.plants]:
+                del cache[plant_id]
+
+    async def _async_update_data(self) -> HovalData:
+        """Fetch data from the API."""
+        # Timestamp BEFORE any fetch: overrides set after this instant belong
+        # to control actions this poll's data snapshot cannot reflect yet, so
+        # the pruning at the end must leave them alone.
+        poll_start = time.monotonic()
+        data = HovalData()
+
+        try:
+            plants = await self.api.get_plants()
+            # One timezone-aware "now" per poll: every circuit resolves its
+            # program phase against the same instant.
+            now = dt_util.now()
+
+            # Plants are independent: fetch them concurrently so one slow
+            # plant does not add its latency to every other plant's. The
+            # first failure (e.g. a circuits error) still fails the poll, and
+            # the task group cancels the other plants' fetches so they stop
+            # calling the API and filling caches behind the failed poll.
+            try:
+                async with asyncio.TaskGroup() as group:
+                    tasks = [group.create_task(self._fetch_plant(plant, now)) for plant in plants]
+            except ExceptionGroup as failures:
+                # Unwrap for the handlers below; an auth failure wins so it
+                # still starts reauthentication.
+                raise next(
+                    (err for err in failures.exceptions if isinstance(err, HovalAuthError)),
+                    failures.exceptions[0],
+                ) from None
+            for task in tasks:
+                if (plant_data := task.result()) is not None:
+                    data.plants[plant_data.plant_id] = plant_data
 
         except HovalAuthError as err:
             raise ConfigEntryAuthFailed("Authentication failed — check credentials") from err
@@ -690,13 +1053,23 @@ class HovalDataCoordinator(DataUpdateCoordinator[HovalData]):
         # already deduplicates via its `known` set, so firing on the first
         # discovery is a no-op when entities are already present.
         current_circuits = {
-            f"{pid}_{path}" for pid, plant in data.plants.items() for path in plant.circuits
+            (pid, path) for pid, plant in data.plants.items() for path in plant.circuits
         }
         new_circuits = current_circuits - self._known_circuits
         if new_circuits:
             _LOGGER.info("New circuits discovered: %s", new_circuits)
             async_dispatcher_send(self.hass, SIGNAL_NEW_CIRCUITS)
         self._known_circuits = current_circuits
+        self._prune_caches(data)
+
+        unchanged = data == self.data
+        if unchanged:
+            self._idle_polls += 1
+            self.update_interval = _next_idle_interval(
+                self.update_interval, self._base_interval, self._idle_polls
+            )
+        elif self._idle_polls:
+            self._reset_idle_backoff()
 
         # Clear optimistic overrides only after a SUCCESSFUL fetch — fresh data
         # replaces them. Clearing at the start meant a failed refresh snapped
@@ -706,7 +1079,18 @@ class HovalDataCoordinator(DataUpdateCoordinator[HovalData]):
         # the poll's pre-change data snapshot would snap the entity back to
         # its old state. Mid-poll overrides survive until a poll that STARTED
         # after them succeeds (or the TTL in get_mode_override expires).
-        self._mode_override = {
+        if not self._mode_override:
+            # The common case: no control action since the last poll.
+            return data
+        kept = {
             path: entry for path, entry in self._mode_override.items() if entry[1] >= poll_start
         }
+        overrides_dropped = len(kept) != len(self._mode_override)
+        self._mode_override = kept
+        if overrides_dropped and unchanged:
+            # always_update=False suppresses the listener update for
+            # unchanged data, which would leave entities on the optimistic
+            # mode just dropped. The old snapshot equals the new one, so
+            # re-rendering from it now is exact.
+            self.async_update_listeners()
         return data
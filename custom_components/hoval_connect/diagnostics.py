@@ -28,8 +28,11 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     coordinator = entry.runtime_data.coordinator
+    # asdict() deep-copies every circuit's dicts; keep that off the event
+    # loop. Snapshots are never mutated once published, so this is safe.
+    coordinator_data = await hass.async_add_executor_job(asdict, coordinator.data)
 
     return {
         "config_entry": async_redact_data(dict(entry.data), REDACT_CONFIG),
-        "coordinator_data": async_redact_data(asdict(coordinator.data), REDACT_COORDINATOR),
+        "coordinator_data": async_redact_data(coordinator_data, REDACT_COORDINATOR),
     }
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from datetime import datetime
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import HovalConnectConfigEntry, circuit_device_info
@@ -27,12 +30,20 @@ from .const import (
     TURN_ON_RESUME,
     clamp_hv_air_volume,
 )
-from .coordinator import SIGNAL_NEW_CIRCUITS, HovalCircuitData, HovalDataCoordinator
+from .coordinator import (
+    SIGNAL_NEW_CIRCUITS,
+    HovalCircuitData,
+    HovalDataCoordinator,
+    parse_percentage,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 DEBOUNCE_SECONDS = 1.5
 
+# Minimum spacing of optimistic state writes while the slider moves (seconds)
+SLIDER_STATE_COOLDOWN = 0.1
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -41,16 +52,15 @@ async def async_setup_entry(
 ) -> None:
     """Set up Hoval fan entities."""
     coordinator = entry.runtime_data.coordinator
-    known: set[str] = set()
+    known: set[tuple[str, str]] = set()
 
     def _add_new() -> None:
         entities: list[HovalFan] = []
         for plant_id, plant_data in coordinator.data.plants.items():
             for path, circuit in plant_data.circuits.items():
-                uid = f"{plant_id}_{path}_fan"
-                if circuit.circuit_type != CIRCUIT_TYPE_HV or uid in known:
+                if circuit.circuit_type != CIRCUIT_TYPE_HV or (plant_id, path) in known:
                     continue
-                known.add(uid)
+                known.add((plant_id, path))
                 entities.append(HovalFan(coordinator, entry, plant_id, path, circuit))
         if entities:
             async_add_entities(entities)
@@ -89,19 +99,41 @@ class HovalFan(CoordinatorEntity[HovalDataCoordinator], FanEntity):
         self._circuit_path = circuit_path
         self._attr_unique_id = f"{plant_id}_{circuit_path}_fan"
         self._attr_device_info = circuit_device_info(plant_id, circuit_data)
-        self._debounce_task: asyncio.Task | None = None
+        # Resolved once per coordinator update, not on every property read.
+        self._circuit: HovalCircuitData | None = circuit_data
+        # A slider drag re-arms a timer handle per tick; only the send that
+        # follows a quiet period becomes a task.
+        self._debounce_unsub: CALLBACK_TYPE | None = None
+        # Sends still in flight; a slow one can outlast the next debounce.
+        self._send_tasks: set[asyncio.Task] = set()
         self._pending_percentage: int | None = None
+        # Bounds the state_changed rate during a drag: the first tick writes
+        # at once, later ones within the cooldown collapse into one write.
+        self._state_debouncer = Debouncer(
+            coordinator.hass,
+            _LOGGER,
+            cooldown=SLIDER_STATE_COOLDOWN,
+            immediate=True,
+            function=self.async_write_ha_state,
+        )
 
+    @callback
     def _cancel_debounce(self) -> None:
-        """Cancel any pending debounce task safely."""
-        task = self._debounce_task
-        if task is not None and not task.done():
-            task.cancel()
-        self._debounce_task = None
+        """Cancel the debounce timer, if armed."""
+        if self._debounce_unsub is not None:
+            self._debounce_unsub()
+            self._debounce_unsub = None
 
     async def async_will_remove_from_hass(self) -> None:
-        """Cancel pending debounce task on removal."""
+        """Cancel the debounce timer and any in-flight sends on removal."""
         self._cancel_debounce()
+        self._state_debouncer.async_cancel()
+        tasks = list(self._send_tasks)
+        for task in tasks:
+            task.cancel()
+        # Let them unwind before removal completes, so none can write state
+        # on the removed entity.
+        await asyncio.gather(*tasks, return_exceptions=True)
         await super().async_will_remove_from_hass()
 
     @property
@@ -114,14 +146,24 @@ class HovalFan(CoordinatorEntity[HovalDataCoordinator], FanEntity):
         """Get turn-on mode from options (resume, week1, week2)."""
         return self._entry.options.get(CONF_TURN_ON_MODE, DEFAULT_TURN_ON_MODE)
 
-    @property
-    def _circuit(self) -> HovalCircuitData | None:
-        """Get current circuit data from coordinator."""
+    def _lookup_circuit(self) -> HovalCircuitData | None:
+        """Resolve this entity's circuit in the current coordinator data."""
         plant = self.coordinator.data.plants.get(self._plant_id)
         if plant is None:
             return None
         return plant.circuits.get(self._circuit_path)
 
+    async def async_added_to_hass(self) -> None:
+        """Re-resolve the circuit in case a poll landed before registration."""
+        await super().async_added_to_hass()
+        self._circuit = self._lookup_circuit()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached circuit before the state write."""
+        self._circuit = self._lookup_circuit()
+        super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
@@ -152,9 +194,10 @@ class HovalFan(CoordinatorEntity[HovalDataCoordinator], FanEntity):
         val = circuit.target_value
         if val is None:
             val = circuit.live_values.get("airVolume")
-        if val is None:
+        speed = parse_percentage(val)
+        if speed is None:
             return None
-        return max(0, min(100, int(float(val))))
+        return max(0, min(100, speed))
 
     async def _send_percentage(self, percentage: int) -> None:
         """Actually send the percentage to the API (called after debounce).
@@ -205,15 +248,25 @@ class HovalFan(CoordinatorEntity[HovalDataCoordinator], FanEntity):
             self._pending_percentage = None
             self.async_write_ha_state()
 
+    @callback
+    def _async_debounce_elapsed(self, _now: datetime) -> None:
+        """Send the latest slider value once it has been still for DEBOUNCE_SECONDS."""
+        self._debounce_unsub = None
+        percentage = self._pending_percentage
+        if percentage is None:
+            return
+        _LOGGER.debug("Debounce complete, sending %d%%", percentage)
+        task = self.hass.async_create_task(self._debounced_set(percentage))
+        self._send_tasks.add(task)
+        task.add_done_callback(self._send_tasks.discard)
+
     async def _debounced_set(self, percentage: int) -> None:
-        """Wait for debounce period, then send the latest percentage.
+        """Send the debounced percentage.
 
         Runs as a fire-and-forget task, so a raised HomeAssistantError would
         only reach the event loop's unhandled-task logger. Log it at WARNING
         instead — _send_percentage has already reverted the pending state.
         """
-        await asyncio.sleep(DEBOUNCE_SECONDS)
-        _LOGGER.debug("Debounce complete, sending %d%%", percentage)
         try:
             await self._send_percentage(percentage)
         except HomeAssistantError as err:
@@ -242,13 +295,19 @@ class HovalFan(CoordinatorEntity[HovalDataCoordinator], FanEntity):
                     self._pending_percentage = None
                     self.async_write_ha_state()
             return
-        # Store pending value and update UI immediately
+        if percentage == self._pending_percentage and self._debounce_unsub is not None:
+            # Repeated value from the frontend while its send is already
+            # scheduled: nothing to redraw, and re-arming would only push
+            # the send further out.
+            return
+        # Store pending value and update UI (rate-limited during a drag)
         self._pending_percentage = percentage
-        self.async_write_ha_state()
-        # Cancel previous debounce timer
+        await self._state_debouncer.async_call()
+        # Restart the debounce timer
         self._cancel_debounce()
-        # Start new debounce timer
-        self._debounce_task = self.hass.async_create_task(self._debounced_set(percentage))
+        self._debounce_unsub = async_call_later(
+            self.hass, DEBOUNCE_SECONDS, self._async_debounce_elapsed
+        )
 
     async def async_turn_on(
         self,
@@ -283,6 +342,10 @@ class HovalFan(CoordinatorEntity[HovalDataCoordinator], FanEntity):
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off the fan (standby mode)."""
+        if self.coordinator.get_mode_override(self._circuit_path) == OPERATION_MODE_STANDBY:
+            # A standby we sent is still awaiting its confirming poll; a
+            # repeated turn_off (e.g. a script firing twice) adds nothing.
+            return
         try:
             await self.coordinator.async_control_and_refresh(
                 self.coordinator.api.set_circuit_mode(
@@ -18,6 +18,9 @@ from .coordinator import SIGNAL_NEW_CIRCUITS, HovalCircuitData, HovalDataCoordin
 
 _LOGGER = logging.getLogger(__name__)
 
+# Circuit types that run week programs and get a program select
+_PROGRAM_CIRCUIT_TYPES = frozenset({CIRCUIT_TYPE_HV, CIRCUIT_TYPE_HK, CIRCUIT_TYPE_WW})
+
 # API program keys in display order
 API_PROGRAMS = ["week1", "week2", "ecoMode", "standby", "constant"]
 
@@ -38,6 +41,45 @@ DEFAULT_NAMES: dict[str, str] = {
 }
 
 
+def _display_name(api_key: str, program_names: dict[str, str], custom: set[str]) -> str:
+    """Get display name for an API program key.
+
+    If a default name (e.g. "Eco mode") collides with a user-customised
+    schedule name in `program_names` (whose values are `custom`),
+    disambiguate by suffixing the API key — otherwise the `options` list
+    would contain two identical entries and the reverse lookup could never
+    tell them apart.
+    """
+    if api_key in program_names:
+        return program_names[api_key]
+    default = DEFAULT_NAMES.get(api_key, api_key)
+    if default in custom:
+        return f"{default} ({api_key})"
+    return default
+
+
+def _build_name_maps(
+    program_names: dict[str, str],
+) -> tuple[dict[str, str], dict[str, str]]:
+    """Build the API key → display name map and its reverse for one circuit.
+
+    The reverse map accepts each default name, its disambiguated form
+    `"<default> (<api_key>)"`, and every custom name; custom names win so a
+    user-renamed schedule round-trips correctly.
+    """
+    custom = set(program_names.values())
+    to_display = {
+        key: _display_name(key, program_names, custom) for key in (*API_PROGRAMS, *program_names)
+    }
+    to_api: dict[str, str] = {}
+    for key, name in DEFAULT_NAMES.items():
+        to_api[name] = key
+        to_api[f"{name} ({key})"] = key
+    for key, name in program_names.items():
+        to_api[name] = key
+    return to_display, to_api
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: HovalConnectConfigEntry,
@@ -45,19 +87,15 @@ async def async_setup_entry(
 ) -> None:
     """Set up Hoval select entities."""
     coordinator = entry.runtime_data.coordinator
-    known: set[str] = set()
+    known: set[tuple[str, str]] = set()
 
     def _add_new() -> None:
         entities: list[HovalProgramSelect] = []
         for plant_id, plant_data in coordinator.data.plants.items():
             for path, circuit in plant_data.circuits.items():
-                uid = f"{plant_id}_{path}_program"
-                if (
-                    circuit.circuit_type not in (CIRCUIT_TYPE_HV, CIRCUIT_TYPE_HK, CIRCUIT_TYPE_WW)
-                    or uid in known
-                ):
+                if circuit.circuit_type not in _PROGRAM_CIRCUIT_TYPES or (plant_id, path) in known:
                     continue
-                known.add(uid)
+                known.add((plant_id, path))
                 entities.append(HovalProgramSelect(coordinator, plant_id, path, circuit))
         if entities:
             async_add_entities(entities)
@@ -91,58 +129,56 @@ class HovalProgramSelect(CoordinatorEntity[HovalDataCoordinator], SelectEntity):
         self._circuit_path = circuit_path
         self._attr_unique_id = f"{plant_id}_{circuit_path}_program"
         self._attr_device_info = circuit_device_info(plant_id, circuit_data)
-
-    @property
-    def _circuit(self) -> HovalCircuitData | None:
-        """Get current circuit data from coordinator."""
+        # Resolved once per coordinator update, not on every property read.
+        self._circuit: HovalCircuitData | None = circuit_data
+        # Display-name maps, rebuilt only when the circuit's names change.
+        self._program_names: dict[str, str] | None = None
+        self._to_display: dict[str, str] = {}
+        self._to_api: dict[str, str] = {}
+        self._update_name_maps()
+
+    def _lookup_circuit(self) -> HovalCircuitData | None:
+        """Resolve this entity's circuit in the current coordinator data."""
         plant = self.coordinator.data.plants.get(self._plant_id)
         if plant is None:
             return None
         return plant.circuits.get(self._circuit_path)
 
-    def _display_name(self, api_key: str) -> str:
-        """Get display name for an API program key.
+    async def async_added_to_hass(self) -> None:
+        """Re-resolve the circuit in case a poll landed before registration."""
+        await super().async_added_to_hass()
+        self._circuit = self._lookup_circuit()
+        self._update_name_maps()
 
-        If a default name (e.g. "Eco mode") collides with a user-customised
-        schedule name in `program_names`, disambiguate by suffixing the API
-        key — otherwise the `options` list would contain two identical
-        entries and the reverse lookup could never tell them apart.
-        """
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached circuit before the state write."""
+        self._circuit = self._lookup_circuit()
+        self._update_name_maps()
+        super()._handle_coordinator_update()
+
+    def _update_name_maps(self) -> None:
+        """Rebuild the display-name maps if the custom program names changed."""
         circuit = self._circuit
-        if circuit and api_key in circuit.program_names:
-            return circuit.program_names[api_key]
-        default = DEFAULT_NAMES.get(api_key, api_key)
-        if circuit:
-            custom_values = set(circuit.program_names.values())
-            if default in custom_values:
-                return f"{default} ({api_key})"
-        return default
+        program_names = circuit.program_names if circuit is not None else {}
+        if program_names == self._program_names:
+            return
+        self._program_names = program_names
+        self._to_display, self._to_api = _build_name_maps(program_names)
+        self._attr_options = [self._to_display[key] for key in API_PROGRAMS]
 
-    def _api_key_from_display(self, display: str) -> str:
-        """Reverse-lookup: display name → API key.
-
-        Custom `program_names` win (so the user-renamed schedule round-trips
-        correctly). The fallback to DEFAULT_NAMES also accepts the
-        disambiguated form `"<default> (<api_key>)"` emitted by
-        `_display_name` when a default collides with a custom schedule
-        name — without this, "Eco mode (ecoMode)" would fall through to the
-        literal-return branch and the integration would send an invalid
-        API key.
-        """
-        circuit = self._circuit
-        if circuit:
-            for key, name in circuit.program_names.items():
-                if name == display:
-                    return key
-        for key, name in DEFAULT_NAMES.items():
-            if name == display or f"{name} ({key})" == display:
-                return key
-        return display
+    def _display_name(self, api_key: str) -> str:
+        """Get display name for an API program key."""
+        name = self._to_display.get(api_key)
+        if name is None:
+            # A key outside API_PROGRAMS, e.g. an active "manual" program
+            program_names = self._program_names or {}
+            name = _display_name(api_key, program_names, set(program_names.values()))
+        return name
 
-    @property
-    def options(self) -> list[str]:
-        """Return list of program display names."""
-        return [self._display_name(k) for k in API_PROGRAMS]
+    def _api_key_from_display(self, display: str) -> str:
+        """Reverse-lookup: display name → API key (unknown names pass through)."""
+        return self._to_api.get(display, display)
 
     @property
     def available(self) -> bool:
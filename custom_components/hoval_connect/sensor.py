@@ -38,7 +38,13 @@ from .const import (
     CIRCUIT_TYPE_WW,
     DOMAIN,
 )
-from .coordinator import SIGNAL_NEW_CIRCUITS, HovalCircuitData, HovalDataCoordinator, HovalPlantData
+from .coordinator import (
+    SIGNAL_NEW_CIRCUITS,
+    HovalCircuitData,
+    HovalDataCoordinator,
+    HovalPlantData,
+    parse_float,
+)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -54,6 +60,7 @@ class HovalPlantSensorEntityDescription(SensorEntityDescription):
     """Describe a Hoval plant-level sensor entity."""
 
     value_fn: Callable[[HovalPlantData], Any | None]
+    uses_events: bool = False
 
 
 def _coerce_timestamp(value: Any) -> datetime | None:
@@ -403,6 +410,7 @@ PLANT_SENSOR_DESCRIPTIONS: tuple[HovalPlantSensorEntityDescription, ...] = (
         icon="mdi:alert-circle-outline",
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda p: p.latest_event.event_type if p.latest_event else None,
+        uses_events=True,
     ),
     HovalPlantSensorEntityDescription(
         key="latest_event_message",
@@ -410,6 +418,7 @@ PLANT_SENSOR_DESCRIPTIONS: tuple[HovalPlantSensorEntityDescription, ...] = (
         icon="mdi:message-alert-outline",
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda p: p.latest_event.description if p.latest_event else None,
+        uses_events=True,
     ),
     HovalPlantSensorEntityDescription(
         key="latest_event_time",
@@ -417,6 +426,7 @@ PLANT_SENSOR_DESCRIPTIONS: tuple[HovalPlantSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda p: p.latest_event.time_occurred if p.latest_event else None,
+        uses_events=True,
     ),
     HovalPlantSensorEntityDescription(
         key="active_events",
@@ -424,6 +434,7 @@ PLANT_SENSOR_DESCRIPTIONS: tuple[HovalPlantSensorEntityDescription, ...] = (
         icon="mdi:alert",
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda p: sum(1 for e in p.events if e.is_active),
+        uses_events=True,
     ),
     HovalPlantSensorEntityDescription(
         key="weather_condition",
@@ -449,7 +460,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up Hoval sensor entities."""
     coordinator = entry.runtime_data.coordinator
-    known: set[str] = set()
+    # A circuit's (or plant's) descriptions are all decided in one pass, so
+    # track whole circuits and plants: repeated SIGNAL_NEW_CIRCUITS fires skip
+    # them without re-walking every description or re-querying the registry
+    # for filtered ones.
+    known_circuits: set[tuple[str, str]] = set()
+    known_plants: set[str] = set()
 
     ent_reg = er.async_get(hass)
 
@@ -458,8 +474,10 @@ async def async_setup_entry(
         for plant_id, plant_data in coordinator.data.plants.items():
             # Circuit-level sensors
             for path, circuit in plant_data.circuits.items():
+                if (plant_id, path) in known_circuits:
+                    continue
+                known_circuits.add((plant_id, path))
                 for description in CIRCUIT_SENSOR_DESCRIPTIONS:
-                    uid = f"{plant_id}_{path}_{description.key}"
                     # Grandfather entities that already exist in the registry: when a
                     # circuit_types filter is newly added/tightened (e.g.
                     # outside_temperature → HV/HK only in #5), existing users keep the
@@ -467,23 +485,24 @@ async def async_setup_entry(
                     if (
                         description.circuit_types is not None
                         and circuit.circuit_type not in description.circuit_types
-                        and ent_reg.async_get_entity_id("sensor", DOMAIN, uid) is None
+                        and ent_reg.async_get_entity_id(
+                            "sensor", DOMAIN, f"{plant_id}_{path}_{description.key}"
+                        )
+                        is None
                     ):
                         continue
-                    if uid in known:
-                        continue
-                    known.add(uid)
                     entities.append(
                         HovalCircuitSensor(coordinator, plant_id, path, circuit, description)
                     )
 
             # Plant-level sensors
-            for description in PLANT_SENSOR_DESCRIPTIONS:
-                uid = f"{plant_id}_{description.key}"
-                if uid in known:
-                    continue
-                known.add(uid)
-                entities.append(HovalPlantSensor(coordinator, plant_id, plant_data, description))
+            if plant_id in known_plants:
+                continue
+            known_plants.add(plant_id)
+            entities.extend(
+                HovalPlantSensor(coordinator, plant_id, plant_data, description)
+                for description in PLANT_SENSOR_DESCRIPTIONS
+            )
 
         if entities:
             async_add_entities(entities)
@@ -518,44 +537,58 @@ class HovalCircuitSensor(CoordinatorEntity[HovalDataCoordinator], SensorEntity):
         self._circuit_path = circuit_path
         self._attr_unique_id = f"{plant_id}_{circuit_path}_{description.key}"
         self._attr_device_info = circuit_device_info(plant_id, circuit_data)
-
-    @property
-    def _circuit(self) -> HovalCircuitData | None:
-        """Get current circuit data from coordinator."""
+        # How the raw value is coerced depends only on the description.
+        # Monotonic counters are numeric even when unit-less (operation
+        # cycles): route them past the string branch so the negative guard
+        # always applies to them. Other unit-less sensors (program names,
+        # operation mode) are strings.
+        self._is_counter = description.state_class == SensorStateClass.TOTAL_INCREASING
+        self._as_string = description.native_unit_of_measurement is None and not self._is_counter
+        # Resolved once per coordinator update, not on every property read;
+        # the state value likewise, into _attr_native_value.
+        self._circuit: HovalCircuitData | None = circuit_data
+        self._attr_native_value = self._compute_native_value()
+
+    def _lookup_circuit(self) -> HovalCircuitData | None:
+        """Resolve this entity's circuit in the current coordinator data."""
         plant = self.coordinator.data.plants.get(self._plant_id)
         if plant is None:
             return None
         return plant.circuits.get(self._circuit_path)
 
+    async def async_added_to_hass(self) -> None:
+        """Re-resolve the circuit in case a poll landed before registration."""
+        await super().async_added_to_hass()
+        self._circuit = self._lookup_circuit()
+        self._attr_native_value = self._compute_native_value()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached circuit and value before the state write."""
+        self._circuit = self._lookup_circuit()
+        self._attr_native_value = self._compute_native_value()
+        super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return super().available and self._circuit is not None
 
-    @property
-    def native_value(self) -> float | str | None:
-        """Return the sensor value."""
+    def _compute_native_value(self) -> float | str | None:
+        """Derive the sensor value from the cached circuit."""
         circuit = self._circuit
         if circuit is None:
             return None
         val = self.entity_description.value_fn(circuit)
         if val is None:
             return None
-        # Monotonic counters are numeric even when unit-less (operation
-        # cycles): route them past the string branch so the negative guard
-        # below always applies to them.
-        is_counter = self.entity_description.state_class == SensorStateClass.TOTAL_INCREASING
-        # String sensors (program names, operation mode) return as-is
-        if self.entity_description.native_unit_of_measurement is None and not is_counter:
+        if self._as_string:
             return str(val)
-        try:
-            num = float(val)
-        except (ValueError, TypeError):
-            return None
+        num = parse_float(val)
         # Guard monotonic counters: a negative reading is never valid for a
         # TOTAL_INCREASING sensor and would be misread by HA's long-term
         # statistics as a meter reset, injecting a spurious spike. Drop it.
-        if is_counter and num < 0:
+        if num is None or (self._is_counter and num < 0):
             return None
         return num
 
@@ -579,20 +612,33 @@ class HovalPlantSensor(CoordinatorEntity[HovalDataCoordinator], SensorEntity):
         self._plant_id = plant_id
         self._attr_unique_id = f"{plant_id}_{description.key}"
         self._attr_device_info = plant_device_info(plant_data)
+        # Resolved once per coordinator update, not on every property read;
+        # the state value likewise, into _attr_native_value.
+        self._plant: HovalPlantData | None = plant_data
+        self._attr_native_value = self._compute_native_value()
+
+    async def async_added_to_hass(self) -> None:
+        """Register as an event consumer when this sensor reads events."""
+        await super().async_added_to_hass()
+        if self.entity_description.uses_events:
+            self.async_on_remove(self.coordinator.async_add_event_consumer())
+        self._plant = self.coordinator.data.plants.get(self._plant_id)
+        self._attr_native_value = self._compute_native_value()
 
-    @property
-    def _plant(self) -> HovalPlantData | None:
-        """Get current plant data from coordinator."""
-        return self.coordinator.data.plants.get(self._plant_id)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached plant and value before the state write."""
+        self._plant = self.coordinator.data.plants.get(self._plant_id)
+        self._attr_native_value = self._compute_native_value()
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return super().available and self._plant is not None
 
-    @property
-    def native_value(self) -> datetime | float | str | None:
-        """Return the sensor value."""
+    def _compute_native_value(self) -> datetime | float | str | None:
+        """Derive the sensor value from the current plant data."""
         plant = self._plant
         if plant is None:
             return None
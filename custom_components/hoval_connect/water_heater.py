@@ -26,7 +26,12 @@ from .const import (
     OPERATION_MODE_REGULAR,
     OPERATION_MODE_STANDBY,
 )
-from .coordinator import SIGNAL_NEW_CIRCUITS, HovalCircuitData, HovalDataCoordinator
+from .coordinator import (
+    SIGNAL_NEW_CIRCUITS,
+    HovalCircuitData,
+    HovalDataCoordinator,
+    parse_float,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,16 +54,15 @@ async def async_setup_entry(
 ) -> None:
     """Set up Hoval water heater entities for WW circuits."""
     coordinator = entry.runtime_data.coordinator
-    known: set[str] = set()
+    known: set[tuple[str, str]] = set()
 
     def _add_new() -> None:
         entities: list[HovalWaterHeater] = []
         for plant_id, plant_data in coordinator.data.plants.items():
             for path, circuit in plant_data.circuits.items():
-                uid = f"{plant_id}_{path}_water_heater"
-                if circuit.circuit_type != CIRCUIT_TYPE_WW or uid in known:
+                if circuit.circuit_type != CIRCUIT_TYPE_WW or (plant_id, path) in known:
                     continue
-                known.add(uid)
+                known.add((plant_id, path))
                 entities.append(HovalWaterHeater(coordinator, entry, plant_id, path, circuit))
         if entities:
             async_add_entities(entities)
@@ -113,15 +117,27 @@ class HovalWaterHeater(CoordinatorEntity[HovalDataCoordinator], WaterHeaterEntit
         self._circuit_path = circuit_path
         self._attr_unique_id = f"{plant_id}_{circuit_path}_water_heater"
         self._attr_device_info = circuit_device_info(plant_id, circuit_data)
+        # Resolved once per coordinator update, not on every property read.
+        self._circuit: HovalCircuitData | None = circuit_data
 
-    @property
-    def _circuit(self) -> HovalCircuitData | None:
-        """Get current circuit data from coordinator."""
+    def _lookup_circuit(self) -> HovalCircuitData | None:
+        """Resolve this entity's circuit in the current coordinator data."""
         plant = self.coordinator.data.plants.get(self._plant_id)
         if plant is None:
             return None
         return plant.circuits.get(self._circuit_path)
 
+    async def async_added_to_hass(self) -> None:
+        """Re-resolve the circuit in case a poll landed before registration."""
+        await super().async_added_to_hass()
+        self._circuit = self._lookup_circuit()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached circuit before the state write."""
+        self._circuit = self._lookup_circuit()
+        super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
@@ -133,13 +149,9 @@ class HovalWaterHeater(CoordinatorEntity[HovalDataCoordinator], WaterHeaterEntit
         circuit = self._circuit
         if circuit is None:
             return None
-        val = circuit.live_values.get("tempSf1Actual") or circuit.live_values.get("tempActual")
-        if val is not None:
-            try:
-                return float(val)
-            except (ValueError, TypeError):
-                return None
-        return None
+        return parse_float(
+            circuit.live_values.get("tempSf1Actual") or circuit.live_values.get("tempActual")
+        )
 
     @property
     def target_temperature(self) -> float | None:
@@ -147,13 +159,7 @@ class HovalWaterHeater(CoordinatorEntity[HovalDataCoordinator], WaterHeaterEntit
         circuit = self._circuit
         if circuit is None:
             return None
-        val = circuit.live_values.get("tempTarget")
-        if val is not None:
-            try:
-                return float(val)
-            except (ValueError, TypeError):
-                pass
-        return None
+        return parse_float(circuit.live_values.get("tempTarget"))
 
     @property
     def current_operation(self) -> str:
@@ -3,14 +3,30 @@ Hoval Connect API Client - Python Example
 
 Usage:
     from hoval_client import HovalClient
-    client = HovalClient("email@example.com", "password")
-    values = client.get_live_values("YOUR_PLANT_ID", "520.50.0", "HV")
+    with HovalClient("email@example.com", "password") as client:
+        values = client.get_live_values("YOUR_PLANT_ID", "520.50.0", "HV")
 """
 
+import random
+import threading
 import time
 
 import requests
 
+try:
+    # Same optional fast path as the integration; the stdlib decoder is the fallback.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0  # seconds, doubled on each retry
+RETRY_MAX_DELAY = 30.0
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Refresh tokens this long before they expire, so a long-running caller never
+# sends a request with a token that dies in flight.
+TOKEN_REFRESH_MARGIN = 300  # seconds
+
 
 class HovalClient:
     BASE_URL = "https://azure-iot-prod.hoval.com/core"
@@ -22,13 +38,70 @@ class HovalClient:
         self.password = password
         self._id_token = None
         self._id_token_exp = 0
+        self._auth_header = ""  # "Bearer <id token>", rebuilt only on refresh
         self._pat_cache: dict[str, tuple[str, float]] = {}
+        # Serialises token refreshes, so threads sharing a client fetch an
+        # expired token once instead of each racing to replace it. Reentrant:
+        # a plant token refresh needs the id token.
+        self._token_lock = threading.RLock()
+        # One keep-alive pool per thread: the IDP and API hosts are hit
+        # repeatedly, and a bare requests.get() redoes DNS/TCP/TLS every time.
+        # requests.Session is not documented as thread-safe, so threads do
+        # not share one.
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+
+    @property
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+
+    def __enter__(self) -> "HovalClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, retrying transient failures with jittered back-off."""
+        attempt = 0
+        while True:
+            try:
+                resp = self._session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= MAX_RETRIES:
+                    raise
+            else:
+                if resp.status_code not in RETRYABLE_STATUS_CODES or attempt >= MAX_RETRIES:
+                    resp.raise_for_status()
+                    return resp
+            delay = RETRY_BASE_DELAY * 2**attempt * (1 + random.random() * 0.5)
+            time.sleep(min(delay, RETRY_MAX_DELAY))
+            attempt += 1
 
     def _get_id_token(self) -> str:
-        if self._id_token and time.time() < self._id_token_exp - 60:
+        if self._id_token and time.time() < self._id_token_exp - TOKEN_REFRESH_MARGIN:
             return self._id_token
-
-        resp = requests.post(
+        with self._token_lock:
+            # Another thread may have refreshed it while this one waited.
+            if self._id_token and time.time() < self._id_token_exp - TOKEN_REFRESH_MARGIN:
+                return self._id_token
+            return self._refresh_id_token()
+
+    def _refresh_id_token(self) -> str:
+        resp = self._request(
+            "POST",
             self.IDP_URL,
             data={
                 "grant_type": "password",
@@ -38,108 +111,132 @@ class HovalClient:
                 "scope": "openid",
             },
         )
-        resp.raise_for_status()
-        data = resp.json()
-        self._id_token = data["id_token"]
+        data = json_loads(resp.content)
+        # The header goes first: a thread that sees the new token on the fast
+        # path must not read the previous token's header.
+        self._auth_header = f"Bearer {data['id_token']}"
         self._id_token_exp = time.time() + data.get("expires_in", 1800)
+        self._id_token = data["id_token"]
         return self._id_token
 
+    def _authorization(self) -> str:
+        self._get_id_token()
+        return self._auth_header
+
     def _get_plant_access_token(self, plant_id: str) -> str:
         cached = self._pat_cache.get(plant_id)
-        if cached and time.time() < cached[1] - 60:
+        if cached and time.time() < cached[1] - TOKEN_REFRESH_MARGIN:
             return cached[0]
-
-        resp = requests.get(
+        with self._token_lock:
+            cached = self._pat_cache.get(plant_id)
+            if cached and time.time() < cached[1] - TOKEN_REFRESH_MARGIN:
+                return cached[0]
+            return self._refresh_plant_access_token(plant_id)
+
+    def _refresh_plant_access_token(self, plant_id: str) -> str:
+        resp = self._request(
+            "GET",
             f"{self.BASE_URL}/v1/plants/{plant_id}/settings",
-            headers={"Authorization": f"Bearer {self._get_id_token()}"},
+            headers={"Authorization": self._authorization()},
         )
-        resp.raise_for_status()
-        token = resp.json()["token"]
+        token = json_loads(resp.content)["token"]
         self._pat_cache[plant_id] = (token, time.time() + 900)
         return token
 
+    def warm_tokens(self, plant_id: str) -> None:
+        """Fetch the tokens a plant's requests need, ahead of a parallel fan-out."""
+        self._get_plant_access_token(plant_id)
+
     def _headers(self, plant_id: str | None = None) -> dict:
-        h = {"Authorization": f"Bearer {self._get_id_token()}"}
+        h = {"Authorization": self._authorization()}
         if plant_id:
             h["X-Plant-Access-Token"] = self._get_plant_access_token(plant_id)
         return h
 
     def get_plants(self) -> list:
-        resp = requests.get(
+        resp = self._request(
+            "GET",
             f"{self.BASE_URL}/api/my-plants?size=12&page=0",
             headers=self._headers(),
         )
-        resp.raise_for_status()
-        return resp.json()
+        return json_loads(resp.content)
 
     def get_circuits(self, plant_id: str) -> list:
-        resp = requests.get(
+        resp = self._request(
+            "GET",
             f"{self.BASE_URL}/v1/plants/{plant_id}/circuits",
             headers=self._headers(plant_id),
         )
-        resp.raise_for_status()
-        return resp.json()
+        return json_loads(resp.content)
 
     def get_live_values(self, plant_id: str, circuit_path: str, circuit_type: str) -> list:
-        resp = requests.get(
+        resp = self._request(
+            "GET",
             f"{self.BASE_URL}/v3/api/statistics/live-values/{plant_id}",
             params={"circuitPath": circuit_path, "circuitType": circuit_type},
             headers=self._headers(plant_id),
         )
-        resp.raise_for_status()
-        return resp.json()
+        return json_loads(resp.content)
 
     def get_weather(self, plant_id: str) -> list:
-        resp = requests.get(
+        resp = self._request(
+            "GET",
             f"{self.BASE_URL}/v2/api/weather/forecast/{plant_id}",
             headers=self._headers(plant_id),
         )
-        resp.raise_for_status()
-        return resp.json()
+        return json_loads(resp.content)
 
     def get_plant_events(self, plant_id: str) -> list:
-        resp = requests.get(
+        resp = self._request(
+            "GET",
             f"{self.BASE_URL}/v1/plant-events/{plant_id}",
             headers=self._headers(),
         )
-        resp.raise_for_status()
-        return resp.json()
+        return json_loads(resp.content)
 
     def is_online(self, plant_id: str) -> bool:
-        resp = requests.get(
+        resp = self._request(
+            "GET",
             f"{self.BASE_URL}/business/plants/{plant_id}/is-online",
             headers=self._headers(plant_id),
         )
-        resp.raise_for_status()
-        return resp.json()
+        return json_loads(resp.content)
 
 
 if __name__ == "__main__":
     import sys
+    from concurrent.futures import ThreadPoolExecutor
 
     if len(sys.argv) < 3:
         print(f"Usage: python {sys.argv[0]} <email> <password>")
         sys.exit(1)
 
-    client = HovalClient(sys.argv[1], sys.argv[2])
-
-    plants = client.get_plants()
-    print(f"Plants: {plants}")
-
-    for plant in plants:
-        pid = plant["plantExternalId"]
-        print(f"\n--- Plant {pid} ({plant['description']}) ---")
-        print(f"Online: {client.is_online(pid)}")
-
-        circuits = client.get_circuits(pid)
-        for circuit in circuits:
-            if circuit.get("selectable"):
-                path = circuit["path"]
+    with HovalClient(sys.argv[1], sys.argv[2]) as client, ThreadPoolExecutor(8) as pool:
+        plants = client.get_plants()
+        print(f"Plants: {plants}")
+
+        for plant in plants:
+            pid = plant["plantExternalId"]
+            print(f"\n--- Plant {pid} ({plant['description']}) ---")
+
+            # The per-plant endpoints are independent round trips; run them in
+            # parallel (each worker thread keeps its own session). Fetch the
+            # tokens up front so the workers start without waiting on a refresh.
+            client.warm_tokens(pid)
+            online = pool.submit(client.is_online, pid)
+            weather = pool.submit(client.get_weather, pid)
+            events = pool.submit(client.get_plant_events, pid)
+            circuits = [c for c in client.get_circuits(pid) if c.get("selectable")]
+            live = [
+                pool.submit(client.get_live_values, pid, c["path"], c["type"]) for c in circuits
+            ]
+
+            print(f"Online: {online.result()}")
+            for circuit, values in zip(circuits, live, strict=True):
                 ctype = circuit["type"]
-                print(f"\nCircuit: {circuit.get('name', ctype)} ({path})")
-                values = client.get_live_values(pid, path, ctype)
-                for v in values:
+                print(f"\nCircuit: {circuit.get('name', ctype)} ({circuit['path']})")
+                for v in values.result():
                     print(f"  {v['key']}: {v['value']}")
 
-        print(f"\nWeather: {client.get_weather(pid)}")
-        print(f"Events: {client.get_plant_events(pid)}")
+            print(f"\nWeather: {weather.result()}")
+            print(f"Events: {events.result()}")
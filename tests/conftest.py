@@ -0,0 +1,149 @@
+"""Shared test setup: stub Home Assistant so the integration imports without it.
+
+pytest loads this before collecting any test module, so the stub finder is in
+place for every file's top-level imports. Any ``homeassistant`` module the
+integration imports resolves to a MagicMock on demand, so a new HA import
+needs no test change. The few names a coordinator or an entity needs to be
+constructed and driven for real get minimal stand-ins instead (see
+_REAL_NAMES). aiohttp and voluptuous are real test dependencies and are
+left alone.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from typing import Any
+from unittest.mock import MagicMock
+
+
+class _DataUpdateCoordinator[T]:
+    """Just enough of DataUpdateCoordinator to instantiate a subclass."""
+
+    def __init__(self, hass, logger, *, name, update_interval=None, always_update=True, **kwargs):
+        self.hass = hass
+        self.logger = logger
+        self.name = name
+        self.update_interval = update_interval
+        self.always_update = always_update
+        self.data: T | None = None
+
+    def async_update_listeners(self) -> None:
+        pass
+
+    async def async_request_refresh(self) -> None:
+        pass
+
+    async def async_shutdown(self) -> None:
+        pass
+
+
+class _CoordinatorEntity[T]:
+    """Just enough of CoordinatorEntity to instantiate and drive an entity.
+
+    State writes are recorded in `state_writes` instead of reaching a state
+    machine; removal callbacks collect in `on_remove`.
+    """
+
+    def __init__(self, coordinator, context=None):
+        self.coordinator = coordinator
+        self.hass = coordinator.hass
+        self.state_writes = 0
+        self.on_remove = []
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    def async_write_ha_state(self) -> None:
+        self.state_writes += 1
+
+    def async_on_remove(self, func) -> None:
+        self.on_remove.append(func)
+
+    def _handle_coordinator_update(self) -> None:
+        self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        pass
+
+    async def async_will_remove_from_hass(self) -> None:
+        pass
+
+
+class _Entity:
+    """Stand-in for the platform entity base classes (FanEntity, ...)."""
+
+
+@dataclass(frozen=True, kw_only=True)
+class _SensorEntityDescription:
+    """Stand-in for SensorEntityDescription with the fields sensor.py sets."""
+
+    key: str
+    translation_key: str | None = None
+    device_class: Any = None
+    native_unit_of_measurement: Any = None
+    state_class: Any = None
+    entity_category: Any = None
+    icon: str | None = None
+    options: list[str] | None = None
+
+
+class UpdateFailed(Exception):
+    """Stand-in for homeassistant.helpers.update_coordinator.UpdateFailed."""
+
+
+class HomeAssistantError(Exception):
+    """Stand-in for homeassistant.exceptions.HomeAssistantError."""
+
+
+class ConfigEntryAuthFailed(HomeAssistantError):
+    """Stand-in for homeassistant.exceptions.ConfigEntryAuthFailed."""
+
+
+_REAL_NAMES = {
+    "homeassistant.core": {"callback": lambda func: func},
+    "homeassistant.exceptions": {
+        "HomeAssistantError": HomeAssistantError,
+        "ConfigEntryAuthFailed": ConfigEntryAuthFailed,
+    },
+    "homeassistant.helpers.update_coordinator": {
+        "CoordinatorEntity": _CoordinatorEntity,
+        "DataUpdateCoordinator": _DataUpdateCoordinator,
+        "UpdateFailed": UpdateFailed,
+    },
+    # Entity bases must be real classes once CoordinatorEntity is: a class
+    # cannot mix a real base with a MagicMock one.
+    "homeassistant.components.binary_sensor": {"BinarySensorEntity": _Entity},
+    "homeassistant.components.climate": {"ClimateEntity": _Entity},
+    "homeassistant.components.fan": {"FanEntity": _Entity},
+    "homeassistant.components.select": {"SelectEntity": _Entity},
+    "homeassistant.components.sensor": {
+        "SensorEntity": _Entity,
+        "SensorEntityDescription": _SensorEntityDescription,
+    },
+    "homeassistant.components.water_heater": {"WaterHeaterEntity": _Entity},
+}
+
+
+class _HomeAssistantStubFinder(MetaPathFinder, Loader):
+    """Resolve ``homeassistant`` and its submodules to MagicMock modules."""
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname == "homeassistant" or fullname.startswith("homeassistant."):
+            return ModuleSpec(fullname, self, is_package=True)
+        return None
+
+    def create_module(self, spec):
+        module = MagicMock()
+        for attr, value in _REAL_NAMES.get(spec.name, {}).items():
+            setattr(module, attr, value)
+        return module
+
+    def exec_module(self, module):
+        pass
+
+
+sys.meta_path.insert(0, _HomeAssistantStubFinder())
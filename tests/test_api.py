@@ -3,52 +3,44 @@
 from __future__ import annotations
 
 import asyncio
-import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiohttp
 import pytest
 
-# Preserve the real asyncio module
-_real_asyncio = asyncio
-
-# Mock homeassistant modules so we can import without HA installed
-ha_mock = MagicMock()
-sys.modules.setdefault("homeassistant", ha_mock)
-sys.modules.setdefault("homeassistant.config_entries", ha_mock)
-sys.modules.setdefault("homeassistant.const", ha_mock)
-sys.modules.setdefault("homeassistant.core", ha_mock)
-sys.modules.setdefault("homeassistant.exceptions", ha_mock)
-sys.modules.setdefault("homeassistant.helpers", ha_mock)
-sys.modules.setdefault("homeassistant.helpers.update_coordinator", ha_mock)
-sys.modules.setdefault("homeassistant.helpers.aiohttp_client", ha_mock)
-sys.modules.setdefault("homeassistant.helpers.device_registry", ha_mock)
-sys.modules.setdefault("homeassistant.helpers.dispatcher", ha_mock)
-sys.modules.setdefault("homeassistant.util", ha_mock)
-sys.modules.setdefault("homeassistant.util.dt", ha_mock)
-sys.modules.setdefault("voluptuous", ha_mock)
-
-import aiohttp  # noqa: E402
-
-from custom_components.hoval_connect.api import (  # noqa: E402
+from custom_components.hoval_connect.api import (
+    _ETAG_MAX_AGE_S,
     _MAX_RETRIES,
+    _RETRY_JITTER,
+    _RETRY_MAX_DELAY,
     _RETRYABLE_STATUS_CODES,
     HovalApiError,
     HovalAuthError,
     HovalConnectApi,
+    _backoff_delay,
     _minutes_until_local_midnight,
+    _PlantToken,
     build_v4_temporary_change_body,
 )
-from custom_components.hoval_connect.const import (  # noqa: E402
+from custom_components.hoval_connect.const import (
+    BASE_URL,
     DURATION_END_OF_PHASE,
     DURATION_FOUR_HOURS,
     DURATION_MIDNIGHT,
 )
 
+# Preserve the real asyncio module
+_real_asyncio = asyncio
+
 
-def _make_response(status: int, json_data=None, text: str = "") -> MagicMock:
+def _make_response(
+    status: int, json_data=None, text: str = "", headers: dict[str, str] | None = None
+) -> MagicMock:
     """Create a mock aiohttp response."""
     resp = AsyncMock()
     resp.status = status
+    resp.headers = headers or {}
+    resp.content_type = "application/json"
     resp.json = AsyncMock(return_value=json_data or {})
     resp.text = AsyncMock(return_value=text)
     resp.raise_for_status = MagicMock()
@@ -177,6 +169,58 @@ class TestHovalConnectApiAuth:
         # own IDP login; with it, exactly one request goes out.
         assert session.post.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_concurrent_pat_requests_single_flight_per_plant(self):
+        session = _make_session()
+        session.post = MagicMock(return_value=_make_response(200, {"id_token": "tok"}))
+        pat_resp = _make_response(200)
+
+        async def _json_with_suspension() -> dict:
+            await _real_asyncio.sleep(0)
+            return {"token": "pat-123"}
+
+        pat_resp.json = _json_with_suspension
+        session.get = MagicMock(return_value=pat_resp)
+
+        api = HovalConnectApi(session, "test@example.com", "password123")
+        tokens = await _real_asyncio.gather(
+            *(api._get_plant_access_token(pid) for pid in ("p1", "p1", "p1", "p2", "p2"))
+        )
+
+        assert set(tokens) == {"pat-123"}
+        # One settings fetch per plant, not per caller.
+        assert session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_pat_refresh_evicts_expired_entries(self):
+        session = _make_session()
+        session.post = MagicMock(return_value=_make_response(200, {"id_token": "tok"}))
+        session.get = MagicMock(return_value=_make_response(200, {"token": "pat-new"}))
+
+        api = HovalConnectApi(session, "test@example.com", "password123")
+        api._pat_cache["gone"] = _PlantToken("old", 0)
+        api._pat_cache["live"] = _PlantToken("kept", 9999999999)
+
+        assert await api._get_plant_access_token("p1") == "pat-new"
+        assert set(api._pat_cache) == {"live", "p1"}
+
+    @pytest.mark.asyncio
+    async def test_headers_reused_until_a_token_changes(self):
+        api = HovalConnectApi(_make_session(), "test@example.com", "password123")
+        api._id_token = "tok"
+        api._id_token_exp = 9999999999
+        api._pat_cache["p1"] = _PlantToken("pat-1", 9999999999)
+
+        first = await api._headers("p1")
+        assert await api._headers("p1") is first
+        assert first["X-Plant-Access-Token"] == "pat-1"
+
+        api._pat_cache["p1"] = _PlantToken("pat-2", 9999999999)
+        rebuilt = await api._headers("p1")
+        assert rebuilt is not first
+        assert rebuilt["X-Plant-Access-Token"] == "pat-2"
+        assert "X-Plant-Access-Token" not in await api._headers()
+
 
 class TestHovalConnectApiRequest:
     """Tests for the _request method."""
@@ -197,6 +241,34 @@ class TestHovalConnectApiRequest:
 
         assert result == {"data": "test"}
 
+    @pytest.mark.asyncio
+    async def test_request_parses_with_fast_loads(self):
+        from custom_components.hoval_connect.api import _json_loads
+
+        session = _make_session()
+        session.post = MagicMock(return_value=_make_response(200, {"id_token": "token"}))
+        api_resp = _make_response(200, {"data": "test"})
+        session.request = MagicMock(return_value=api_resp)
+
+        api = HovalConnectApi(session, "test@example.com", "pass")
+        await api._request("GET", "/api/test")
+
+        api_resp.json.assert_awaited_once_with(loads=_json_loads)
+
+    @pytest.mark.asyncio
+    async def test_request_url_parsed_once_per_path(self):
+        session = _make_session()
+        session.post = MagicMock(return_value=_make_response(200, {"id_token": "token"}))
+        session.request = MagicMock(return_value=_make_response(200, {"data": "test"}))
+
+        api = HovalConnectApi(session, "test@example.com", "pass")
+        await api._request("GET", "/api/url-cache")
+        await api._request("GET", "/api/url-cache")
+
+        first, second = session.request.call_args_list
+        assert first.args[1] is second.args[1]
+        assert str(first.args[1]) == f"{BASE_URL}/api/url-cache"
+
     @pytest.mark.asyncio
     async def test_request_204_returns_none(self):
         session = _make_session()
@@ -211,6 +283,22 @@ class TestHovalConnectApiRequest:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_request_empty_chunked_body_returns_none(self):
+        """Empty 2xx without Content-Length or JSON content type is not an error."""
+        session = _make_session()
+        session.post = MagicMock(return_value=_make_response(200, {"id_token": "token"}))
+
+        api_resp = _make_response(200)
+        api_resp.content_length = None
+        api_resp.content_type = "application/octet-stream"
+        api_resp.read = AsyncMock(return_value=b"")
+        session.request = MagicMock(return_value=api_resp)
+
+        api = HovalConnectApi(session, "test@example.com", "pass")
+        assert await api._request("GET", "/v1/plant-events/latest/p1") is None
+        api_resp.json.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_request_401_retries_with_fresh_token(self):
         session = _make_session()
@@ -229,6 +317,30 @@ class TestHovalConnectApiRequest:
 
         assert result == {"data": "ok"}
 
+    @pytest.mark.asyncio
+    async def test_request_401_keeps_token_refreshed_concurrently(self):
+        session = _make_session()
+        session.post = MagicMock(return_value=_make_response(200, {"id_token": "old"}))
+        api = HovalConnectApi(session, "test@example.com", "pass")
+        await api._get_id_token()
+
+        resp_401 = _make_response(401)
+        resp_ok = _make_response(200, {"data": "ok"})
+
+        def _request(*args, **kwargs):
+            if session.request.call_count == 1:
+                # Another task refreshed the token while this one was in flight
+                api._id_token = "fresh"
+                return resp_401
+            return resp_ok
+
+        session.request = MagicMock(side_effect=_request)
+        result = await api._request("GET", "/api/test")
+
+        assert result == {"data": "ok"}
+        session.post.assert_called_once()  # no second login
+        assert session.request.call_args.kwargs["headers"]["Authorization"] == "Bearer fresh"
+
     @pytest.mark.asyncio
     async def test_request_401_twice_raises_auth_error(self):
         session = _make_session()
@@ -353,6 +465,33 @@ class TestHovalConnectApiRequest:
 
         assert result == {"data": "ok"}
 
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_capped(self):
+        from custom_components.hoval_connect.api import _MAX_CONCURRENT_REQUESTS
+
+        session = _make_session()
+        session.post = MagicMock(return_value=_make_response(200, {"id_token": "token"}))
+        in_flight = {"now": 0, "peak": 0}
+
+        async def _json_with_suspension(**_kwargs) -> dict:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await _real_asyncio.sleep(0)
+            in_flight["now"] -= 1
+            return {"data": "ok"}
+
+        api_resp = _make_response(200)
+        api_resp.json = _json_with_suspension
+        session.request = MagicMock(return_value=api_resp)
+
+        api = HovalConnectApi(session, "test@example.com", "pass")
+        await api._get_id_token()
+        await _real_asyncio.gather(
+            *(api._request("GET", "/api/test") for _ in range(_MAX_CONCURRENT_REQUESTS * 2))
+        )
+
+        assert in_flight["peak"] == _MAX_CONCURRENT_REQUESTS
+
 
 class TestHovalConnectApiEndpoints:
     """Tests for specific API endpoint methods."""
@@ -429,6 +568,84 @@ class TestHovalConnectApiEndpoints:
 
         assert result == circuits
 
+    @pytest.mark.asyncio
+    async def test_get_circuits_reuses_body_on_304(self):
+        """A 304 answers from the ETag cache; the validator is sent back."""
+        session = _make_session()
+        session.post = MagicMock(return_value=_make_response(200, {"id_token": "token"}))
+        session.get = MagicMock(return_value=_make_response(200, {"token": "pat-123"}))
+
+        circuits = [{"type": "HV", "path": "520.50.0"}]
+        resp_200 = _make_response(200, circuits, headers={"ETag": '"v1"'})
+        resp_304 = _make_response(304)
+        session.request = MagicMock(side_effect=[resp_200, resp_304])
+
+        api = HovalConnectApi(session, "test@example.com", "pass")
+        assert await api.get_circuits("plant-1") == circuits
+        assert await api.get_circuits("plant-1") == circuits
+
+        first, second = session.request.call_args_list
+        assert "If-None-Match" not in first.kwargs["headers"]
+        assert second.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_get_programs_is_etag_validated(self):
+        session = _make_session()
+        session.post = MagicMock(return_value=_make_response(200, {"id_token": "token"}))
+        session.get = MagicMock(return_value=_make_response(200, {"token": "pat-123"}))
+
+        programs = {"week1": {"name": "Normal"}}
+        resp_200 = _make_response(200, programs, headers={"ETag": '"p1"'})
+        session.request = MagicMock(side_effect=[resp_200, _make_response(304)])
+
+        api = HovalConnectApi(session, "test@example.com", "pass")
+        assert await api.get_programs("plant-1", "1.2.3") == programs
+        assert await api.get_programs("plant-1", "1.2.3") == programs
+        assert session.request.call_args.kwargs["headers"]["If-None-Match"] == '"p1"'
+
+    @pytest.mark.asyncio
+    async def test_etag_entry_expires_despite_304s(self):
+        """304s do not renew the entry; past the max age the GET is unconditional."""
+        session = _make_session()
+        session.post = MagicMock(return_value=_make_response(200, {"id_token": "token"}))
+        session.get = MagicMock(return_value=_make_response(200, {"token": "pat-123"}))
+
+        circuits = [{"type": "HV", "path": "520.50.0"}]
+        session.request = MagicMock(
+            side_effect=[
+                _make_response(200, circuits, headers={"ETag": '"v1"'}),
+                _make_response(304),
+                _make_response(200, circuits),
+            ]
+        )
+
+        api = HovalConnectApi(session, "test@example.com", "pass")
+        clock = "custom_components.hoval_connect.api.time.monotonic"
+        with patch(clock, return_value=1000.0):
+            await api.get_circuits("plant-1")
+        with patch(clock, return_value=1000.0 + _ETAG_MAX_AGE_S - 1):
+            assert await api.get_circuits("plant-1") == circuits  # 304, still fresh
+        with patch(clock, return_value=1000.0 + _ETAG_MAX_AGE_S + 1):
+            assert await api.get_circuits("plant-1") == circuits
+
+        second, third = session.request.call_args_list[1:]
+        assert second.kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert "If-None-Match" not in third.kwargs["headers"]
+
+    @pytest.mark.asyncio
+    async def test_unconditional_get_does_not_send_validator(self):
+        session = _make_session()
+        session.post = MagicMock(return_value=_make_response(200, {"id_token": "token"}))
+        resp = _make_response(200, {"data": 1}, headers={"ETag": '"v1"'})
+        session.request = MagicMock(return_value=resp)
+
+        api = HovalConnectApi(session, "test@example.com", "pass")
+        await api._request("GET", "/api/test")
+        await api._request("GET", "/api/test")
+
+        assert api._etag_cache == {}
+        assert "If-None-Match" not in session.request.call_args.kwargs["headers"]
+
     @pytest.mark.asyncio
     async def test_get_live_values_paginated_wrapper(self):
         """get_live_values extracts 'content' when the API returns a paginated wrapper.
@@ -499,6 +716,22 @@ class TestHovalConnectApiEndpoints:
         # Verify _request was used (session.request called)
         session.request.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_plant_settings_is_not_etag_validated(self):
+        """The settings body carries a token; a 304 must never replay it."""
+        session = _make_session()
+        session.post = MagicMock(return_value=_make_response(200, {"id_token": "token"}))
+        session.get = MagicMock(return_value=_make_response(200, {"token": "pat-123"}))
+        resp = _make_response(200, {"token": "pat-123"}, headers={"ETag": '"s1"'})
+        session.request = MagicMock(return_value=resp)
+
+        api = HovalConnectApi(session, "test@example.com", "pass")
+        await api.get_plant_settings("plant-1")
+        await api.get_plant_settings("plant-1")
+
+        assert api._etag_cache == {}
+        assert "If-None-Match" not in session.request.call_args.kwargs["headers"]
+
     @pytest.mark.asyncio
     async def test_set_temporary_change_posts_v4_with_end_of_phase(self):
         session = _make_session()
@@ -520,7 +753,7 @@ class TestHovalConnectApiEndpoints:
         call = session.request.call_args
         # First positional arg is method, second is url
         assert call.args[0] == "POST"
-        assert "/v4/plants/plant-1/circuits/1.2.3/temporary-change" in call.args[1]
+        assert "/v4/plants/plant-1/circuits/1.2.3/temporary-change" in str(call.args[1])
         assert call.kwargs.get("json") == {"type": "endOfPhase", "value": 65}
 
     @pytest.mark.asyncio
@@ -599,7 +832,7 @@ class TestBuildV4TemporaryChangeBody:
     @pytest.mark.asyncio
     async def test_invalidate_plant_token(self):
         api = HovalConnectApi(MagicMock(), "test@example.com", "pass")
-        api._pat_cache["plant-1"] = ("token", 9999999999)
+        api._pat_cache["plant-1"] = _PlantToken("token", 9999999999)
 
         api.invalidate_plant_token("plant-1")
         assert "plant-1" not in api._pat_cache
@@ -627,6 +860,37 @@ class TestRetryConstants:
         assert _MAX_RETRIES >= 2
         assert _MAX_RETRIES <= 5
 
+    def test_backoff_is_jittered_and_capped(self):
+        assert 1.0 <= _backoff_delay(0) <= 1.0 + _RETRY_JITTER
+        assert 2.0 <= _backoff_delay(1) <= 2.0 * (1.0 + _RETRY_JITTER)
+        assert _backoff_delay(10) == _RETRY_MAX_DELAY
+
+    def test_backoff_ladder(self):
+        with patch("custom_components.hoval_connect.api.random.random", return_value=0.0):
+            assert [_backoff_delay(a) for a in range(4)] == [1.0, 2.0, 4.0, _RETRY_MAX_DELAY]
+        with patch("custom_components.hoval_connect.api.random.random", return_value=1.0):
+            assert [_backoff_delay(a) for a in range(3)] == [1.5, 3.0, 6.0]
+
+    def test_retry_after_seconds_honoured_and_clamped(self):
+        assert _backoff_delay(0, "3") == 3.0
+        assert _backoff_delay(0, "600") == _RETRY_MAX_DELAY
+        # HTTP-date form falls back to the computed back-off
+        assert _backoff_delay(0, "Wed, 21 Oct 2026 07:28:00 GMT") <= 1.0 + _RETRY_JITTER
+
+    @pytest.mark.asyncio
+    async def test_request_sleeps_for_retry_after(self):
+        session = _make_session()
+        session.post = MagicMock(return_value=_make_response(200, {"id_token": "token"}))
+        resp_429 = _make_response(429, headers={"Retry-After": "5"})
+        session.request = MagicMock(side_effect=[resp_429, _make_response(200, {"ok": 1})])
+
+        api = HovalConnectApi(session, "test@example.com", "pass")
+        with patch(
+            "custom_components.hoval_connect.api.asyncio.sleep", new_callable=AsyncMock
+        ) as sleep:
+            assert await api._request("GET", "/api/test") == {"ok": 1}
+        sleep.assert_awaited_once_with(5.0)
+
 
 class TestEventEndpointNormalisation:
     """get_events/get_latest_event must normalise shape drift in the client.
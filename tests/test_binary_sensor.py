@@ -0,0 +1,21 @@
+"""Tests for the Hoval Connect binary sensor platform."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from custom_components.hoval_connect.binary_sensor import HovalPlantError
+from custom_components.hoval_connect.coordinator import HovalData, HovalPlantData
+
+
+class TestPlantError:
+    async def test_registers_as_event_consumer_while_added(self):
+        plant = HovalPlantData(plant_id="p1", name="Home", has_error=True)
+        coordinator = MagicMock()
+        coordinator.data = HovalData(plants={"p1": plant})
+        sensor = HovalPlantError(coordinator, "p1", plant)
+
+        await sensor.async_added_to_hass()
+        coordinator.async_add_event_consumer.assert_called_once()
+        assert coordinator.async_add_event_consumer.return_value in sensor.on_remove
+        assert sensor.is_on
@@ -0,0 +1,67 @@
+"""Tests for the Hoval Connect climate entity."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.hoval_connect import climate as climate_module
+from custom_components.hoval_connect.climate import HovalClimate
+from custom_components.hoval_connect.coordinator import (
+    HovalCircuitData,
+    HovalData,
+    HovalPlantData,
+)
+
+
+def _circuit(target: str) -> HovalCircuitData:
+    return HovalCircuitData(
+        circuit_type="HK", path="1.2.3", name="Zone", live_values={"roomTempTarget": target}
+    )
+
+
+def _climate(monkeypatch) -> HovalClimate:
+    """Build a climate entity whose timers are recorded and controls mocked."""
+    monkeypatch.setattr(climate_module, "async_call_later", MagicMock())
+    coordinator = MagicMock()
+    coordinator.async_control_and_refresh = AsyncMock()
+    circuit = _circuit("20.0")
+    coordinator.data = HovalData(
+        plants={"p1": HovalPlantData(plant_id="p1", name="Home", circuits={"1.2.3": circuit})}
+    )
+    return HovalClimate(coordinator, MagicMock(options={}), "p1", "1.2.3", circuit)
+
+
+class TestPendingSetpoint:
+    async def test_held_until_an_update_reports_it(self, monkeypatch):
+        climate = _climate(monkeypatch)
+        await climate.async_set_temperature(temperature=22.5)
+        assert climate.target_temperature == 22.5
+
+        climate._handle_coordinator_update()  # refresh still reports 20.0
+        assert climate.target_temperature == 22.5
+
+        climate.coordinator.data.plants["p1"].circuits["1.2.3"] = _circuit("22.5")
+        climate._handle_coordinator_update()
+        assert climate._pending_temperature is None
+        assert climate.target_temperature == 22.5
+
+    async def test_released_by_timer(self, monkeypatch):
+        climate = _climate(monkeypatch)
+        await climate.async_set_temperature(temperature=22.5)
+        hass, delay, expired = climate_module.async_call_later.call_args.args
+        assert delay == climate_module._PENDING_HOLD_S
+        writes = climate.state_writes
+
+        expired(None)
+        assert climate.target_temperature == 20.0
+        assert climate.state_writes == writes + 1
+
+    async def test_timer_cancelled_on_removal(self, monkeypatch):
+        climate = _climate(monkeypatch)
+        await climate.async_added_to_hass()
+        await climate.async_set_temperature(temperature=22.5)
+        unsub = climate_module.async_call_later.return_value
+
+        for remove in climate.on_remove:
+            remove()
+        unsub.assert_called_once()
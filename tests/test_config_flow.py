@@ -2,32 +2,9 @@
 
 from __future__ import annotations
 
-import sys
-from unittest.mock import MagicMock
-
-# test_api.py/test_coordinator.py stub voluptuous with a MagicMock via
-# sys.modules. This file needs the REAL voluptuous (it is installed as a test
-# dep), so purge a stale mock before importing — order-independent either way.
-if isinstance(sys.modules.get("voluptuous"), MagicMock):
-    del sys.modules["voluptuous"]
-import voluptuous as vol  # noqa: E402
-
-# Mock homeassistant modules so we can import without HA installed
-ha_mock = MagicMock()
-sys.modules.setdefault("homeassistant", ha_mock)
-sys.modules.setdefault("homeassistant.config_entries", ha_mock)
-sys.modules.setdefault("homeassistant.const", ha_mock)
-sys.modules.setdefault("homeassistant.core", ha_mock)
-sys.modules.setdefault("homeassistant.exceptions", ha_mock)
-sys.modules.setdefault("homeassistant.helpers", ha_mock)
-sys.modules.setdefault("homeassistant.helpers.update_coordinator", ha_mock)
-sys.modules.setdefault("homeassistant.helpers.aiohttp_client", ha_mock)
-sys.modules.setdefault("homeassistant.helpers.device_registry", ha_mock)
-sys.modules.setdefault("homeassistant.helpers.dispatcher", ha_mock)
-sys.modules.setdefault("homeassistant.util", ha_mock)
-sys.modules.setdefault("homeassistant.util.dt", ha_mock)
-
-from custom_components.hoval_connect.const import SCAN_INTERVAL_OPTIONS  # noqa: E402
+import voluptuous as vol
+
+from custom_components.hoval_connect.const import SCAN_INTERVAL_OPTIONS
 
 
 def _scan_interval_schema() -> vol.Schema:
@@ -1,219 +1,187 @@
-"""Tests for the Hoval Connect coordinator logic (pure functions).
+"""Tests for the Hoval Connect coordinator logic.
 
-These tests cover the pure utility functions that don't depend on Home Assistant.
-They can be run without homeassistant installed by using sys.path manipulation.
+These tests cover the pure utility functions and the coordinator's fetch and
+cache helpers, driven by a mocked API. They run without homeassistant
+installed; tests/conftest.py stubs its modules.
 """
 
 from __future__ import annotations
 
-import sys
-from datetime import datetime
-from unittest.mock import MagicMock
-
-# Mock homeassistant modules so we can import the coordinator's pure functions
-ha_mock = MagicMock()
-sys.modules["homeassistant"] = ha_mock
-sys.modules["homeassistant.config_entries"] = ha_mock
-sys.modules["homeassistant.const"] = ha_mock
-sys.modules["homeassistant.core"] = ha_mock
-sys.modules["homeassistant.exceptions"] = ha_mock
-sys.modules["homeassistant.helpers"] = ha_mock
-sys.modules["homeassistant.helpers.update_coordinator"] = ha_mock
-sys.modules["homeassistant.helpers.aiohttp_client"] = ha_mock
-sys.modules["homeassistant.helpers.device_registry"] = ha_mock
-sys.modules["homeassistant.helpers.dispatcher"] = ha_mock
-sys.modules["homeassistant.util"] = ha_mock
-sys.modules["homeassistant.util.dt"] = ha_mock
-sys.modules["aiohttp"] = ha_mock
-sys.modules["voluptuous"] = ha_mock
-
-# Now we can import the pure functions and dataclasses
-from custom_components.hoval_connect.const import (  # noqa: E402
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.hoval_connect import _async_options_updated
+from custom_components.hoval_connect import coordinator as coordinator_module
+from custom_components.hoval_connect.api import HovalApiError, HovalAuthError
+from custom_components.hoval_connect.const import (
+    CONF_SCAN_INTERVAL,
     HV_AIR_VOLUME_MAX,
     HV_AIR_VOLUME_MIN,
     clamp_hv_air_volume,
 )
-from custom_components.hoval_connect.coordinator import (  # noqa: E402
+from custom_components.hoval_connect.coordinator import (
+    _EVENTS_UNCHANGED,
+    _IDLE_POLLS_BEFORE_BACKOFF,
     _V1_PROGRAM_MAP,
     HovalCircuitData,
+    HovalData,
+    HovalDataCoordinator,
     HovalEventData,
+    HovalPlantData,
+    _compile_phases,
     _is_problem_event,
+    _live_values_dict,
+    _next_idle_interval,
+    _normalize_circuit_status,
     _parse_event,
+    _phase_value_at,
+    _ProgramIndex,
     _resolve_active_program_value,
+    parse_float,
+    parse_percentage,
     resolve_fan_speed,
 )
 
 
+def _hv_circuit(**fields) -> HovalCircuitData:
+    """Build an HV circuit with the fan-speed inputs given in `fields`."""
+    return HovalCircuitData(circuit_type="HV", path="1.2.3", name="Test", **fields)
+
+
 class TestResolveFanSpeed:
     """Tests for resolve_fan_speed()."""
 
     def test_none_circuit_returns_default(self):
         assert resolve_fan_speed(None) == 40
 
+    def test_malformed_live_air_volume_falls_through(self):
+        circuit = _hv_circuit(live_values={"airVolume": "--"}, target_value=55.0)
+        assert resolve_fan_speed(circuit) == 55
+
     def test_live_air_volume(self):
-        circuit = HovalCircuitData(
-            circuit_type="HV",
-            path="1.2.3",
-            name="Test",
-            live_values={"airVolume": "65"},
-        )
-        assert resolve_fan_speed(circuit) == 65
+        assert resolve_fan_speed(_hv_circuit(live_values={"airVolume": "65"})) == 65
 
     def test_live_air_volume_float(self):
-        circuit = HovalCircuitData(
-            circuit_type="HV",
-            path="1.2.3",
-            name="Test",
-            live_values={"airVolume": "72.5"},
-        )
-        assert resolve_fan_speed(circuit) == 72
+        assert resolve_fan_speed(_hv_circuit(live_values={"airVolume": "72.5"})) == 72
 
     def test_live_zero_falls_through(self):
-        circuit = HovalCircuitData(
-            circuit_type="HV",
-            path="1.2.3",
-            name="Test",
-            live_values={"airVolume": "0"},
-            target_value=50,
-        )
+        circuit = _hv_circuit(live_values={"airVolume": "0"}, target_value=50)
         assert resolve_fan_speed(circuit) == 50
 
     def test_target_value_fallback(self):
-        circuit = HovalCircuitData(
-            circuit_type="HV",
-            path="1.2.3",
-            name="Test",
-            target_value=80,
-        )
-        assert resolve_fan_speed(circuit) == 80
+        assert resolve_fan_speed(_hv_circuit(target_value=80)) == 80
 
     def test_program_air_volume_fallback(self):
-        circuit = HovalCircuitData(
-            circuit_type="HV",
-            path="1.2.3",
-            name="Test",
-            program_air_volume=55.0,
-        )
-        assert resolve_fan_speed(circuit) == 55
+        assert resolve_fan_speed(_hv_circuit(program_air_volume=55.0)) == 55
 
     def test_all_none_returns_default(self):
-        circuit = HovalCircuitData(
-            circuit_type="HV",
-            path="1.2.3",
-            name="Test",
-        )
-        assert resolve_fan_speed(circuit) == 40
+        assert resolve_fan_speed(_hv_circuit()) == 40
 
     def test_minimum_is_one(self):
-        circuit = HovalCircuitData(
-            circuit_type="HV",
-            path="1.2.3",
-            name="Test",
-            live_values={"airVolume": "0"},
-            target_value=0,
-            program_air_volume=0.0,
+        circuit = _hv_circuit(
+            live_values={"airVolume": "0"}, target_value=0, program_air_volume=0.0
         )
         assert resolve_fan_speed(circuit) == 40  # falls through to default
 
 
-class TestResolveActiveProgramValue:
-    """Tests for _resolve_active_program_value()."""
-
-    def _make_programs(
-        self,
-        phases: list[dict] | None = None,
-        day_name: str = "Normal",
-    ) -> dict:
-        """Build a minimal programs structure with both week1 and week2."""
-        if phases is None:
-            phases = [
-                {
-                    "start": {"hours": 6, "minutes": 0},
-                    "end": {"hours": 22, "minutes": 0},
-                    "value": 60,
-                },
-                {
-                    "start": {"hours": 22, "minutes": 0},
-                    "end": {"hours": 23, "minutes": 59},
-                    "value": 30,
-                },
-            ]
-        return {
-            "week1": {
-                "name": "Woche 1",
-                "dayProgramIds": [1, 1, 1, 1, 1, 2, 2],  # Mon-Fri=1, Sat-Sun=2
+# Programs blob with both weeks, shared by the resolver tests. The resolver
+# only reads it; tests that need a different shape build their own.
+_PROGRAMS: dict = {
+    "week1": {
+        "name": "Woche 1",
+        "dayProgramIds": [1, 1, 1, 1, 1, 2, 2],  # Mon-Fri=1, Sat-Sun=2
+    },
+    "week2": {
+        "name": "Sommer",
+        "dayProgramIds": [3, 3, 3, 3, 3, 3, 3],  # Früh+Abend all week
+    },
+    "dayPrograms": {
+        "dayConfigurations": [
+            {
+                "id": 1,
+                "name": "Normal",
+                "phases": [
+                    {
+                        "start": {"hours": 6, "minutes": 0},
+                        "end": {"hours": 22, "minutes": 0},
+                        "value": 60,
+                    },
+                    {
+                        "start": {"hours": 22, "minutes": 0},
+                        "end": {"hours": 23, "minutes": 59},
+                        "value": 30,
+                    },
+                ],
             },
-            "week2": {
-                "name": "Sommer",
-                "dayProgramIds": [3, 3, 3, 3, 3, 3, 3],  # Früh+Abend all week
+            {
+                "id": 2,
+                "name": "Weekend",
+                "phases": [
+                    {
+                        "start": {"hours": 8, "minutes": 0},
+                        "end": {"hours": 22, "minutes": 0},
+                        "value": 50,
+                    },
+                ],
             },
-            "dayPrograms": {
-                "dayConfigurations": [
-                    {"id": 1, "name": day_name, "phases": phases},
+            {
+                "id": 3,
+                "name": "Früh+Abend",
+                "phases": [
                     {
-                        "id": 2,
-                        "name": "Weekend",
-                        "phases": [
-                            {
-                                "start": {"hours": 8, "minutes": 0},
-                                "end": {"hours": 22, "minutes": 0},
-                                "value": 50,
-                            },
-                        ],
+                        "start": {"hours": 0, "minutes": 0},
+                        "end": {"hours": 9, "minutes": 0},
+                        "value": 40,
                     },
                     {
-                        "id": 3,
-                        "name": "Früh+Abend",
-                        "phases": [
-                            {
-                                "start": {"hours": 0, "minutes": 0},
-                                "end": {"hours": 9, "minutes": 0},
-                                "value": 40,
-                            },
-                            {
-                                "start": {"hours": 9, "minutes": 0},
-                                "end": {"hours": 19, "minutes": 0},
-                                "value": 15,
-                            },
-                            {
-                                "start": {"hours": 19, "minutes": 0},
-                                "end": {"hours": 24, "minutes": 0},
-                                "value": 40,
-                            },
-                        ],
+                        "start": {"hours": 9, "minutes": 0},
+                        "end": {"hours": 19, "minutes": 0},
+                        "value": 15,
+                    },
+                    {
+                        "start": {"hours": 19, "minutes": 0},
+                        "end": {"hours": 24, "minutes": 0},
+                        "value": 40,
                     },
                 ],
             },
-        }
+        ],
+    },
+}
+
+
+class TestResolveActiveProgramValue:
+    """Tests for _resolve_active_program_value()."""
 
     def test_monday_morning(self):
-        programs = self._make_programs()
         now = datetime(2024, 1, 8, 10, 0)  # Monday
-        week, day, value = _resolve_active_program_value(programs, now)
+        week, day, value = _resolve_active_program_value(_PROGRAMS, now)
         assert week == "Woche 1"
         assert day == "Normal"
         assert value == 60
 
     def test_monday_night(self):
-        programs = self._make_programs()
         now = datetime(2024, 1, 8, 23, 30)  # Monday
-        week, day, value = _resolve_active_program_value(programs, now)
+        week, day, value = _resolve_active_program_value(_PROGRAMS, now)
         assert week == "Woche 1"
         assert day == "Normal"
         assert value == 30
 
     def test_saturday(self):
-        programs = self._make_programs()
         now = datetime(2024, 1, 13, 12, 0)  # Saturday
-        week, day, value = _resolve_active_program_value(programs, now)
+        week, day, value = _resolve_active_program_value(_PROGRAMS, now)
         assert week == "Woche 1"
         assert day == "Weekend"
         assert value == 50
 
     def test_no_matching_phase(self):
-        programs = self._make_programs()
         now = datetime(2024, 1, 8, 4, 0)  # Monday 4 AM
-        week, day, value = _resolve_active_program_value(programs, now)
+        week, day, value = _resolve_active_program_value(_PROGRAMS, now)
         assert week == "Woche 1"
         assert day == "Normal"
         assert value is None
@@ -235,49 +203,43 @@ class TestResolveActiveProgramValue:
         assert value is None
 
     def test_phase_boundary_start(self):
-        programs = self._make_programs()
         now = datetime(2024, 1, 8, 6, 0)  # Exactly at phase start
-        week, day, value = _resolve_active_program_value(programs, now)
+        week, day, value = _resolve_active_program_value(_PROGRAMS, now)
         assert value == 60
 
     def test_phase_boundary_end(self):
-        programs = self._make_programs()
         now = datetime(2024, 1, 8, 22, 0)  # Exactly at phase end/next start
-        week, day, value = _resolve_active_program_value(programs, now)
+        week, day, value = _resolve_active_program_value(_PROGRAMS, now)
         assert value == 30
 
     def test_active_program_week2_picks_week2(self):
         """User has activeProgram=week2 → must read week2's day config, not week1's."""
-        programs = self._make_programs()
         now = datetime(2024, 1, 8, 10, 0)  # Monday 10:00
-        week, day, value = _resolve_active_program_value(programs, now, "week2")
+        week, day, value = _resolve_active_program_value(_PROGRAMS, now, "week2")
         assert week == "Sommer"
         assert day == "Früh+Abend"
         assert value == 15  # 09:00–19:00 phase
 
     def test_active_program_week1_explicit(self):
         """Explicit week1 must behave identically to default."""
-        programs = self._make_programs()
         now = datetime(2024, 1, 8, 10, 0)  # Monday
-        week, day, value = _resolve_active_program_value(programs, now, "week1")
+        week, day, value = _resolve_active_program_value(_PROGRAMS, now, "week1")
         assert week == "Woche 1"
         assert day == "Normal"
         assert value == 60
 
     def test_active_program_ecomode_falls_back_to_week1(self):
         """Non-weekly active programs (ecoMode, standby, …) fall back to week1."""
-        programs = self._make_programs()
         now = datetime(2024, 1, 8, 10, 0)
-        week, day, value = _resolve_active_program_value(programs, now, "ecoMode")
+        week, day, value = _resolve_active_program_value(_PROGRAMS, now, "ecoMode")
         assert week == "Woche 1"  # fallback
         assert day == "Normal"
         assert value == 60
 
     def test_default_active_program_none_falls_back_to_week1(self):
         """Backwards-compat: callers passing no active_program still get week1."""
-        programs = self._make_programs()
         now = datetime(2024, 1, 8, 10, 0)
-        week, day, value = _resolve_active_program_value(programs, now)
+        week, day, value = _resolve_active_program_value(_PROGRAMS, now)
         assert week == "Woche 1"
 
 
@@ -378,6 +340,52 @@ class TestIsProblemEvent:
         assert _is_problem_event(HovalEventData(event_type=None)) is False
 
 
+class TestNormalizeCircuitStatus:
+    """hvac_action relies on the status being upper-cased once per poll."""
+
+    def test_status_is_upper_cased(self):
+        assert _normalize_circuit_status({"status": "heating"}) == "HEATING"
+
+    def test_legacy_circuit_status_fallback(self):
+        assert _normalize_circuit_status({"circuitStatus": "Cooling"}) == "COOLING"
+
+    def test_status_key_wins(self):
+        live = {"status": "idle", "circuitStatus": "heating"}
+        assert _normalize_circuit_status(live) == "IDLE"
+
+    def test_missing_or_non_string_is_none(self):
+        assert _normalize_circuit_status({}) is None
+        assert _normalize_circuit_status({"status": 3}) is None
+
+
+class TestParseFloat:
+    def test_numeric_strings_and_numbers(self):
+        assert parse_float("21.5") == 21.5
+        assert parse_float(21) == 21.0
+        assert parse_float(21.5) == 21.5
+
+    def test_missing_or_malformed_is_none(self):
+        assert parse_float(None) is None
+        assert parse_float("") is None
+        assert parse_float("n/a") is None
+        assert parse_float({"value": 1}) is None
+
+
+class TestParsePercentage:
+    def test_truncates_strings_and_numbers(self):
+        assert parse_percentage("55.9") == 55
+        assert parse_percentage("40") == 40
+        assert parse_percentage(62.5) == 62
+        assert parse_percentage(70) == 70
+
+    def test_missing_malformed_or_non_finite_is_none(self):
+        assert parse_percentage(None) is None
+        assert parse_percentage(True) is None
+        assert parse_percentage("n/a") is None
+        assert parse_percentage("nan") is None
+        assert parse_percentage(float("inf")) is None
+
+
 class TestClampHvAirVolume:
     """HA allows 1-14 %, the HV firmware band starts at 15 %."""
 
@@ -401,6 +409,46 @@ class TestClampHvAirVolume:
         assert clamp_hv_air_volume(54.9) == 54
 
 
+class TestLiveValuesDict:
+    def test_well_formed_entries(self):
+        entries = [{"key": "airVolume", "value": "40"}, {"key": "status", "value": "ON"}]
+        assert _live_values_dict(entries) == {"airVolume": "40", "status": "ON"}
+
+    def test_malformed_entries_are_skipped(self):
+        entries = [{"key": "a", "value": "1"}, {"key": "b"}, "junk", ["k", "v"]]
+        assert _live_values_dict(entries) == {"a": "1"}
+
+
+class TestPhaseLookup:
+    PHASES = [
+        {"start": {"hours": 19, "minutes": 0}, "end": {"hours": 24, "minutes": 0}, "value": 40},
+        {"start": {"hours": 6, "minutes": 0}, "end": {"hours": 9, "minutes": 0}, "value": 55},
+    ]
+
+    def test_unsorted_phases_found_by_start(self):
+        compiled = _compile_phases(self.PHASES)
+        assert _phase_value_at(compiled, 6 * 60) == 55
+        assert _phase_value_at(compiled, 20 * 60) == 40
+
+    def test_gaps_and_boundaries(self):
+        compiled = _compile_phases(self.PHASES)
+        assert _phase_value_at(compiled, 5 * 60 + 59) is None
+        assert _phase_value_at(compiled, 9 * 60) is None  # end is exclusive
+        assert _phase_value_at(_compile_phases([]), 600) is None
+
+    def test_index_compiles_each_day_once(self):
+        day = {"id": 1, "phases": self.PHASES}
+        index = _ProgramIndex({"dayPrograms": {"dayConfigurations": [day]}})
+        assert index.phases_for(day) is index.phases_for(day)
+
+    def test_index_builds_day_lookup_once(self):
+        day = {"id": 1, "phases": self.PHASES}
+        index = _ProgramIndex({"dayPrograms": {"dayConfigurations": [day]}})
+        by_id = index.config_by_id([day])
+        assert by_id == {1: day}
+        assert index.config_by_id([day]) is by_id
+
+
 class TestResolveActiveProgramRobustness:
     """Nested schema drift must degrade to None fields, never raise.
 
@@ -563,3 +611,534 @@ class TestCacheTtls:
 
     def test_program_ttl_unchanged(self):
         assert _timedelta(minutes=5) == PROGRAM_CACHE_TTL
+
+
+class TestNextIdleInterval:
+    """Tests for _next_idle_interval()."""
+
+    def test_stays_at_base_before_threshold(self):
+        base = timedelta(seconds=60)
+        assert _next_idle_interval(base, base, 2) == base
+
+    def test_doubles_once_idle(self):
+        base = timedelta(seconds=60)
+        assert _next_idle_interval(base, base, 3) == timedelta(seconds=120)
+        assert _next_idle_interval(timedelta(seconds=120), base, 4) == timedelta(seconds=240)
+
+    def test_capped_at_five_minutes(self):
+        base = timedelta(seconds=60)
+        assert _next_idle_interval(timedelta(seconds=240), base, 5) == timedelta(minutes=5)
+
+    def test_never_below_base(self):
+        base = timedelta(minutes=10)
+        assert _next_idle_interval(base, base, 10) == base
+
+
+_RESOLVED_RAW = {"eventType": "warning", "code": 7, "timeOccurred": "t0", "timeResolved": "t1"}
+_ACTIVE_RAW = {"eventType": "blocking", "code": 9, "timeOccurred": "t2", "timeResolved": None}
+
+
+def _coordinator(latest=None, events=None) -> HovalDataCoordinator:
+    """Build a coordinator whose API returns `latest` and `events`."""
+    api = MagicMock()
+    api.get_latest_event = AsyncMock(return_value=latest)
+    api.get_events = AsyncMock(return_value=events if events is not None else [])
+    return HovalDataCoordinator(MagicMock(), api)
+
+
+class TestFetchEvents:
+    """Tests for HovalDataCoordinator._fetch_events()."""
+
+    async def test_fetches_list_without_cache(self):
+        coordinator = _coordinator(latest=_RESOLVED_RAW, events=[_RESOLVED_RAW])
+        assert await coordinator._fetch_events("p1", None) == (_RESOLVED_RAW, [_RESOLVED_RAW])
+        coordinator.api.get_events.assert_awaited_once_with("p1")
+
+    async def test_skips_list_when_latest_unchanged_and_nothing_active(self):
+        coordinator = _coordinator(latest=_RESOLVED_RAW)
+        resolved = _parse_event(_RESOLVED_RAW)
+        cached = (resolved, [resolved], 0.0, True)
+        assert await coordinator._fetch_events("p1", cached) == (_RESOLVED_RAW, _EVENTS_UNCHANGED)
+        coordinator.api.get_events.assert_not_awaited()
+
+    async def test_fetches_list_while_a_cached_event_is_active(self):
+        coordinator = _coordinator(latest=_RESOLVED_RAW, events=[_RESOLVED_RAW])
+        cached = (_parse_event(_RESOLVED_RAW), [_parse_event(_ACTIVE_RAW)], 0.0, True)
+        _, events = await coordinator._fetch_events("p1", cached)
+        assert events == [_RESOLVED_RAW]
+        coordinator.api.get_events.assert_awaited_once()
+
+    async def test_fetches_list_when_latest_changed(self):
+        coordinator = _coordinator(latest=_ACTIVE_RAW, events=[_ACTIVE_RAW])
+        resolved = _parse_event(_RESOLVED_RAW)
+        _, events = await coordinator._fetch_events("p1", (resolved, [resolved], 0.0, True))
+        assert events == [_ACTIVE_RAW]
+
+    async def test_retries_list_that_never_loaded(self):
+        coordinator = _coordinator(latest=_RESOLVED_RAW, events=[_ACTIVE_RAW])
+        cached = (_parse_event(_RESOLVED_RAW), [], 0.0, False)
+        assert await coordinator._fetch_events("p1", cached) == (_RESOLVED_RAW, [_ACTIVE_RAW])
+
+    async def test_fetches_list_while_latest_is_active(self):
+        coordinator = _coordinator(latest=_ACTIVE_RAW, events=[_ACTIVE_RAW])
+        cached = (_parse_event(_ACTIVE_RAW), [], 0.0, True)
+        assert await coordinator._fetch_events("p1", cached) == (_ACTIVE_RAW, [_ACTIVE_RAW])
+
+    async def test_latest_error_is_returned_and_list_still_fetched(self):
+        coordinator = _coordinator(events=[_RESOLVED_RAW])
+        err = RuntimeError("boom")
+        coordinator.api.get_latest_event.side_effect = err
+        resolved = _parse_event(_RESOLVED_RAW)
+        assert await coordinator._fetch_events("p1", (resolved, [], 0.0, True)) == (
+            err,
+            [_RESOLVED_RAW],
+        )
+
+    async def test_list_error_is_returned(self):
+        coordinator = _coordinator(latest=_RESOLVED_RAW)
+        err = RuntimeError("boom")
+        coordinator.api.get_events.side_effect = err
+        assert await coordinator._fetch_events("p1", None) == (_RESOLVED_RAW, err)
+
+
+class TestPruneCaches:
+    """Tests for HovalDataCoordinator._prune_caches()."""
+
+    @staticmethod
+    def _filled(coordinator: HovalDataCoordinator) -> None:
+        for plant_id in ("online", "offline", "gone"):
+            coordinator._program_cache[(plant_id, "1.2.3")] = (None, 0.0, None)
+            coordinator._events_cache[plant_id] = (None, [], 0.0, True)
+            coordinator._weather_cache[plant_id] = (None, 0.0)
+        coordinator._program_cache[("online", "9.9.9")] = (None, 0.0, None)
+
+    def test_drops_vanished_circuits_and_plants(self):
+        coordinator = _coordinator()
+        self._filled(coordinator)
+        data = HovalData(
+            plants={
+                "online": HovalPlantData(
+                    plant_id="online", name="A", circuits={"1.2.3": _hv_circuit()}
+                ),
+                "offline": HovalPlantData(plant_id="offline", name="B", is_online=False),
+            }
+        )
+        coordinator._prune_caches(data)
+        assert set(coordinator._program_cache) == {("online", "1.2.3"), ("offline", "1.2.3")}
+        assert set(coordinator._events_cache) == {"online", "offline"}
+        assert set(coordinator._weather_cache) == {"online", "offline"}
+
+    def test_empty_account_clears_everything(self):
+        coordinator = _coordinator()
+        self._filled(coordinator)
+        coordinator._prune_caches(HovalData())
+        assert not coordinator._program_cache
+        assert not coordinator._events_cache
+        assert not coordinator._weather_cache
+
+    async def test_poll_prunes_vanished_plant(self, monkeypatch):
+        coordinator = _polling_coordinator(monkeypatch)
+        self._filled(coordinator)
+        await coordinator._async_update_data()
+        assert "gone" not in coordinator._events_cache
+        assert "gone" not in coordinator._weather_cache
+        assert ("gone", "1.2.3") not in coordinator._program_cache
+
+
+class TestEventsWithoutConsumers:
+    """Tests for the event fields _async_update_data publishes."""
+
+    @staticmethod
+    def _coordinator() -> HovalDataCoordinator:
+        coordinator = _coordinator(latest=_ACTIVE_RAW, events=[_ACTIVE_RAW])
+        coordinator.api.get_plants = AsyncMock(
+            return_value=[{"plantExternalId": "p1", "description": "Home"}]
+        )
+        coordinator.api.get_circuits = AsyncMock(return_value=[])
+        coordinator.api.get_weather = AsyncMock(return_value=[])
+        return coordinator
+
+    async def test_first_refresh_publishes_events(self):
+        coordinator = self._coordinator()
+        plant = (await coordinator._async_update_data()).plants["p1"]
+        assert plant.latest_event == _parse_event(_ACTIVE_RAW)
+        assert plant.has_error
+
+    async def test_unread_events_are_not_republished(self):
+        coordinator = self._coordinator()
+        coordinator.data = await coordinator._async_update_data()
+        plant = (await coordinator._async_update_data()).plants["p1"]
+        assert plant.latest_event is None
+        assert plant.events == []
+        assert not plant.has_error
+        coordinator.api.get_events.assert_awaited_once()
+
+    async def test_consumer_reads_cached_events_within_ttl(self):
+        coordinator = self._coordinator()
+        coordinator.data = await coordinator._async_update_data()
+        coordinator.async_add_event_consumer()
+        plant = (await coordinator._async_update_data()).plants["p1"]
+        assert plant.events == [_parse_event(_ACTIVE_RAW)]
+        coordinator.api.get_events.assert_awaited_once()
+
+    async def test_events_not_polled_without_consumers(self):
+        coordinator = self._coordinator()
+        coordinator.data = await coordinator._async_update_data()
+        coordinator._events_cache_ttl = -1.0
+        await coordinator._async_update_data()
+        coordinator.api.get_latest_event.assert_awaited_once()
+
+    async def test_polling_follows_consumer_registration(self):
+        coordinator = self._coordinator()
+        coordinator.data = await coordinator._async_update_data()
+        coordinator._events_cache_ttl = -1.0
+        remove = coordinator.async_add_event_consumer()
+        await coordinator._async_update_data()
+        assert coordinator.api.get_latest_event.await_count == 2
+
+        remove()
+        await coordinator._async_update_data()
+        assert coordinator.api.get_latest_event.await_count == 2
+
+    async def test_poll_skips_list_for_same_resolved_latest(self):
+        coordinator = _coordinator(latest=_RESOLVED_RAW, events=[_RESOLVED_RAW])
+        coordinator.api.get_plants = AsyncMock(
+            return_value=[{"plantExternalId": "p1", "description": "Home"}]
+        )
+        coordinator.api.get_circuits = AsyncMock(return_value=[])
+        coordinator.api.get_weather = AsyncMock(return_value=[])
+        coordinator.async_add_event_consumer()
+        coordinator.data = await coordinator._async_update_data()
+        coordinator._events_cache_ttl = -1.0
+        plant = (await coordinator._async_update_data()).plants["p1"]
+        assert coordinator.api.get_latest_event.await_count == 2
+        coordinator.api.get_events.assert_awaited_once()
+        assert plant.events == [_parse_event(_RESOLVED_RAW)]
+
+    async def test_failed_list_is_fetched_again(self):
+        coordinator = self._coordinator()
+        coordinator.api.get_latest_event.return_value = _RESOLVED_RAW
+        coordinator.api.get_events.side_effect = [RuntimeError("boom"), [_ACTIVE_RAW]]
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.data.plants["p1"].events == []
+        coordinator.async_add_event_consumer()
+        coordinator._events_cache_ttl = -1.0  # every poll is past the TTL
+        plant = (await coordinator._async_update_data()).plants["p1"]
+        assert plant.events == [_parse_event(_ACTIVE_RAW)]
+        assert plant.has_error
+
+
+class TestPlantFanOut:
+    """Tests for the per-plant fan-out in _async_update_data()."""
+
+    @staticmethod
+    def _coordinator(get_circuits) -> HovalDataCoordinator:
+        coordinator = _coordinator()
+        coordinator.api.get_plants = AsyncMock(
+            return_value=[{"plantExternalId": "a"}, {"plantExternalId": "b"}]
+        )
+        coordinator.api.get_circuits = get_circuits
+        coordinator.api.get_weather = AsyncMock(return_value=[])
+        return coordinator
+
+    async def test_plants_fetched_concurrently(self):
+        started: list[str] = []
+        both_started = asyncio.Event()
+
+        async def get_circuits(plant_id):
+            started.append(plant_id)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), 1)
+            return []
+
+        data = await self._coordinator(get_circuits)._async_update_data()
+        assert set(data.plants) == {"a", "b"}
+
+    async def test_failed_plant_cancels_the_others(self):
+        cancelled = asyncio.Event()
+
+        async def get_circuits(plant_id):
+            if plant_id == "b":
+                await asyncio.sleep(0)
+                raise HovalApiError("down")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(UpdateFailed):
+            await self._coordinator(get_circuits)._async_update_data()
+        assert cancelled.is_set()
+
+    async def test_auth_failure_wins_over_api_error(self):
+        async def get_circuits(plant_id):
+            raise HovalAuthError("expired") if plant_id == "b" else HovalApiError("down")
+
+        with pytest.raises(ConfigEntryAuthFailed):
+            await self._coordinator(get_circuits)._async_update_data()
+
+
+class TestControlRefresh:
+    """Tests for async_control_and_refresh() and its background refresh."""
+
+    @staticmethod
+    def _coordinator(monkeypatch) -> HovalDataCoordinator:
+        monkeypatch.setattr(coordinator_module, "_CONTROL_REFRESH_DELAY_S", 0.01)
+        coordinator = _coordinator()
+        coordinator.hass.async_create_background_task = lambda target, name, **kwargs: (
+            asyncio.get_running_loop().create_task(target)
+        )
+        coordinator.async_update_listeners = MagicMock()
+        coordinator.async_request_refresh = AsyncMock()
+        return coordinator
+
+    @staticmethod
+    async def _control(coordinator: HovalDataCoordinator, mode: str = "constant") -> None:
+        await coordinator.async_control_and_refresh(AsyncMock()(), "1.2.3", mode)
+
+    async def test_optimistic_state_pushed_before_refresh(self, monkeypatch):
+        coordinator = self._coordinator(monkeypatch)
+        await self._control(coordinator, "standby")
+        assert coordinator.get_mode_override("1.2.3") == "standby"
+        coordinator.async_update_listeners.assert_called_once()
+        coordinator.async_request_refresh.assert_not_awaited()
+        assert not coordinator.control_lock.locked()
+        await asyncio.gather(*coordinator._control_refresh_tasks)
+        coordinator.async_request_refresh.assert_awaited_once()
+
+    async def test_actions_within_settle_delay_share_one_refresh(self, monkeypatch):
+        coordinator = self._coordinator(monkeypatch)
+        await self._control(coordinator)
+        await self._control(coordinator)
+        await asyncio.gather(*coordinator._control_refresh_tasks)
+        coordinator.async_request_refresh.assert_awaited_once()
+
+    async def test_shutdown_cancels_every_refresh_in_flight(self, monkeypatch):
+        coordinator = self._coordinator(monkeypatch)
+        refreshing = asyncio.Event()
+
+        async def slow_refresh():
+            refreshing.set()
+            await asyncio.sleep(10)
+
+        coordinator.async_request_refresh = slow_refresh
+        await self._control(coordinator)
+        await asyncio.wait_for(refreshing.wait(), 1)
+        # An action during that refresh needs a poll that starts after it.
+        await self._control(coordinator)
+        tasks = set(coordinator._control_refresh_tasks)
+        assert len(tasks) == 2
+
+        await coordinator.async_shutdown()
+        assert all(task.cancelled() for task in tasks)
+        assert not coordinator._control_refresh_tasks
+
+
+_HV_RAW = {"type": "HV", "path": "1.2.3", "name": "Vent", "selectable": True}
+_POLL_NOW = datetime(2024, 1, 8, 10, 0)  # Monday, in _PROGRAMS' "Normal" phase
+
+
+def _polling_coordinator(monkeypatch, circuits=(_HV_RAW,)) -> HovalDataCoordinator:
+    """Build a coordinator whose API serves one online plant with `circuits`."""
+    monkeypatch.setattr(coordinator_module.dt_util, "now", lambda: _POLL_NOW)
+    coordinator = _coordinator()
+    api = coordinator.api
+    api.get_plants = AsyncMock(return_value=[{"plantExternalId": "p1", "description": "Home"}])
+    api.get_circuits = AsyncMock(return_value=list(circuits))
+    api.get_live_values = AsyncMock(return_value=[{"key": "airVolume", "value": "40"}])
+    api.get_programs = AsyncMock(return_value=_PROGRAMS)
+    api.get_weather = AsyncMock(return_value=[])
+    return coordinator
+
+
+class TestUnchangedDataSkipsListeners:
+    """Tests for polls that return the same data as the previous one."""
+
+    def test_coordinator_opts_out_of_always_update(self):
+        assert _coordinator().always_update is False
+
+    async def test_dropped_override_notifies_on_unchanged_poll(self, monkeypatch):
+        coordinator = _polling_coordinator(monkeypatch)
+        coordinator.data = await coordinator._async_update_data()
+        coordinator.set_mode_override("1.2.3", "standby")
+        coordinator.async_update_listeners = MagicMock()
+
+        assert await coordinator._async_update_data() == coordinator.data
+        assert coordinator.get_mode_override("1.2.3") is None
+        # always_update=False skips the fan-out for equal data; the dropped
+        # optimistic mode still has to reach the entities.
+        coordinator.async_update_listeners.assert_called_once()
+
+    async def test_unchanged_poll_without_overrides_stays_quiet(self, monkeypatch):
+        coordinator = _polling_coordinator(monkeypatch)
+        coordinator.data = await coordinator._async_update_data()
+        coordinator.async_update_listeners = MagicMock()
+        await coordinator._async_update_data()
+        coordinator.async_update_listeners.assert_not_called()
+
+
+class TestIdleBackoff:
+    """Tests for the poll interval stretching while the data stays unchanged."""
+
+    @staticmethod
+    async def _idle(coordinator: HovalDataCoordinator) -> timedelta:
+        """Poll until the back-off kicks in; return the configured interval."""
+        base = coordinator.update_interval
+        coordinator.data = await coordinator._async_update_data()
+        for _ in range(_IDLE_POLLS_BEFORE_BACKOFF):
+            coordinator.data = await coordinator._async_update_data()
+        assert coordinator.update_interval == base * 2
+        return base
+
+    async def test_grows_while_idle_and_resets_on_change(self, monkeypatch):
+        coordinator = _polling_coordinator(monkeypatch)
+        base = await self._idle(coordinator)
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.update_interval == base * 4
+
+        coordinator.api.get_live_values.return_value = [{"key": "airVolume", "value": "55"}]
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.update_interval == base
+
+    async def test_control_action_resets(self, monkeypatch):
+        monkeypatch.setattr(coordinator_module, "_CONTROL_REFRESH_DELAY_S", 0.01)
+        coordinator = _polling_coordinator(monkeypatch)
+        coordinator.hass.async_create_background_task = lambda target, name, **kwargs: (
+            asyncio.get_running_loop().create_task(target)
+        )
+        coordinator.async_request_refresh = AsyncMock()
+        base = await self._idle(coordinator)
+
+        await coordinator.async_control_and_refresh(AsyncMock()(), "1.2.3", "constant")
+        assert coordinator.update_interval == base
+        await coordinator.async_shutdown()
+
+    async def test_options_update_applies_new_base(self, monkeypatch):
+        coordinator = _polling_coordinator(monkeypatch)
+        await self._idle(coordinator)
+        entry = MagicMock(options={CONF_SCAN_INTERVAL: 120})
+        entry.runtime_data.coordinator = coordinator
+
+        await _async_options_updated(MagicMock(), entry)
+        assert coordinator.update_interval == timedelta(seconds=120)
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.update_interval == timedelta(seconds=120)
+
+
+class TestInstanceReuse:
+    """Tests for handing back last poll's objects when nothing changed."""
+
+    async def test_unchanged_circuit_reuses_previous_instance(self, monkeypatch):
+        coordinator = _polling_coordinator(monkeypatch)
+        coordinator.data = await coordinator._async_update_data()
+        previous = coordinator.data.plants["p1"].circuits["1.2.3"]
+        data = await coordinator._async_update_data()
+        assert data.plants["p1"].circuits["1.2.3"] is previous
+
+    async def test_changed_circuit_keeps_unchanged_live_values(self, monkeypatch):
+        coordinator = _polling_coordinator(monkeypatch)
+        coordinator.data = await coordinator._async_update_data()
+        previous = coordinator.data.plants["p1"].circuits["1.2.3"]
+        coordinator.api.get_circuits.return_value = [{**_HV_RAW, "operationMode": "STANDBY"}]
+
+        circuit = (await coordinator._async_update_data()).plants["p1"].circuits["1.2.3"]
+        assert circuit is not previous
+        assert circuit.operation_mode == "STANDBY"
+        assert circuit.live_values is previous.live_values
+
+    async def test_offline_plant_reuses_previous_instance(self, monkeypatch):
+        coordinator = _polling_coordinator(monkeypatch)
+        coordinator.api.get_plants.return_value = [
+            {"plantExternalId": "p1", "description": "Home", "isOnline": False}
+        ]
+        coordinator.data = await coordinator._async_update_data()
+        previous = coordinator.data.plants["p1"]
+        assert not previous.is_online
+
+        assert (await coordinator._async_update_data()).plants["p1"] is previous
+        coordinator.api.get_circuits.assert_not_awaited()
+
+    async def test_renamed_offline_plant_is_rebuilt(self, monkeypatch):
+        coordinator = _polling_coordinator(monkeypatch)
+        coordinator.api.get_plants.return_value = [
+            {"plantExternalId": "p1", "description": "Home", "isOnline": False}
+        ]
+        coordinator.data = await coordinator._async_update_data()
+        coordinator.api.get_plants.return_value = [
+            {"plantExternalId": "p1", "description": "Cabin", "isOnline": False}
+        ]
+        assert (await coordinator._async_update_data()).plants["p1"].name == "Cabin"
+
+
+class TestPollClock:
+    async def test_now_resolved_once_per_poll(self, monkeypatch):
+        second = {**_HV_RAW, "path": "1.2.4"}
+        coordinator = _polling_coordinator(monkeypatch, circuits=(_HV_RAW, second))
+        now = MagicMock(return_value=_POLL_NOW)
+        monkeypatch.setattr(coordinator_module.dt_util, "now", now)
+
+        data = await coordinator._async_update_data()
+        now.assert_called_once()
+        # Both circuits resolved their program phase against that instant.
+        assert [c.program_air_volume for c in data.plants["p1"].circuits.values()] == [60, 60]
+
+
+class TestProgramRefresh:
+    """Tests for the program cache around _fetch_circuit()."""
+
+    @staticmethod
+    async def _expired(monkeypatch) -> HovalDataCoordinator:
+        """Poll once to fill the program cache, then let it expire."""
+        coordinator = _polling_coordinator(monkeypatch)
+        coordinator.data = await coordinator._async_update_data()
+        coordinator._program_cache_ttl = -1.0
+        return coordinator
+
+    async def test_slow_refresh_falls_back_to_cache(self, monkeypatch):
+        monkeypatch.setattr(coordinator_module, "_PROGRAM_REFRESH_TIMEOUT_S", 0.01)
+        coordinator = await self._expired(monkeypatch)
+        stored_at = coordinator._program_cache["p1", "1.2.3"][1]
+
+        async def slow_programs(plant_id, path):
+            await asyncio.sleep(10)
+
+        coordinator.api.get_programs = slow_programs
+        circuit = (await coordinator._async_update_data()).plants["p1"].circuits["1.2.3"]
+        assert circuit.program_air_volume == 60
+        # The timestamp stays put, so the next poll retries the refresh.
+        assert coordinator._program_cache["p1", "1.2.3"][1] == stored_at
+
+    async def test_failed_refresh_falls_back_to_cache(self, monkeypatch):
+        coordinator = await self._expired(monkeypatch)
+        coordinator.api.get_programs.side_effect = HovalApiError("down")
+        circuit = (await coordinator._async_update_data()).plants["p1"].circuits["1.2.3"]
+        assert circuit.active_week_name == "Woche 1"
+
+    async def test_fetch_circuit_called_directly(self, monkeypatch):
+        coordinator = _polling_coordinator(monkeypatch)
+        circuit = await coordinator._fetch_circuit("p1", "1.2.3", "HV", _HV_RAW, _POLL_NOW)
+        assert circuit.name == "Vent"
+        assert circuit.live_values == {"airVolume": "40"}
+        assert circuit.program_air_volume == 60
+        assert ("p1", "1.2.3") in coordinator._program_cache
+
+    async def test_cache_hit_fetches_live_values_only(self, monkeypatch):
+        coordinator = _polling_coordinator(monkeypatch)
+        coordinator.data = await coordinator._async_update_data()
+        coordinator.api.get_live_values.return_value = [{"key": "airVolume", "value": "55"}]
+
+        circuit = (await coordinator._async_update_data()).plants["p1"].circuits["1.2.3"]
+        coordinator.api.get_programs.assert_awaited_once()
+        assert circuit.live_values == {"airVolume": "55"}
+        assert circuit.program_air_volume == 60
+
+    async def test_cache_hit_survives_live_values_failure(self, monkeypatch):
+        coordinator = _polling_coordinator(monkeypatch)
+        coordinator.data = await coordinator._async_update_data()
+        coordinator.api.get_live_values.side_effect = HovalApiError("down")
+
+        circuit = (await coordinator._async_update_data()).plants["p1"].circuits["1.2.3"]
+        assert circuit.live_values == {}
+        assert circuit.program_air_volume == 60
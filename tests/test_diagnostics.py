@@ -2,30 +2,14 @@
 
 from __future__ import annotations
 
-import sys
-from unittest.mock import MagicMock
-
-# Mock homeassistant modules
-ha_mock = MagicMock()
-sys.modules.setdefault("homeassistant", ha_mock)
-sys.modules.setdefault("homeassistant.config_entries", ha_mock)
-sys.modules.setdefault("homeassistant.const", ha_mock)
-sys.modules.setdefault("homeassistant.core", ha_mock)
-sys.modules.setdefault("homeassistant.exceptions", ha_mock)
-sys.modules.setdefault("homeassistant.helpers", ha_mock)
-sys.modules.setdefault("homeassistant.helpers.update_coordinator", ha_mock)
-sys.modules.setdefault("homeassistant.helpers.aiohttp_client", ha_mock)
-sys.modules.setdefault("homeassistant.helpers.device_registry", ha_mock)
-sys.modules.setdefault("homeassistant.helpers.dispatcher", ha_mock)
-sys.modules.setdefault("homeassistant.util", ha_mock)
-sys.modules.setdefault("homeassistant.util.dt", ha_mock)
-sys.modules.setdefault("homeassistant.components.diagnostics", ha_mock)
-sys.modules.setdefault("aiohttp", ha_mock)
-sys.modules.setdefault("voluptuous", ha_mock)
-
-from custom_components.hoval_connect.diagnostics import (  # noqa: E402
+from dataclasses import asdict
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.hoval_connect.coordinator import HovalData
+from custom_components.hoval_connect.diagnostics import (
     REDACT_CONFIG,
     REDACT_COORDINATOR,
+    async_get_config_entry_diagnostics,
 )
 
 
@@ -50,3 +34,18 @@ class TestRedactionSets:
         assert "name" in REDACT_COORDINATOR
         assert "description" in REDACT_COORDINATOR
         assert "source_path" in REDACT_COORDINATOR
+
+
+class TestSerialization:
+    async def test_snapshot_serialized_in_executor(self):
+        hass = MagicMock()
+        hass.async_add_executor_job = AsyncMock(return_value={"plants": {}})
+        entry = MagicMock()
+        entry.data = {}
+        entry.runtime_data.coordinator.data = HovalData()
+
+        await async_get_config_entry_diagnostics(hass, entry)
+
+        hass.async_add_executor_job.assert_awaited_once_with(
+            asdict, entry.runtime_data.coordinator.data
+        )
@@ -0,0 +1,138 @@
+"""Tests for the Hoval Connect fan entity."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.hoval_connect import fan as fan_module
+from custom_components.hoval_connect.const import OPERATION_MODE_STANDBY
+from custom_components.hoval_connect.coordinator import HovalCircuitData
+from custom_components.hoval_connect.fan import HovalFan
+
+
+def _fan(monkeypatch) -> HovalFan:
+    """Build a fan whose timers are recorded and whose control calls are mocked."""
+    monkeypatch.setattr(fan_module, "async_call_later", MagicMock())
+    coordinator = MagicMock()
+    coordinator.hass.async_create_task = lambda coro: asyncio.get_running_loop().create_task(coro)
+    coordinator.get_mode_override.return_value = None
+    coordinator.async_control_and_refresh = AsyncMock()
+    circuit = HovalCircuitData(circuit_type="HV", path="1.2.3", name="Vent")
+    fan = HovalFan(coordinator, MagicMock(options={}), "p1", "1.2.3", circuit)
+    fan._state_debouncer = MagicMock(async_call=AsyncMock())
+    return fan
+
+
+class TestSendTasks:
+    async def test_removal_cancels_every_send_in_flight(self, monkeypatch):
+        fan = _fan(monkeypatch)
+
+        async def slow_control(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        fan.coordinator.async_control_and_refresh = slow_control
+        fan._pending_percentage = 50
+        fan._async_debounce_elapsed(None)
+        fan._pending_percentage = 60
+        fan._async_debounce_elapsed(None)
+        tasks = set(fan._send_tasks)
+        assert len(tasks) == 2
+        await asyncio.sleep(0)
+
+        await fan.async_will_remove_from_hass()
+        assert all(task.cancelled() for task in tasks)
+        assert not fan._send_tasks
+
+    async def test_finished_send_is_forgotten(self, monkeypatch):
+        fan = _fan(monkeypatch)
+        fan._pending_percentage = 50
+        fan._async_debounce_elapsed(None)
+        await asyncio.gather(*fan._send_tasks)
+        await asyncio.sleep(0)
+        assert not fan._send_tasks
+        assert fan._pending_percentage is None
+
+
+class TestDebounce:
+    async def test_slider_ticks_rearm_one_timer(self, monkeypatch):
+        fan = _fan(monkeypatch)
+        timer = fan_module.async_call_later
+        await fan.async_set_percentage(50)
+        first_unsub = timer.return_value
+        timer.return_value = MagicMock()
+        await fan.async_set_percentage(55)
+
+        first_unsub.assert_called_once()
+        assert timer.call_count == 2
+        assert timer.call_args.args[1] == fan_module.DEBOUNCE_SECONDS
+        assert fan.percentage == 55
+        assert not fan._send_tasks
+
+    async def test_quiet_period_sends_latest_value(self, monkeypatch):
+        fan = _fan(monkeypatch)
+        await fan.async_set_percentage(50)
+        await fan.async_set_percentage(55)
+        elapsed = fan_module.async_call_later.call_args.args[2]
+
+        elapsed(None)
+        await asyncio.gather(*fan._send_tasks)
+        fan.coordinator.api.set_temporary_change.assert_called_once_with(
+            "p1", "1.2.3", value=55, duration=fan._override_duration
+        )
+        fan.coordinator.async_control_and_refresh.assert_awaited_once()
+
+    async def test_repeated_value_keeps_armed_timer(self, monkeypatch):
+        fan = _fan(monkeypatch)
+        await fan.async_set_percentage(50)
+        await fan.async_set_percentage(50)
+
+        fan_module.async_call_later.assert_called_once()
+        fan_module.async_call_later.return_value.assert_not_called()
+        fan._state_debouncer.async_call.assert_awaited_once()
+
+    async def test_value_repeated_after_send_is_sent_again(self, monkeypatch):
+        fan = _fan(monkeypatch)
+        await fan.async_set_percentage(50)
+        fan_module.async_call_later.call_args.args[2](None)
+        await asyncio.gather(*fan._send_tasks)
+        await fan.async_set_percentage(50)
+        assert fan_module.async_call_later.call_count == 2
+
+
+class TestTurnOff:
+    async def test_sends_standby(self, monkeypatch):
+        fan = _fan(monkeypatch)
+        await fan.async_turn_off()
+        fan.coordinator.api.set_circuit_mode.assert_called_once_with(
+            "p1", "1.2.3", OPERATION_MODE_STANDBY
+        )
+        fan.coordinator.async_control_and_refresh.assert_awaited_once()
+
+    async def test_repeat_skipped_while_standby_unconfirmed(self, monkeypatch):
+        fan = _fan(monkeypatch)
+        fan.coordinator.get_mode_override.return_value = OPERATION_MODE_STANDBY
+        await fan.async_turn_off()
+        fan.coordinator.api.set_circuit_mode.assert_not_called()
+        fan.coordinator.async_control_and_refresh.assert_not_awaited()
+
+
+class TestSliderStateWrites:
+    async def test_slider_writes_go_through_the_state_debouncer(self, monkeypatch):
+        debouncer = MagicMock()
+        monkeypatch.setattr(fan_module, "Debouncer", debouncer)
+        fan = _fan(monkeypatch)
+        kwargs = debouncer.call_args.kwargs
+        assert kwargs["cooldown"] == fan_module.SLIDER_STATE_COOLDOWN
+        assert kwargs["immediate"] is True
+        assert kwargs["function"] == fan.async_write_ha_state
+
+        await fan.async_set_percentage(50)
+        await fan.async_set_percentage(55)
+        assert fan._state_debouncer.async_call.await_count == 2
+        assert fan.state_writes == 0
+
+    async def test_state_debouncer_cancelled_on_removal(self, monkeypatch):
+        fan = _fan(monkeypatch)
+        await fan.async_will_remove_from_hass()
+        fan._state_debouncer.async_cancel.assert_called_once()
@@ -0,0 +1,79 @@
+"""Tests for the Hoval Connect integration setup."""
+
+from __future__ import annotations
+
+import ssl
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.exceptions import ConfigEntryAuthFailed
+
+import custom_components.hoval_connect as init_module
+
+
+class TestDedicatedSession:
+    async def test_session_keeps_connections_past_a_poll(self, monkeypatch):
+        monkeypatch.setattr(init_module, "client_context", ssl.create_default_context)
+        session = init_module._create_session()
+        try:
+            assert session.connector._keepalive_timeout == init_module._KEEPALIVE_TIMEOUT_S
+            assert init_module._KEEPALIVE_TIMEOUT_S > 60  # the default scan interval
+        finally:
+            await session.close()
+
+    @staticmethod
+    def _patched(monkeypatch, first_refresh: AsyncMock):
+        """Stub the session, API and coordinator; return (session, hass, entry)."""
+        session = MagicMock(close=AsyncMock())
+        monkeypatch.setattr(init_module, "_create_session", lambda: session)
+        monkeypatch.setattr(init_module, "HovalConnectApi", MagicMock())
+        coordinator_cls = MagicMock()
+        coordinator_cls.return_value.async_config_entry_first_refresh = first_refresh
+        monkeypatch.setattr(init_module, "HovalDataCoordinator", coordinator_cls)
+        hass = MagicMock()
+        entry = MagicMock(data={"email": "a@b.c", "password": "pw"}, options={})
+        entry.unload_callbacks = []
+        entry.async_on_unload = entry.unload_callbacks.append
+        return session, hass, entry
+
+    async def test_session_closed_when_first_refresh_fails(self, monkeypatch):
+        refresh = AsyncMock(side_effect=ConfigEntryAuthFailed("bad login"))
+        session, hass, entry = self._patched(monkeypatch, refresh)
+
+        with pytest.raises(ConfigEntryAuthFailed):
+            await init_module.async_setup_entry(hass, entry)
+        # Home Assistant runs the unload callbacks of a failed setup too.
+        assert session.close in entry.unload_callbacks
+
+    async def test_session_closed_when_home_assistant_stops(self, monkeypatch):
+        session, hass, entry = self._patched(monkeypatch, AsyncMock())
+        hass.config_entries.async_forward_entry_setups = AsyncMock()
+
+        assert await init_module.async_setup_entry(hass, entry)
+        event_type, close_listener = hass.bus.async_listen_once.call_args.args
+        assert event_type is init_module.EVENT_HOMEASSISTANT_CLOSE
+        assert hass.bus.async_listen_once.return_value in entry.unload_callbacks
+
+        await close_listener(MagicMock())
+        session.close.assert_awaited_once()
+
+
+class TestUnload:
+    @staticmethod
+    def _hass(unloaded: bool) -> MagicMock:
+        hass = MagicMock()
+        hass.config_entries.async_unload_platforms = AsyncMock(return_value=unloaded)
+        hass.config_entries.async_entries.return_value = []
+        return hass
+
+    async def test_unload_shuts_coordinator_down(self):
+        entry = MagicMock()
+        entry.runtime_data.coordinator.async_shutdown = AsyncMock()
+        assert await init_module.async_unload_entry(self._hass(True), entry)
+        entry.runtime_data.coordinator.async_shutdown.assert_awaited_once()
+
+    async def test_failed_unload_keeps_coordinator_running(self):
+        entry = MagicMock()
+        entry.runtime_data.coordinator.async_shutdown = AsyncMock()
+        assert not await init_module.async_unload_entry(self._hass(False), entry)
+        entry.runtime_data.coordinator.async_shutdown.assert_not_awaited()
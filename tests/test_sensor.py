@@ -0,0 +1,164 @@
+"""Tests for the Hoval Connect sensor platform."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from custom_components.hoval_connect import sensor as sensor_module
+from custom_components.hoval_connect.coordinator import (
+    HovalCircuitData,
+    HovalData,
+    HovalEventData,
+    HovalPlantData,
+)
+from custom_components.hoval_connect.sensor import (
+    CIRCUIT_SENSOR_DESCRIPTIONS,
+    PLANT_SENSOR_DESCRIPTIONS,
+    HovalCircuitSensor,
+    HovalPlantSensor,
+    HovalPlantSensorEntityDescription,
+    HovalSensorEntityDescription,
+)
+
+
+def _plant(air_volume: str = "40", name: str = "Home") -> HovalPlantData:
+    circuit = HovalCircuitData(
+        circuit_type="HV", path="1.2.3", name="Vent", live_values={"airVolume": air_volume}
+    )
+    return HovalPlantData(plant_id="p1", name=name, circuits={"1.2.3": circuit})
+
+
+def _coordinator(plant: HovalPlantData) -> MagicMock:
+    coordinator = MagicMock()
+    coordinator.data = HovalData(plants={"p1": plant})
+    return coordinator
+
+
+class TestSensorValueCaching:
+    def test_circuit_value_computed_once_per_update(self):
+        value_fn = MagicMock(side_effect=lambda c: c.live_values.get("airVolume"))
+        description = HovalSensorEntityDescription(
+            key="air_volume", native_unit_of_measurement="%", value_fn=value_fn
+        )
+        plant = _plant()
+        coordinator = _coordinator(plant)
+        sensor = HovalCircuitSensor(
+            coordinator, "p1", "1.2.3", plant.circuits["1.2.3"], description
+        )
+        assert sensor._attr_native_value == 40.0
+        assert value_fn.call_count == 1
+
+        coordinator.data = HovalData(plants={"p1": _plant("55")})
+        sensor._handle_coordinator_update()
+        assert sensor._attr_native_value == 55.0
+        assert value_fn.call_count == 2
+        assert sensor.state_writes == 1
+
+    def test_circuit_gone_clears_value(self):
+        description = HovalSensorEntityDescription(
+            key="air_volume",
+            native_unit_of_measurement="%",
+            value_fn=lambda c: c.live_values.get("airVolume"),
+        )
+        plant = _plant()
+        coordinator = _coordinator(plant)
+        sensor = HovalCircuitSensor(
+            coordinator, "p1", "1.2.3", plant.circuits["1.2.3"], description
+        )
+        coordinator.data = HovalData()
+        sensor._handle_coordinator_update()
+        assert sensor._attr_native_value is None
+        assert not sensor.available
+
+    def test_plant_sensor_caches_plant(self):
+        description = HovalPlantSensorEntityDescription(key="plant_name", value_fn=lambda p: p.name)
+        plant = _plant()
+        coordinator = _coordinator(plant)
+        sensor = HovalPlantSensor(coordinator, "p1", plant, description)
+        assert sensor._attr_native_value == "Home"
+
+        renamed = _plant(name="Cabin")
+        coordinator.data = HovalData(plants={"p1": renamed})
+        sensor._handle_coordinator_update()
+        assert sensor._plant is renamed
+        assert sensor._attr_native_value == "Cabin"
+
+        coordinator.data = HovalData()
+        sensor._handle_coordinator_update()
+        assert not sensor.available
+
+
+class TestSensorDiscovery:
+    @staticmethod
+    async def _setup(monkeypatch, plant: HovalPlantData):
+        """Set the platform up; return (coordinator, add_entities, registry, signal)."""
+        registry = MagicMock()
+        registry.async_get_entity_id.return_value = None
+        monkeypatch.setattr(sensor_module.er, "async_get", lambda hass: registry)
+        connect = MagicMock()
+        monkeypatch.setattr(sensor_module, "async_dispatcher_connect", connect)
+        coordinator = _coordinator(plant)
+        entry = MagicMock()
+        entry.runtime_data.coordinator = coordinator
+        add_entities = MagicMock()
+        await sensor_module.async_setup_entry(MagicMock(), entry, add_entities)
+        return coordinator, add_entities, registry, connect.call_args.args[2]
+
+    async def test_known_circuits_and_plants_are_skipped(self, monkeypatch):
+        _, add_entities, registry, on_new_circuits = await self._setup(monkeypatch, _plant())
+        (entities,) = add_entities.call_args.args
+        plant_sensors = [e for e in entities if isinstance(e, HovalPlantSensor)]
+        assert len(plant_sensors) == len(PLANT_SENSOR_DESCRIPTIONS)
+        lookups = registry.async_get_entity_id.call_count
+
+        on_new_circuits()
+        add_entities.assert_called_once()
+        # The known circuit's descriptions are not walked again.
+        assert registry.async_get_entity_id.call_count == lookups
+
+    async def test_new_circuit_adds_only_its_sensors(self, monkeypatch):
+        plant = _plant()
+        coordinator, add_entities, _, on_new_circuits = await self._setup(monkeypatch, plant)
+        hk = HovalCircuitData(circuit_type="HK", path="1.2.4", name="Zone")
+        plant.circuits["1.2.4"] = hk
+
+        on_new_circuits()
+        (entities,) = add_entities.call_args.args
+        assert entities
+        assert all(isinstance(e, HovalCircuitSensor) for e in entities)
+        assert {e._circuit_path for e in entities} == {"1.2.4"}
+        assert len(entities) == sum(
+            d.circuit_types is None or "HK" in d.circuit_types for d in CIRCUIT_SENSOR_DESCRIPTIONS
+        )
+
+
+class TestEventConsumers:
+    def test_exactly_the_event_sensors_are_flagged(self):
+        quiet = _plant()
+        event = HovalEventData(
+            event_type="blocking",
+            description="Pump",
+            time_occurred="2024-01-08T10:00:00",
+            time_resolved=None,
+            source_path="1.2.3",
+            code=9,
+        )
+        eventful = _plant()
+        eventful.latest_event = event
+        eventful.events = [event]
+        for description in PLANT_SENSOR_DESCRIPTIONS:
+            reads_events = description.value_fn(quiet) != description.value_fn(eventful)
+            assert description.uses_events == reads_events, description.key
+
+    async def test_event_sensor_registers_while_added(self):
+        plant = _plant()
+        coordinator = _coordinator(plant)
+        by_events = {d.uses_events: d for d in PLANT_SENSOR_DESCRIPTIONS}
+
+        await HovalPlantSensor(coordinator, "p1", plant, by_events[False]).async_added_to_hass()
+        coordinator.async_add_event_consumer.assert_not_called()
+
+        sensor = HovalPlantSensor(coordinator, "p1", plant, by_events[True])
+        await sensor.async_added_to_hass()
+        coordinator.async_add_event_consumer.assert_called_once()
+        assert coordinator.async_add_event_consumer.return_value in sensor.on_remove
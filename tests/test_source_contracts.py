@@ -28,18 +28,30 @@ class TestClimateLiveValueKeys:
         assert '"targetTemperature"' in src
 
     def test_hvac_action_uses_status_key(self):
-        src = _read("climate.py")
-        assert 'live_values.get("status")' in src
+        # hvac_action reads the coordinator's normalised circuit_status, which
+        # is derived from the 'status' live value.
+        assert "circuit.circuit_status" in _read("climate.py")
+        assert 'live_values.get("status")' in _read("coordinator.py")
 
     def test_pending_temperature_survived_the_port(self):
         assert "_pending_temperature" in _read("climate.py")
 
+    def test_circuit_resolved_once_per_coordinator_update(self):
+        for module in ("climate.py", "fan.py", "select.py", "sensor.py", "water_heater.py"):
+            src = _read(module)
+            handler = src.split("def _handle_coordinator_update", 1)[1].split("\n    @", 1)[0]
+            assert "self._circuit = self._lookup_circuit()" in handler, module
+            # _circuit is a plain attribute now, not a per-read property lookup
+            assert "def _circuit(" not in src, module
+
 
 class TestConfigFlowHardening:
     def test_validation_has_outer_timeout(self):
         src = _read("config_flow.py")
         assert "asyncio.timeout(_VALIDATION_TIMEOUT_S)" in src
-        assert src.count("asyncio.timeout(_VALIDATION_TIMEOUT_S)") == 2  # user + reauth
+        # one shared probe, used by both the user and the reauth step
+        assert src.count("asyncio.timeout(_VALIDATION_TIMEOUT_S)") == 1
+        assert src.count("await _async_validate_credentials(") == 2
 
     def test_reauth_pins_account(self):
         assert "wrong_account" in _read("config_flow.py")
@@ -67,10 +79,10 @@ class TestSensorAdditions:
 
     def test_total_increasing_negative_guard(self):
         src = _read("sensor.py")
-        assert "if is_counter and num < 0" in src
+        assert "self._is_counter and num < 0" in src
         # Unit-less counters (operation cycles) must not escape through the
         # string branch before the guard.
-        assert "native_unit_of_measurement is None and not is_counter" in src
+        assert "native_unit_of_measurement is None and not self._is_counter" in src
 
     def test_new_keys_translated_everywhere(self):
         import json
@@ -132,3 +144,24 @@ class TestProgramSelect:
 
     def test_disambiguation_survived(self):
         assert 'f"{default} ({api_key})"' in _read("select.py")
+
+    def test_name_maps_rebuilt_only_on_change(self):
+        src = _read("select.py")
+        assert "if program_names == self._program_names:\n            return" in src
+        assert "return self._to_api.get(display, display)" in src
+
+    def test_options_cached_with_name_maps(self):
+        src = _read("select.py")
+        assert "self._attr_options = [self._to_display[key] for key in API_PROGRAMS]" in src
+        assert "def options(self)" not in src
+
+
+class TestLazyDebugLogging:
+    def test_raw_circuit_dump_guarded(self):
+        src = _read("coordinator.py")
+        assert "debug = _LOGGER.isEnabledFor(logging.DEBUG)" in src
+        assert "if debug:" in src
+
+    def test_update_failed_message_is_static(self):
+        src = _read("coordinator.py")
+        assert 'raise UpdateFailed("Error fetching Hoval data") from err' in src